@@ -32,6 +32,17 @@ from pathlib import Path
 IMAGE_QUALITY = 50
 # Коэффициент уменьшения изображения при изменении размера
 IMAGE_RESIZE_RATIO = 2
+# Сколько освобожденных блоков памяти растров (по умолчанию 16 МБ) Pillow держит для
+# повторного использования на каждый поток пакетной обработки изображений
+IMAGE_CACHED_BLOCKS_PER_WORKER = 4
+# Уровень сжатия zlib при сохранении PNG (0-9). Уровень 1 кодирует в разы быстрее
+# уровня по умолчанию (6) при небольшом увеличении размера файла
+PNG_COMPRESS_LEVEL = 1
+
+# Настройки фоновой обработки
+# ---------------------------
+# Количество потоков для анализа JSON-файлов в фоне интерфейса
+ANALYSIS_WORKERS = 4
 
 # Настройки директорий
 # -------------------
@@ -38,8 +38,10 @@
 
 import ctypes
 import logging
+import os
 import queue
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, Union
@@ -48,6 +50,7 @@ from pythonchik.core.application_state import ApplicationState, ApplicationState
 from pythonchik.errors.error_handlers import ErrorContext, ErrorSeverity
 from pythonchik.events.eventbus import EventBus
 from pythonchik.events.events import Event, EventType
+from pythonchik.utils.image import configure_image_block_cache
 from pythonchik.utils.metrics import MetricsCollector, count_calls, track_timing
 
 # Определение типа для функций задач
@@ -106,6 +109,7 @@ class ApplicationCore:
         _max_queue_size (int): Максимальный размер очереди задач.
         _logger (logging.Logger): Логгер для отладки и информационных сообщений.
         metrics (MetricsCollector): Коллектор метрик для мониторинга производительности.
+        image_executor (ThreadPoolExecutor): Общий пул потоков для обработки изображений.
 
     Note:
         Для взаимодействия с другими компонентами используется EventBus,
@@ -145,6 +149,13 @@ class ApplicationCore:
         # Событие для кооперативной остановки текущих задач
         self._stop_event = threading.Event()
 
+        # Общий пул для обработки изображений: потоки создаются по мере надобности
+        # и переиспользуются всеми пакетами за время жизни приложения
+        image_workers = os.cpu_count() or 1
+        self.image_executor = ThreadPoolExecutor(max_workers=image_workers, thread_name_prefix="img")
+        # Кэш памяти растров Pillow - глобальная настройка, задается один раз под размер пула
+        configure_image_block_cache(image_workers)
+
         self.state_manager = ApplicationStateManager(event_bus)
         self.logger.info("ApplicationCore инициализирован.")
 
@@ -280,6 +291,23 @@ class ApplicationCore:
         if self.state_manager.state == ApplicationState.IDLE:
             self.state_manager.update_state(ApplicationState.PROCESSING)
 
+    def submit_image_task(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Запускает функцию обработки изображений в общем пуле потоков.
+
+        Args:
+            fn: Функция обработки (например, ImageProcessor.resize_image).
+            *args: Позиционные аргументы функции.
+            **kwargs: Именованные аргументы функции.
+
+        Returns:
+            Future с результатом выполнения функции.
+
+        Examples:
+            >>> future = app_core.submit_image_task(ImageProcessor.resize_image, "photo.jpg", "out/")
+            >>> future.result()
+        """
+        return self.image_executor.submit(fn, *args, **kwargs)
+
     def _process_tasks(self) -> None:
         """Фоновая обработка задач из очереди.
 
@@ -29,14 +29,14 @@
 
 import logging
 import threading
-from enum import Enum
-from typing import List, Optional
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
 
 from pythonchik.events.eventbus import EventBus
 from pythonchik.events.events import Event, EventType
 
 
-class ApplicationState(Enum):
+class ApplicationState(IntEnum):
     """Перечисление всех возможных состояний приложения.
 
     Определяет все состояния, в которых может находиться приложение в процессе
@@ -58,16 +58,34 @@ class ApplicationState(Enum):
         ...     print("Приложение находится в состоянии ошибки")
         ... elif state_manager.state == ApplicationState.PROCESSING:
         ...     print("Идет обработка данных")
+
+    Note:
+        Состояния опрашиваются на каждом кадре UI, поэтому перечисление
+        целочисленное: сравнение сводится к сравнению int на уровне C.
+        Строковые имена состояний доступны через STATE_NAMES.
     """
 
-    INITIALIZING = "initializing"
-    IDLE = "idle"
-    PROCESSING = "processing"
-    WAITING = "waiting"
-    ERROR = "error"
-    READY = "ready"
-    PAUSED = "paused"
-    SHUTTING_DOWN = "shutting_down"
+    INITIALIZING = 0
+    IDLE = 1
+    PROCESSING = 2
+    WAITING = 3
+    ERROR = 4
+    READY = 5
+    PAUSED = 6
+    SHUTTING_DOWN = 7
+
+
+# Строковые имена состояний (прежние значения перечисления)
+STATE_NAMES: Dict[ApplicationState, str] = {
+    ApplicationState.INITIALIZING: "initializing",
+    ApplicationState.IDLE: "idle",
+    ApplicationState.PROCESSING: "processing",
+    ApplicationState.WAITING: "waiting",
+    ApplicationState.ERROR: "error",
+    ApplicationState.READY: "ready",
+    ApplicationState.PAUSED: "paused",
+    ApplicationState.SHUTTING_DOWN: "shutting_down",
+}
 
 
 class ApplicationStateManager:
@@ -82,18 +100,20 @@ class ApplicationStateManager:
 
     Attributes:
         _state (ApplicationState): Текущее состояние приложения.
-        _state_history (List[ApplicationState]): История изменений состояния.
-        _state_lock (threading.RLock): Блокировка для потокобезопасного доступа.
+        _state_history (List[ApplicationState]): История изменений состояния
+            (заполняется только при record_history=True).
+        _state_lock (threading.RLock): Блокировка, сериализующая запись состояния.
         _event_bus (EventBus): Шина событий для публикации изменений.
         _logger (logging.Logger): Логгер для отладочных сообщений.
 
     Note:
-        - Потокобезопасность обеспечивается через `_state_lock`.
+        - Запись состояния сериализуется через `_state_lock`; чтение выполняется
+          без блокировки, так как присваивание ссылки в CPython атомарно.
         - Блокировка _state_lock не удерживается во время публикации событий,
           чтобы избежать взаимных блокировок (deadlocks).
     """
 
-    def __init__(self, event_bus: EventBus) -> None:
+    def __init__(self, event_bus: EventBus, record_history: bool = False) -> None:
         """Инициализирует менеджер состояния приложения.
 
         Создает экземпляр менеджера с начальным состоянием INITIALIZING,
@@ -101,23 +121,32 @@ class ApplicationStateManager:
 
         Args:
             event_bus: Экземпляр шины событий для публикации изменений состояния.
+            record_history: Сохранять ли историю переходов. По умолчанию выключено,
+                так как при частой смене PROCESSING/IDLE история растет без
+                потребителей.
 
         Examples:
             >>> event_bus = EventBus()
             >>> state_manager = ApplicationStateManager(event_bus)
         """
         self._state = ApplicationState.INITIALIZING
-        self._state_history = [self._state]  # Храним историю состояний
-        self._state_lock = threading.RLock()  # Блокировка для потокобезопасности
+        self._record_history = record_history
+        self._state_history: List[ApplicationState] = [self._state] if record_history else []
+        self._state_lock = threading.RLock()  # Блокировка только для записи состояния
         self._event_bus = event_bus
         self._logger = logging.getLogger("pythonchik.state")
-        self._logger.info(f"ApplicationStateManager инициализирован: {self._state.value}")
+        # Связанные методы кэшируются, чтобы не искать их на каждом update_state
+        self._publish = event_bus.publish
+        self._debug = self._logger.debug
+        self._logger.info(f"ApplicationStateManager инициализирован: {STATE_NAMES[self._state]}")
 
     @property
     def state(self) -> ApplicationState:
         """Возвращает текущее состояние приложения.
 
-        Предоставляет потокобезопасный доступ к текущему состоянию приложения.
+        Чтение выполняется без блокировки: состояние публикуется одним
+        присваиванием ссылки в `update_state`, поэтому читатель всегда видит
+        либо старое, либо новое значение целиком.
 
         Returns:
             Текущее состояние приложения из перечисления ApplicationState.
@@ -127,14 +156,23 @@ class ApplicationStateManager:
             >>> if current_state == ApplicationState.ERROR:
             ...     # Обработка ошибки
         """
-        with self._state_lock:
-            return self._state
+        return self._state
+
+    @property
+    def state_history(self) -> Tuple[ApplicationState, ...]:
+        """Возвращает историю переходов состояния.
+
+        Returns:
+            Кортеж состояний в порядке смены. Пустой, если менеджер создан
+            без record_history=True.
+        """
+        return tuple(self._state_history)
 
     def update_state(self, new_state: ApplicationState) -> None:
         """Обновляет состояние приложения и публикует событие об изменении.
 
         Потокобезопасно изменяет состояние приложения на указанное,
-        добавляет его в историю и публикует событие STATE_CHANGED через
+        добавляет его в историю (если она включена) и публикует событие STATE_CHANGED через
         EventBus для оповещения всех компонентов.
 
         Args:
@@ -151,20 +189,21 @@ class ApplicationStateManager:
             >>> # Возврат в состояние ожидания после решения проблемы
             >>> state_manager.update_state(ApplicationState.IDLE)
         """
-        if not isinstance(new_state, ApplicationState):
+        # Быстрая проверка точного типа; isinstance — запасной путь для подклассов
+        if type(new_state) is not ApplicationState and not isinstance(new_state, ApplicationState):
             raise ValueError(f"Invalid state: {new_state}. Must be an ApplicationState enum value.")
 
-        if new_state == self._state:
-            return
-
-        # 1) Меняем состояние под локом
+        # 1) Меняем состояние под локом (сериализуем конкурирующих писателей)
         with self._state_lock:
             old_state = self._state
+            if new_state == old_state:
+                return
             self._logger.info(f"Смена состояния: {old_state.name} -> {new_state.name}")
             self._state = new_state
-            self._state_history.append(self._state)
+            if self._record_history:
+                self._state_history.append(new_state)
 
         # 2) Вызываем publish() уже без лока
         event_data = {"old_state": old_state, "new_state": new_state}
-        self._logger.debug(f"Публикую STATE_CHANGED, old={old_state}, new={new_state}")
-        self._event_bus.publish(Event(EventType.STATE_CHANGED, data=event_data))
+        self._debug("Публикую STATE_CHANGED, old=%s, new=%s", old_state, new_state)
+        self._publish(Event(EventType.STATE_CHANGED, data=event_data))
@@ -39,7 +39,7 @@
     ...     error_handler.handle_error(context)
 """
 
-from pythonchik.errors.error_context import ErrorContext, ErrorSeverity
+from pythonchik.errors.error_context import SEVERITY_TO_LOG_LEVEL, ErrorContext, ErrorSeverity
 from pythonchik.errors.error_handlers import (
     AppError,
     DataProcessingError,
@@ -62,6 +62,7 @@ __all__ = [
     "TaskOperationError",
     "ErrorContext",
     "ErrorSeverity",
+    "SEVERITY_TO_LOG_LEVEL",
     "UIErrorHandler",
     "FileProcessingErrorHandler",
     "ImageProcessingErrorHandler",
@@ -8,6 +8,7 @@
 Основные компоненты:
 - ErrorSeverity: Перечисление уровней серьезности ошибок
 - ErrorContext: Класс для хранения контекстной информации об ошибке
+- SEVERITY_TO_LOG_LEVEL: Соответствие уровней серьезности уровням модуля logging
 
 Примеры использования:
     >>> from pythonchik.errors.error_context import ErrorContext, ErrorSeverity
@@ -34,9 +35,13 @@
     ...     error_handler.handle_error(context)
 """
 
+import logging
+import sys
+import types
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Final, Optional
 
 
 class ErrorSeverity(Enum):
@@ -64,6 +69,18 @@ class ErrorSeverity(Enum):
     CRITICAL = "CRITICAL"
 
 
+# Уровень logging для каждого уровня серьезности; вычисляется один раз при импорте,
+# чтобы обработчики делали один поиск в словаре вместо цепочки if/elif.
+SEVERITY_TO_LOG_LEVEL: Final[Mapping[ErrorSeverity, int]] = types.MappingProxyType(
+    {
+        ErrorSeverity.INFO: logging.INFO,
+        ErrorSeverity.WARNING: logging.WARNING,
+        ErrorSeverity.ERROR: logging.ERROR,
+        ErrorSeverity.CRITICAL: logging.CRITICAL,
+    }
+)
+
+
 @dataclass
 class ErrorContext:
     """Контекст ошибки для детализированного логирования и обработки.
@@ -74,7 +91,8 @@ class ErrorContext:
 
     Attributes:
         operation: Название операции, во время которой произошла ошибка
-        details: Словарь с дополнительными деталями об ошибке (имя файла, ID записи и т.д.)
+        details: Дополнительные детали об ошибке (имя файла, ID записи и т.д.).
+            Хранятся как неизменяемое представление копии переданного словаря
         severity: Уровень серьезности ошибки из перечисления ErrorSeverity
         recovery_action: Опциональные инструкции для восстановления после ошибки
 
@@ -87,9 +105,24 @@ class ErrorContext:
         ... )
         >>> print(f"Ошибка в операции {context.operation}")
         >>> print(f"Уровень серьезности: {context.severity.value}")
+
+    Note:
+        Детали нельзя изменить после создания контекста, поэтому сообщение
+        AppError безопасно кэшируется. Чтобы дополнить детали, создайте новый
+        контекст через dataclasses.replace(context, details={...}).
     """
 
     operation: str
-    details: Dict[str, Any]
+    details: Mapping[str, Any]
     severity: ErrorSeverity
     recovery_action: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Интернирует название операции и замораживает детали.
+
+        Названия операций повторяются в тысячах контекстов, поэтому они
+        интернируются: одинаковые названия разделяют один объект строки.
+        """
+        if type(self.operation) is str:
+            self.operation = sys.intern(self.operation)
+        self.details = types.MappingProxyType(dict(self.details))
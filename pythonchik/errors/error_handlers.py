@@ -25,13 +25,33 @@
     ...     # дальнейшая обработка error
 """
 
+import dataclasses
 import logging
+import types
+from collections.abc import Mapping
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
-from pythonchik.errors.error_context import ErrorContext, ErrorSeverity
+from pythonchik.errors.error_context import SEVERITY_TO_LOG_LEVEL, ErrorContext, ErrorSeverity
 
 logger = logging.getLogger(__name__)
 
+# Стандартные действия восстановления по классу исключения
+_RECOVERY_BY_TYPE: Mapping[Type[BaseException], str] = types.MappingProxyType(
+    {
+        FileNotFoundError: "Проверьте существование файла и его путь",
+        PermissionError: "Проверьте права доступа к файлу или директории",
+        ValueError: "Проверьте корректность введённых данных",
+        TypeError: "Проверьте типы передаваемых данных",
+        KeyError: "Проверьте наличие требуемого ключа в данных",
+        IndexError: "Проверьте границы массива или списка",
+        ZeroDivisionError: "Проверьте деление на ноль",
+        AttributeError: "Проверьте наличие требуемого атрибута",
+        ImportError: "Проверьте наличие требуемого модуля",
+        RuntimeError: "Произошла ошибка выполнения, проверьте логи",
+    }
+)
+_DEFAULT_RECOVERY_ACTION = "Обратитесь к документации или администратору"
+
 
 class AppError(Exception):
     """Базовый класс для всех ошибок приложения.
@@ -43,8 +63,15 @@ class AppError(Exception):
         message (str): Описание ошибки.
         context (Optional[ErrorContext]): Контекст ошибки (операция, детали, уровень серьезности).
         original_error (Optional[Exception]): Исходное исключение, если обёрнуто.
+        _formatted (Optional[str]): Кэш результата format_message.
+
+    Note:
+        Атрибуты хранятся в слотах: словарь экземпляра у BaseException
+        создается лениво и для ошибок приложения так и остается пустым.
     """
 
+    __slots__ = ("message", "context", "original_error", "_formatted")
+
     def __init__(
         self,
         message: str,
@@ -71,13 +98,20 @@ class AppError(Exception):
         self.message = message
         self.context = context
         self.original_error = original_error
-        super().__init__(self.format_message())
+        self._formatted: Optional[str] = None
+        # Полное сообщение собирается лениво в __str__, только когда оно нужно
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        """Возвращает отформатированное сообщение об ошибке с контекстом."""
+        return self.format_message()
 
     def format_message(self) -> str:
         """Форматирует сообщение об ошибке в стандартизированном виде.
 
         Включает информацию о серьезности, операции, контексте и
         рекомендованном действии для восстановления, если они доступны.
+        Результат вычисляется один раз и кэшируется в `_formatted`.
 
         Returns:
             Итоговое сообщение об ошибке с контекстом.
@@ -95,19 +129,48 @@ class AppError(Exception):
             [ERROR] file_read: Файл не найден
             Рекомендуемое действие: Проверьте путь к файлу
         """
-        if not self.context:
-            return self.message
+        if self._formatted is not None:
+            return self._formatted
+
+        context = self.context
+        if not context:
+            self._formatted = self.message
+            return self._formatted
 
-        base_msg = f"[{self.context.severity.value}] {self.context.operation}: {self.message}"
+        parts = [f"[{context.severity.value}] {context.operation}: {self.message}"]
 
         # Add context details if present
-        if self.context.details:
-            details_str = ", ".join(f"{k}: {v}" for k, v in self.context.details.items())
-            base_msg += f"\nContext: {details_str}"
+        details = context.details
+        if details:
+            parts.append("Context: " + ", ".join([f"{k}: {v}" for k, v in details.items()]))
+
+        if context.recovery_action:
+            parts.append("Рекомендуемое действие: " + context.recovery_action)
+        self._formatted = "\n".join(parts)
+        return self._formatted
 
-        if self.context.recovery_action:
-            base_msg += f"\nРекомендуемое действие: {self.context.recovery_action}"
-        return base_msg
+    def to_record(self) -> Dict[str, Any]:
+        """Возвращает ошибку в виде структурированной записи для логирования.
+
+        В отличие от format_message, поля не склеиваются в строку, поэтому
+        JSON-форматтер передает их в лог как есть, без повторного разбора.
+
+        Returns:
+            Словарь с ключами severity, operation, message, details и recovery.
+
+        Examples:
+            >>> error = AppError("Файл не найден", ErrorContext("file_read", {}, ErrorSeverity.ERROR))
+            >>> error.to_record()["operation"]
+            'file_read'
+        """
+        context = self.context
+        return {
+            "severity": context.severity.value if context else None,
+            "operation": context.operation if context else None,
+            "message": self.message,
+            "details": dict(context.details) if context else {},
+            "recovery": context.recovery_action if context else None,
+        }
 
 
 class FileOperationError(AppError):
@@ -128,6 +191,13 @@ class FileOperationError(AppError):
         ...     raise FileOperationError("Файл не найден", "/path/to/file.txt", "Чтение файла")
     """
 
+    __slots__ = ()
+
+    # Неизменяемые параметры контекста, общие для всех экземпляров
+    _SEVERITY = ErrorSeverity.ERROR
+    _RECOVERY = "Проверьте права доступа и существование файла"
+    _ERROR_TYPE = "FileOperationError"
+
     def __init__(self, message: str, path: str, operation: str = "Операция с файлом") -> None:
         """Инициализирует ошибку файловой операции.
 
@@ -138,9 +208,9 @@ class FileOperationError(AppError):
         """
         context = ErrorContext(
             operation=operation,
-            details={"path": path, "error_type": "FileOperationError"},
-            severity=ErrorSeverity.ERROR,
-            recovery_action="Проверьте права доступа и существование файла",
+            details={"path": path, "error_type": self._ERROR_TYPE},
+            severity=self._SEVERITY,
+            recovery_action=self._RECOVERY,
         )
         super().__init__(message, context)
 
@@ -162,6 +232,12 @@ class TaskOperationError(AppError):
         ...     raise TaskOperationError("Ошибка выполнения", "task-123", "Обработка данных")
     """
 
+    __slots__ = ()
+
+    _SEVERITY = ErrorSeverity.ERROR
+    _RECOVERY = "Проверьте параметры задачи и повторите попытку"
+    _ERROR_TYPE = "TaskOperationError"
+
     def __init__(self, message: str, task_id: str, operation: str = "Выполнение задачи") -> None:
         """Инициализирует ошибку операции с задачей.
 
@@ -172,9 +248,9 @@ class TaskOperationError(AppError):
         """
         context = ErrorContext(
             operation=operation,
-            details={"task_id": task_id, "error_type": "TaskOperationError"},
-            severity=ErrorSeverity.ERROR,
-            recovery_action="Проверьте параметры задачи и повторите попытку",
+            details={"task_id": task_id, "error_type": self._ERROR_TYPE},
+            severity=self._SEVERITY,
+            recovery_action=self._RECOVERY,
         )
         super().__init__(message, context)
 
@@ -188,6 +264,12 @@ class ImageProcessingError(AppError):
     - Применения фильтров
     """
 
+    __slots__ = ()
+
+    _SEVERITY = ErrorSeverity.ERROR
+    _RECOVERY = "Проверьте формат и целостность изображения"
+    _ERROR_TYPE = "ImageProcessingError"
+
     def __init__(self, message: str, image_path: str, operation: str = "Обработка изображения") -> None:
         """
         Args:
@@ -197,9 +279,9 @@ class ImageProcessingError(AppError):
         """
         context = ErrorContext(
             operation=operation,
-            details={"image_path": image_path, "error_type": "ImageProcessingError"},
-            severity=ErrorSeverity.ERROR,
-            recovery_action="Проверьте формат и целостность изображения",
+            details={"image_path": image_path, "error_type": self._ERROR_TYPE},
+            severity=self._SEVERITY,
+            recovery_action=self._RECOVERY,
         )
         super().__init__(message, context)
 
@@ -213,6 +295,12 @@ class DataProcessingError(AppError):
     - Преобразования форматов
     """
 
+    __slots__ = ()
+
+    _SEVERITY = ErrorSeverity.ERROR
+    _RECOVERY = "Проверьте формат и структуру данных"
+    _ERROR_TYPE = "DataProcessingError"
+
     def __init__(self, message: str, data_type: str, operation: str = "Обработка данных") -> None:
         """
         Args:
@@ -222,9 +310,9 @@ class DataProcessingError(AppError):
         """
         context = ErrorContext(
             operation=operation,
-            details={"data_type": data_type, "error_type": "DataProcessingError"},
-            severity=ErrorSeverity.ERROR,
-            recovery_action="Проверьте формат и структуру данных",
+            details={"data_type": data_type, "error_type": self._ERROR_TYPE},
+            severity=self._SEVERITY,
+            recovery_action=self._RECOVERY,
         )
         super().__init__(message, context)
 
@@ -234,27 +322,26 @@ class ErrorHandler:
 
     Предоставляет методы для обработки различных типов ошибок
     и их логирования в стандартизированном формате.
-    """
 
-    @staticmethod
-    def _default_log_callback(msg: str, severity: str) -> None:
-        """Колбэк логирования по умолчанию (использует стандартный logger).
+    Attributes:
+        logger (logging.Logger): Логгер, в который пишется запись об ошибке.
+        component (Optional[str]): Компонент приложения, передается в extra записи.
+        log_traceback (bool): Прикладывать ли трассировку исходного исключения.
+    """
 
-        Args:
-            msg (str): Сообщение для логирования.
-            severity (str): Уровень серьезности (DEBUG, INFO, WARNING, ERROR...).
-        """
-        # Можно использовать logger по уровню severity:
-        # Или просто logger.error(msg) — упрощённый вариант
-        logger.error(f"[{severity}] {msg}")
+    logger = logging.getLogger(__name__)
+    component: Optional[str] = None
+    log_traceback = False
 
     def __init__(self, log_callback: Optional[Callable[[str, str], None]] = None) -> None:
         """
         Args:
-            log_callback: Функция, принимающая (message, severity)
-                по умолчанию выводит через logger.error.
+            log_callback: Функция, принимающая (message, severity). По умолчанию
+                ошибка пишется одной записью в self.logger с уровнем,
+                соответствующим severity, а поля ошибки (AppError.to_record)
+                передаются в extra_fields.
         """
-        self.log_callback = log_callback if log_callback else self._default_log_callback
+        self.log_callback = log_callback
 
     def handle_error(
         self,
@@ -263,6 +350,7 @@ class ErrorHandler:
         severity: ErrorSeverity = ErrorSeverity.ERROR,
         recovery_action: Optional[str] = None,
         additional_context: Optional[Dict[str, Any]] = None,
+        **context_kwargs: Any,
     ) -> None:
         """Обрабатывает ошибку и логирует её в стандартизированном формате.
 
@@ -272,6 +360,9 @@ class ErrorHandler:
             severity (ErrorSeverity): Уровень серьезности ошибки (по умолчанию ERROR).
             recovery_action (Optional[str]): Рекомендуемое действие для восстановления.
             additional_context (Optional[Dict[str, Any]]): Дополнительные детали для логирования.
+            **context_kwargs: Дополнительные детали в виде именованных аргументов.
+                Позволяют не собирать словарь на стороне вызывающего кода;
+                детали объединяются, только если запись действительно будет залогирована.
 
         Пример использования:
             try:
@@ -282,17 +373,28 @@ class ErrorHandler:
                     'Чтение файла',
                     ErrorSeverity.ERROR,
                     'Проверьте существование файла',
-                    {'file_path': 'example.txt', 'attempt': 1}
+                    file_path='example.txt',
+                    attempt=1,
                 )
         """
+        log_callback = self.log_callback
+        if log_callback is None:
+            # Логгер всё равно отбросит запись — не собираем ни контекст, ни сообщение
+            level = SEVERITY_TO_LOG_LEVEL[severity]
+            if not self.logger.isEnabledFor(level):
+                return
+
         details = {"error_type": type(error).__name__}
         if additional_context:
             details.update(additional_context)
+        if context_kwargs:
+            details.update(context_kwargs)
 
         if isinstance(error, AppError) and error.context:
-            # Если это AppError со своим контекстом — дополним его
-            error.context.details.update(details)
-            app_error = error
+            # Если это AppError со своим контекстом — дополним копию контекста,
+            # не изменяя само исключение (повторная обработка не накапливает детали)
+            context = dataclasses.replace(error.context, details={**error.context.details, **details})
+            app_error = AppError(error.message, context, error.original_error)
         else:
             # Иначе создаём новый AppError, оборачивая исходную ошибку
             context = ErrorContext(
@@ -303,8 +405,27 @@ class ErrorHandler:
             )
             app_error = AppError(str(error), context, error)
 
-        # Логируем через заданный колбэк
-        self.log_callback(app_error.format_message(), severity.value)
+        if log_callback is not None:
+            # Логируем через заданный колбэк
+            log_callback(app_error.format_message(), severity.value)
+            return
+
+        # Трассировку передаем готовым кортежем: logging не вызывает sys.exc_info(),
+        # а сам обход стека происходит только в форматтере, если запись дойдет до него
+        exc_info = (type(error), error, error.__traceback__) if self.log_traceback else None
+
+        # Одна структурированная запись на ошибку: в тексте только заголовок,
+        # детали и рекомендация передаются полями в extra_fields
+        record = app_error.to_record()
+        self.logger.log(
+            level,
+            "[%s] %s: %s",
+            severity.value,
+            record["operation"],
+            record["message"],
+            exc_info=exc_info,
+            extra={"component": self.component, "operation": operation, "extra_fields": record},
+        )
 
     def _get_default_recovery_action(self, error: Exception) -> str:
         """Возвращает стандартное действие восстановления на основе типа ошибки.
@@ -312,23 +433,21 @@ class ErrorHandler:
         Args:
             error (Exception): Исходная ошибка.
 
+        Сначала ищется точный класс ошибки, затем её базовые классы по MRO,
+        так что, например, json.JSONDecodeError получает действие для ValueError.
+
         Returns:
             str: Рекомендуемое действие для восстановления.
         """
-        error_type = type(error).__name__
-        recovery_actions = {
-            "FileNotFoundError": "Проверьте существование файла и его путь",
-            "PermissionError": "Проверьте права доступа к файлу или директории",
-            "ValueError": "Проверьте корректность введённых данных",
-            "TypeError": "Проверьте типы передаваемых данных",
-            "KeyError": "Проверьте наличие требуемого ключа в данных",
-            "IndexError": "Проверьте границы массива или списка",
-            "ZeroDivisionError": "Проверьте деление на ноль",
-            "AttributeError": "Проверьте наличие требуемого атрибута",
-            "ImportError": "Проверьте наличие требуемого модуля",
-            "RuntimeError": "Произошла ошибка выполнения, проверьте логи",
-        }
-        return recovery_actions.get(error_type, "Обратитесь к документации или администратору")
+        error_type = type(error)
+        action = _RECOVERY_BY_TYPE.get(error_type)
+        if action is not None:
+            return action
+        for base in error_type.__mro__[1:]:
+            action = _RECOVERY_BY_TYPE.get(base)
+            if action is not None:
+                return action
+        return _DEFAULT_RECOVERY_ACTION
 
 
 # Специализированные обработчики ошибок
@@ -337,128 +456,30 @@ class ErrorHandler:
 class UIErrorHandler(ErrorHandler):
     """Обработчик ошибок для компонентов пользовательского интерфейса."""
 
-    def __init__(self, log_callback: Optional[Callable[[str, str], None]] = None) -> None:
-        """
-        Args:
-            log_callback: Функция логирования, принимающая (message, severity)
-        """
-        super().__init__(log_callback)
-        self.logger = logging.getLogger(__name__ + ".UIErrorHandler")
-
-    def handle_error(
-        self,
-        error: Exception,
-        operation: str,
-        severity: ErrorSeverity = ErrorSeverity.ERROR,
-        recovery_action: Optional[str] = None,
-        additional_context: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Обрабатывает ошибку в UI-компоненте.
-
-        Логирует ошибку и, возможно, отображает сообщение пользователю.
-
-        Args:
-            error: Исключение для обработки
-            operation: Название операции, при которой произошла ошибка
-            severity: Уровень серьезности ошибки
-            recovery_action: Рекомендуемое действие для восстановления
-            additional_context: Дополнительные детали для логирования
-        """
-        self.logger.error(f"UI ошибка в операции '{operation}': {error}", exc_info=True)
-        super().handle_error(error, operation, severity, recovery_action, additional_context)
+    logger = logging.getLogger(__name__ + ".UIErrorHandler")
+    component = "UI"
+    log_traceback = True
 
 
 class FileProcessingErrorHandler(ErrorHandler):
     """Обработчик ошибок для файловых операций."""
 
-    def __init__(self, log_callback: Optional[Callable[[str, str], None]] = None) -> None:
-        """
-        Args:
-            log_callback: Функция логирования, принимающая (message, severity)
-        """
-        super().__init__(log_callback)
-        self.logger = logging.getLogger(__name__ + ".FileProcessingErrorHandler")
-
-    def handle_error(
-        self,
-        error: Exception,
-        operation: str,
-        severity: ErrorSeverity = ErrorSeverity.ERROR,
-        recovery_action: Optional[str] = None,
-        additional_context: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Обрабатывает ошибку при файловых операциях.
-
-        Args:
-            error: Исключение для обработки
-            operation: Название операции, при которой произошла ошибка
-            severity: Уровень серьезности ошибки
-            recovery_action: Рекомендуемое действие для восстановления
-            additional_context: Дополнительные детали для логирования
-        """
-        self.logger.error(f"Ошибка файловой операции '{operation}': {error}", exc_info=True)
-        super().handle_error(error, operation, severity, recovery_action, additional_context)
+    logger = logging.getLogger(__name__ + ".FileProcessingErrorHandler")
+    component = "Files"
+    log_traceback = True
 
 
 class ImageProcessingErrorHandler(ErrorHandler):
     """Обработчик ошибок для операций с изображениями."""
 
-    def __init__(self, log_callback: Optional[Callable[[str, str], None]] = None) -> None:
-        """
-        Args:
-            log_callback: Функция логирования, принимающая (message, severity)
-        """
-        super().__init__(log_callback)
-        self.logger = logging.getLogger(__name__ + ".ImageProcessingErrorHandler")
-
-    def handle_error(
-        self,
-        error: Exception,
-        operation: str,
-        severity: ErrorSeverity = ErrorSeverity.ERROR,
-        recovery_action: Optional[str] = None,
-        additional_context: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Обрабатывает ошибку при обработке изображений.
-
-        Args:
-            error: Исключение для обработки
-            operation: Название операции, при которой произошла ошибка
-            severity: Уровень серьезности ошибки
-            recovery_action: Рекомендуемое действие для восстановления
-            additional_context: Дополнительные детали для логирования
-        """
-        self.logger.error(f"Ошибка обработки изображения '{operation}': {error}", exc_info=True)
-        super().handle_error(error, operation, severity, recovery_action, additional_context)
+    logger = logging.getLogger(__name__ + ".ImageProcessingErrorHandler")
+    component = "Images"
+    log_traceback = True
 
 
 class DataProcessingErrorHandler(ErrorHandler):
     """Обработчик ошибок для операций с данными."""
 
-    def __init__(self, log_callback: Optional[Callable[[str, str], None]] = None) -> None:
-        """
-        Args:
-            log_callback: Функция логирования, принимающая (message, severity)
-        """
-        super().__init__(log_callback)
-        self.logger = logging.getLogger(__name__ + ".DataProcessingErrorHandler")
-
-    def handle_error(
-        self,
-        error: Exception,
-        operation: str,
-        severity: ErrorSeverity = ErrorSeverity.ERROR,
-        recovery_action: Optional[str] = None,
-        additional_context: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Обрабатывает ошибку при обработке данных.
-
-        Args:
-            error: Исключение для обработки
-            operation: Название операции, при которой произошла ошибка
-            severity: Уровень серьезности ошибки
-            recovery_action: Рекомендуемое действие для восстановления
-            additional_context: Дополнительные детали для логирования
-        """
-        self.logger.error(f"Ошибка обработки данных '{operation}': {error}", exc_info=True)
-        super().handle_error(error, operation, severity, recovery_action, additional_context)
+    logger = logging.getLogger(__name__ + ".DataProcessingErrorHandler")
+    component = "Data"
+    log_traceback = True
@@ -8,7 +8,7 @@
 - EventBus: Центральная шина событий, обеспечивающая публикацию и подписку на события
 - Event: Базовый класс события с типом, данными, источником и временной меткой
 - EventType: Перечисление типов событий, сгруппированных по категориям
-- EventHandler: Абстрактный базовый класс для обработчиков событий
+- EventHandler: Протокол обработчиков событий (объект с методом handle)
 - EventHandlerFunction: Функциональный обработчик событий
 
 Категории событий:
@@ -6,13 +6,14 @@
 
 Возможности:
 - Потокобезопасная подписка/отписка на события
-- Приоритезация обработки событий через очередь с приоритетами
+- Вызов обработчиков в порядке подписки
 - Обработчики вызываются вне блокировок, снижая риск дедлоков
 - Возможность глобальной обработки ошибок
 - Подробное логирование операций и ошибок
 
 Классы:
 - EventBus: Центральный компонент для управления событиями
+- QueuedEventBus: Шина с отложенной доставкой событий в порядке приоритета
 - EventHandlerWrapper: Обертка для безопасного вызова обработчиков
 
 Примеры:
@@ -42,33 +43,43 @@
     >>> event_bus.set_error_handler(global_error_handler)
 """
 
+import heapq
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import wraps
-from queue import PriorityQueue
-from threading import Lock
-from time import time
-from typing import Any, Callable, Dict, Generic, List, Optional, Set, Tuple, TypeVar
+from queue import SimpleQueue
+from typing import Any, Callable, DefaultDict, Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
 
 from pythonchik.events.events import Event, EventType
 from pythonchik.events.handlers import EventHandler
+from pythonchik.events.rw_lock import RWLock
 
 logger = logging.getLogger(__name__)
 
 
 class EventBus:
-    """Центральный компонент управления событиями с приоритетной очередью.
+    """Центральный компонент управления событиями.
 
     Реализует паттерн "Шина событий" (Event Bus) для слабого связывания
     компонентов системы. Обеспечивает механизм публикации событий и
-    подписки на них с соблюдением приоритетов обработки.
+    подписки на них. Обработчики вызываются напрямую в порядке подписки,
+    приоритет типа события на порядок доставки не влияет. Доставку
+    накопленных событий по приоритету обеспечивает QueuedEventBus.
 
     Attributes:
         _subscribers (Dict): Словарь подписчиков по типам событий.
-        _handlers_lock (Lock): Блокировка для потокобезопасных операций с подписчиками.
+        _snapshots (Dict): Неизменяемые снимки целей обработчиков по типам событий,
+            которые publish читает без блокировки.
+        _handlers_lock (RWLock): Блокировка подписчиков: чтения выполняются параллельно,
+            подписка и отписка получают исключительный доступ.
         _error_handler (Callable): Функция для централизованной обработки ошибок.
+        _dispatch_queue (Optional[SimpleQueue]): Очередь асинхронной доставки,
+            None в синхронном режиме.
+        _dispatch_thread (Optional[threading.Thread]): Рабочий поток асинхронной доставки.
 
     Note:
         Класс реализован как синглтон, чтобы обеспечить один экземпляр
@@ -76,32 +87,63 @@ class EventBus:
     """
 
     _instance = None
+    # Защищает создание синглтона при одновременном первом обращении из нескольких потоков
+    _instance_lock = threading.Lock()
 
-    def __new__(cls):
+    def __new__(cls, async_dispatch: bool = False):
         """Реализует паттерн Синглтон для шины событий.
 
+        Экземпляр создается и инициализируется один раз под блокировкой
+        (двойная проверка), поэтому одновременный первый вызов EventBus() из
+        разных потоков не создает две шины. Последующие вызовы только
+        возвращают готовый экземпляр: __init__ у класса нет.
+
+        Args:
+            async_dispatch: Если True, включает асинхронную доставку событий
+                (см. start_async_dispatch). Значение False режим не выключает:
+                шина общая, и обычный вызов EventBus() не должен менять ее режим.
+
         Returns:
             EventBus: Единственный экземпляр класса EventBus.
         """
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._setup()
+                    cls._instance = instance
+                    logger.debug("%s инициализирована", cls.__name__)
+        if async_dispatch:
+            cls._instance.start_async_dispatch()
         return cls._instance
 
-    def __init__(self):
-        """Инициализирует шину событий при первом создании экземпляра."""
-        # Инициализируем только один раз
-        if not hasattr(self, "_initialized"):
-            self._subscribers: Dict[EventType, List[EventHandler]] = {}
-            self._handlers_lock = Lock()
-            self._error_handler = None
-            self._initialized = True
-            logger.debug("EventBus инициализирована")
+    def _setup(self) -> None:
+        """Инициализирует состояние шины; вызывается один раз из __new__.
+
+        Подклассы расширяют этот метод, чтобы добавить собственное состояние.
+        """
+        # Для каждого типа события: обработчик -> вызываемая цель. Словарь сохраняет
+        # порядок подписки и дает проверку наличия за O(1) вместо линейного поиска.
+        # Нехешируемые обработчики хранятся под ключом _UnhashableHandler
+        self._subscribers: DefaultDict[EventType, Dict[Any, Callable[[Event], None]]]
+        self._subscribers = defaultdict(dict)
+        # Копия при записи: писатели подменяют словарь целиком, поэтому publish
+        # берет кортеж обработчиков одной ссылкой, без блокировки и копирования
+        self._snapshots: Dict[EventType, Tuple[Callable[[Event], None], ...]] = {}
+        self._handlers_lock = RWLock()
+        self._error_handler = None
+        # Очередь и поток асинхронной доставки; None - синхронный режим
+        self._dispatch_queue: Optional[SimpleQueue] = None
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._dispatch_lock = threading.Lock()
 
     def subscribe(self, event_type: EventType, handler: EventHandler) -> bool:
         """Подписывает обработчик на указанный тип события.
 
         Регистрирует обработчик для получения уведомлений о событиях
-        указанного типа. Операция потокобезопасна.
+        указанного типа. Операция потокобезопасна. Способ вызова обработчика
+        (функция или метод handle) определяется один раз здесь, а не при
+        каждой публикации.
 
         Args:
             event_type: Тип события для подписки.
@@ -110,21 +152,27 @@ class EventBus:
         Returns:
             bool: True если подписка успешна, False если обработчик уже подписан.
 
+        Raises:
+            TypeError: Если обработчик не вызываем и не имеет метода handle.
+
         Examples:
             >>> event_bus = EventBus()
             >>> event_bus.subscribe(EventType.USER_LOGIN, user_login_handler)
         """
-        with self._handlers_lock:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
+        target = _resolve_target(handler)
+
+        with self._handlers_lock.write():
+            subscribers = self._subscribers[event_type]
+            key = _subscriber_key(subscribers, handler)
 
             # Проверка на дубликаты
-            if handler in self._subscribers[event_type]:
-                logger.warning(f"Попытка повторной подписки обработчика {handler} на событие {event_type}")
+            if key in subscribers:
+                logger.warning("Попытка повторной подписки обработчика %s на событие %s", handler, event_type)
                 return False
 
-            self._subscribers[event_type].append(handler)
-            logger.debug(f"Добавлен обработчик {handler} для события {event_type}")
+            subscribers[key] = target
+            self._update_snapshot(event_type)
+            logger.debug("Добавлен обработчик %s для события %s", handler, event_type)
             return True
 
     def unsubscribe(self, event_type: EventType, handler: EventHandler) -> bool:
@@ -144,29 +192,33 @@ class EventBus:
             >>> event_bus = EventBus()
             >>> event_bus.unsubscribe(EventType.USER_LOGIN, user_login_handler)
         """
-        with self._handlers_lock:
+        with self._handlers_lock.write():
             if event_type not in self._subscribers:
-                logger.warning(f"Попытка отписки от отсутствующего типа события {event_type}")
+                logger.warning("Попытка отписки от отсутствующего типа события %s", event_type)
                 return False
 
-            if handler not in self._subscribers[event_type]:
-                logger.warning(f"Попытка отписки необработчика {handler} от события {event_type}")
+            subscribers = self._subscribers[event_type]
+            key = _subscriber_key(subscribers, handler)
+            if key not in subscribers:
+                logger.warning("Попытка отписки необработчика %s от события %s", handler, event_type)
                 return False
 
-            self._subscribers[event_type].remove(handler)
-            logger.debug(f"Удален обработчик {handler} для события {event_type}")
+            del subscribers[key]
+            logger.debug("Удален обработчик %s для события %s", handler, event_type)
 
             # Очистка пустого списка
             if not self._subscribers[event_type]:
                 del self._subscribers[event_type]
+            self._update_snapshot(event_type)
 
             return True
 
     def publish(self, event: Event) -> None:
         """Публикует событие для всех подписанных обработчиков.
 
-        Уведомляет всех подписчиков о наступлении события с учетом
-        приоритета типа события.
+        Уведомляет всех подписчиков о наступлении события. Обработчики
+        вызываются в порядке подписки: синхронно в потоке публикации или,
+        если включена асинхронная доставка, в рабочем потоке шины.
 
         Args:
             event: Экземпляр события для публикации.
@@ -176,26 +228,96 @@ class EventBus:
             >>> event = Event(EventType.FILE_CREATED, data={"path": "/tmp/file.txt"})
             >>> event_bus.publish(event)
         """
-        handlers = []
-
-        # Собираем обработчики без удержания блокировки во время вызовов
-        with self._handlers_lock:
-            if event.type in self._subscribers:
-                handlers = list(self._subscribers[event.type])
-
-        # Формируем приоритетную очередь
-        priority_queue = PriorityQueue()
-        for handler in handlers:
-            # Обертываем для безопасного вызова
-            wrapper = EventHandlerWrapper(handler, event, self._error_handler)
-            # Приоритет = (приоритет_типа, отрицательное_время) для FIFO при равных приоритетах
-            priority = (event.type.priority, -time())
-            priority_queue.put((priority, wrapper))
-
-        # Обработка событий в порядке приоритета
-        while not priority_queue.empty():
-            _, handler_wrapper = priority_queue.get()
-            handler_wrapper.call()
+        # Снимок неизменяем и подменяется писателями целиком, поэтому
+        # блокировка и копирование списка не нужны
+        handlers = self._snapshots.get(event.type, ())
+        if not handlers:
+            return
+        error_handler = self._error_handler
+
+        dispatch_queue = self._dispatch_queue
+        if dispatch_queue is not None:
+            dispatch_queue.put((event, handlers, error_handler))
+            return
+
+        # Все обработчики одного события имеют его приоритет, поэтому очередь
+        # с приоритетами ничего бы не переупорядочила — вызываем в порядке подписки.
+        # Порядок между разными событиями по приоритету дает QueuedEventBus
+        for target in handlers:
+            _dispatch(target, event, error_handler)
+
+    def publish_many(self, events: Iterable[Event]) -> None:
+        """Публикует пачку событий, разово получая снимок подписчиков.
+
+        Эквивалентно последовательным вызовам publish для каждого события
+        (порядок событий сохраняется), но словарь снимков и обработчик ошибок
+        читаются один раз на всю пачку. Подходит для накопленных событий,
+        например серии PROGRESS_UPDATED, собранной в цикле.
+
+        Args:
+            events: События для публикации в порядке доставки.
+
+        Examples:
+            >>> event_bus.publish_many(
+            ...     Event(EventType.PROGRESS_UPDATED, {"progress": p}) for p in range(0, 101, 10)
+            ... )
+        """
+        snapshots = self._snapshots
+        error_handler = self._error_handler
+        dispatch_queue = self._dispatch_queue
+        for event in events:
+            handlers = snapshots.get(event.type, ())
+            if not handlers:
+                continue
+            if dispatch_queue is not None:
+                dispatch_queue.put((event, handlers, error_handler))
+                continue
+            for target in handlers:
+                _dispatch(target, event, error_handler)
+
+    def start_async_dispatch(self) -> None:
+        """Включает асинхронную доставку событий.
+
+        После вызова publish только ставит событие со снимком обработчиков
+        в очередь и сразу возвращает управление, а обработчики выполняются
+        в отдельном рабочем потоке в порядке публикации. Медленный обработчик
+        больше не задерживает публикующий поток. Повторный вызов ничего не делает.
+
+        Note:
+            Обработчики, работающие с виджетами Tk, должны передавать обновления
+            в главный поток через after(), как это делают фреймы UI.
+        """
+        with self._dispatch_lock:
+            if self._dispatch_queue is not None:
+                return
+            dispatch_queue: SimpleQueue = SimpleQueue()
+            thread = threading.Thread(
+                target=_dispatch_worker, args=(dispatch_queue,), name="EventBusDispatch", daemon=True
+            )
+            thread.start()
+            self._dispatch_thread = thread
+            self._dispatch_queue = dispatch_queue
+            logger.debug("Включена асинхронная доставка событий")
+
+    def stop_async_dispatch(self, timeout: Optional[float] = None) -> None:
+        """Выключает асинхронную доставку и дожидается обработки очереди.
+
+        События, опубликованные до вызова, будут доставлены до остановки
+        рабочего потока. Новые события снова доставляются синхронно.
+
+        Args:
+            timeout: Максимальное время ожидания рабочего потока в секундах.
+                None - ждать без ограничения.
+        """
+        with self._dispatch_lock:
+            dispatch_queue, thread = self._dispatch_queue, self._dispatch_thread
+            if dispatch_queue is None:
+                return
+            self._dispatch_queue = None
+            self._dispatch_thread = None
+        dispatch_queue.put(None)
+        thread.join(timeout)
+        logger.debug("Асинхронная доставка событий выключена")
 
     def set_error_handler(self, handler: Callable[[Event, Exception], None]) -> None:
         """Устанавливает обработчик ошибок для всех событий.
@@ -214,7 +336,7 @@ class EventBus:
             >>> event_bus.set_error_handler(global_error_handler)
         """
         self._error_handler = handler
-        logger.debug(f"Установлен глобальный обработчик ошибок: {handler}")
+        logger.debug("Установлен глобальный обработчик ошибок: %s", handler)
 
     def clear_all_handlers(self) -> None:
         """Удаляет все зарегистрированные обработчики событий и ошибок.
@@ -225,8 +347,9 @@ class EventBus:
         Returns:
             None
         """
-        with self._handlers_lock:
-            self._subscribers = {}
+        with self._handlers_lock.write():
+            self._subscribers = defaultdict(dict)
+            self._snapshots = {}
             self._error_handler = None
             logger.debug("Очищены все обработчики событий и ошибок.")
 
@@ -240,18 +363,116 @@ class EventBus:
         Returns:
             int: Число обработчиков.
         """
-        with self._handlers_lock:
+        with self._handlers_lock.read():
             if event_type:
-                return len(self._subscribers.get(event_type, []))
+                return len(self._subscribers.get(event_type, ()))
             return sum(len(hlist) for hlist in self._subscribers.values())
 
+    def _update_snapshot(self, event_type: EventType) -> None:
+        """Пересобирает снимок обработчиков для типа события.
+
+        Вызывается под блокировкой на запись. Создает новый словарь снимков
+        и публикует его одним присваиванием, не изменяя словарь, который
+        могут читать параллельные вызовы publish.
+
+        Args:
+            event_type: Тип события, список подписчиков которого изменился.
+        """
+        snapshots = dict(self._snapshots)
+        subscribers = self._subscribers.get(event_type)
+        if subscribers:
+            snapshots[event_type] = tuple(subscribers.values())
+        else:
+            snapshots.pop(event_type, None)
+        self._snapshots = snapshots
+
+
+class QueuedEventBus(EventBus):
+    """Шина событий, доставляющая накопленные события в порядке приоритета.
+
+    EventBus вызывает обработчики сразу при публикации, и приоритет типа
+    события на порядок доставки не влияет. QueuedEventBus откладывает
+    доставку: publish только кладет событие в кучу, а process_pending
+    доставляет накопленные события от CRITICAL к LOW, при равном
+    приоритете - в порядке создания.
+
+    Attributes:
+        _pending (List[Tuple[int, int, Event]]): Куча записей
+            (priority_key, seq, событие). Кортежи сравниваются на уровне C
+            по первым двум полям, Event.__lt__ не вызывается.
+        _pending_lock (threading.Lock): Блокировка кучи.
+
+    Note:
+        Это отдельный синглтон: QueuedEventBus() и EventBus() возвращают
+        разные экземпляры со своими подписчиками.
+
+    Examples:
+        >>> bus = QueuedEventBus()
+        >>> bus.publish(Event(EventType.DATA_UPDATED))
+        >>> bus.publish(Event(EventType.ERROR_OCCURRED, {"error": "..."}))
+        >>> bus.process_pending()  # сначала ERROR_OCCURRED, затем DATA_UPDATED
+        2
+    """
+
+    _instance = None
+
+    def _setup(self) -> None:
+        """Инициализирует состояние шины и пустую кучу отложенных событий."""
+        super()._setup()
+        self._pending: List[Tuple[int, int, Event]] = []
+        self._pending_lock = threading.Lock()
+
+    def publish(self, event: Event) -> None:
+        """Ставит событие в очередь с учетом приоритета его типа.
+
+        Args:
+            event: Экземпляр события для публикации.
+        """
+        with self._pending_lock:
+            heapq.heappush(self._pending, (event.priority_key, event.seq, event))
+
+    def publish_many(self, events: Iterable[Event]) -> None:
+        """Ставит пачку событий в очередь под одной блокировкой.
+
+        Args:
+            events: События для публикации.
+        """
+        with self._pending_lock:
+            for event in events:
+                heapq.heappush(self._pending, (event.priority_key, event.seq, event))
+
+    def process_pending(self) -> int:
+        """Доставляет все накопленные события в порядке приоритета.
+
+        Очередь забирается целиком под блокировкой, а обработчики вызываются
+        вне ее, поэтому события, опубликованные обработчиками, будут
+        доставлены следующим вызовом.
+
+        Returns:
+            int: Количество доставленных событий.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+
+        deliver = super().publish
+        count = len(pending)
+        while pending:
+            deliver(heapq.heappop(pending)[2])
+        return count
+
+    def clear_all_handlers(self) -> None:
+        """Удаляет все обработчики и отбрасывает недоставленные события."""
+        super().clear_all_handlers()
+        with self._pending_lock:
+            self._pending = []
+
 
 class EventHandlerWrapper:
     """Безопасная обертка для вызова обработчика события.
 
     Инкапсулирует вызов обработчика события с обработкой исключений
-    и логированием. Используется внутри EventBus для безопасного
-    выполнения обработчиков.
+    и логированием. Сохранена для внешнего кода, которому нужен отложенный
+    вызов; сам EventBus вызывает обработчики через _dispatch.
 
     Attributes:
         handler (EventHandler): Обработчик события.
@@ -259,6 +480,8 @@ class EventHandlerWrapper:
         error_handler (Callable): Функция для обработки ошибок (опционально).
     """
 
+    __slots__ = ("handler", "event", "error_handler", "_target")
+
     def __init__(
         self,
         handler: EventHandler,
@@ -271,10 +494,14 @@ class EventHandlerWrapper:
             handler: Обработчик события для вызова.
             event: Событие, которое будет передано обработчику.
             error_handler: Функция для обработки ошибок (опционально).
+
+        Raises:
+            TypeError: Если обработчик не вызываем и не имеет метода handle.
         """
         self.handler = handler
         self.event = event
         self.error_handler = error_handler
+        self._target = _resolve_target(handler)
 
     def call(self) -> None:
         """Вызывает обработчик события с безопасной обработкой ошибок.
@@ -282,23 +509,112 @@ class EventHandlerWrapper:
         Если вызов обработчика приведет к ошибке, она будет перехвачена,
         залогирована и передана в error_handler, если он указан.
         """
-        try:
-            if callable(self.handler):
-                # handler -- это функция, а не класс
-                logger.debug(f"Вызываю функцию-обработчик {self.handler} для {self.event.type}")
-                self.handler(self.event)
-            elif hasattr(self.handler, "handle"):
-                # handler -- EventHandler
-                logger.debug(f"Вызываю метод handle() у {self.handler.__class__.__name__}")
-                self.handler.handle(self.event)
-            else:
-                raise ValueError(f"Неверный тип обработчика: {type(self.handler)}")
-        except Exception as e:
-            logger.error(
-                f"Ошибка в обработчике {self.handler} при событии {self.event.type}: {str(e)}", exc_info=True
-            )
-            if self.error_handler:
-                try:
-                    self.error_handler(self.event, e)
-                except Exception as eh_error:
-                    logger.error(f"Ошибка в error_handler: {str(eh_error)}", exc_info=True)
+        _dispatch(self._target, self.event, self.error_handler)
+
+
+class _UnhashableHandler:
+    """Ключ словаря подписчиков для нехешируемого обработчика.
+
+    Например, экземпляр dataclass с eq=True, у которого __hash__ равен None.
+    Ключ сравнивается по идентичности, а поиск уже подписанного равного
+    обработчика выполняет _subscriber_key.
+    """
+
+    __slots__ = ("handler",)
+
+    def __init__(self, handler: EventHandler) -> None:
+        self.handler = handler
+
+
+def _subscriber_key(subscribers: Dict[Any, Callable[[Event], None]], handler: EventHandler) -> Any:
+    """Возвращает ключ обработчика в словаре подписчиков.
+
+    Хешируемый обработчик сам является ключом. Для нехешируемого выполняется
+    линейный поиск среди ранее подписанных нехешируемых обработчиков по
+    равенству, как при хранении подписчиков в списке.
+
+    Args:
+        subscribers: Подписчики одного типа события.
+        handler: Обработчик события.
+
+    Returns:
+        Ключ для проверки наличия, добавления или удаления обработчика.
+    """
+    try:
+        hash(handler)
+    except TypeError:
+        for key in subscribers:
+            if isinstance(key, _UnhashableHandler) and key.handler == handler:
+                return key
+        return _UnhashableHandler(handler)
+    return handler
+
+
+def _resolve_target(handler: EventHandler) -> Callable[[Event], None]:
+    """Определяет, что именно вызывать для обработчика.
+
+    Функции и вызываемые объекты вызываются напрямую, объекты EventHandler —
+    через метод handle.
+
+    Args:
+        handler: Обработчик события.
+
+    Returns:
+        Вызываемый объект, принимающий событие.
+
+    Raises:
+        TypeError: Если обработчик не вызываем и не имеет метода handle.
+    """
+    if callable(handler):
+        return handler
+    handle = getattr(handler, "handle", None)
+    if callable(handle):
+        return handle
+    raise TypeError(f"Неверный тип обработчика: {type(handler)}")
+
+
+def _dispatch_worker(dispatch_queue: SimpleQueue) -> None:
+    """Цикл рабочего потока асинхронной доставки.
+
+    Извлекает из очереди кортежи (событие, обработчики, обработчик ошибок)
+    и вызывает обработчики, пока не получит None.
+
+    Args:
+        dispatch_queue: Очередь, которую заполняет EventBus.publish.
+    """
+    while True:
+        item = dispatch_queue.get()
+        if item is None:
+            return
+        event, handlers, error_handler = item
+        for target in handlers:
+            _dispatch(target, event, error_handler)
+
+
+def _dispatch(
+    target: Callable[[Event], None],
+    event: Event,
+    error_handler: Optional[Callable[[Event, Exception], None]] = None,
+) -> None:
+    """Вызывает обработчик события с безопасной обработкой ошибок.
+
+    Используется EventBus.publish напрямую, без создания EventHandlerWrapper
+    на каждый обработчик каждого события.
+
+    Args:
+        target: Вызываемая цель обработчика, полученная из _resolve_target.
+        event: Событие, которое будет передано обработчику.
+        error_handler: Функция для обработки ошибок (опционально).
+    """
+    try:
+        # Аргументы форматируются, только если DEBUG включен: repr обработчика
+        # и события не строятся на каждый вызов в рабочем режиме
+        logger.debug("Вызываю обработчик %s для %s", target, event.type)
+        target(event)
+    except Exception as e:
+        logger.error("Ошибка в обработчике %s при событии %s: %s", target, event.type, e, exc_info=True)
+        if error_handler:
+            try:
+                error_handler(event, e)
+            except Exception as eh_error:
+                logger.error("Ошибка в error_handler: %s", eh_error, exc_info=True)
@@ -20,13 +20,24 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import wraps
-from queue import PriorityQueue
+from itertools import count
 from threading import Lock
 from time import time
 from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
 
+# Монотонный счетчик событий: порядок FIFO при равных приоритетах без опоры на часы
+_event_seq = count()
+# Счетчик идентификаторов событий. Идентификатор нужен только для логов в пределах
+# процесса, поэтому uuid4 на каждое (в том числе частое PROGRESS_UPDATED) событие не нужен
+_event_ids = count(1)
+
+
+def _next_event_id() -> str:
+    """Возвращает следующий идентификатор события."""
+    return str(next(_event_ids))
+
 
 class EventPriority(Enum):
     """Уровни приоритета событий для определения порядка обработки.
@@ -58,6 +69,8 @@ class EventType(Enum):
     Атрибуты:
         category (EventCategory): Категория события.
         priority (EventPriority): Приоритет события.
+        priority_key (int): Ключ сортировки (-priority.value), вычисляется один раз
+            для каждого члена перечисления.
     """
 
     # Системные события
@@ -81,44 +94,52 @@ class EventType(Enum):
     def __init__(self, category: EventCategory, priority: EventPriority):
         self.category = category
         self.priority = priority
+        # Инвертируем приоритет, чтобы CRITICAL (3) -> -3, что "меньше" для PriorityQueue
+        self.priority_key = -priority.value
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Событие в системе с метаданными и валидацией.
 
+    Поля хранятся в слотах: событий создается много (например, PROGRESS_UPDATED),
+    а словарь атрибутов на каждый экземпляр им не нужен.
+
     Args:
         type (EventType): Тип события (с приоритетом и категорией).
         data (Optional[Dict[str, Any]]): Дополнительные данные события.
         source (Optional[str]): Источник события (например, имя модуля).
         timestamp (float): Временная метка (по умолчанию time()).
-        id (str): Уникальный идентификатор события (по умолчанию uuid4()).
+        id (str): Уникальный в пределах процесса идентификатор события
+            (по умолчанию следующий номер монотонного счетчика).
+        seq (int): Порядковый номер создания события, задается автоматически.
     """
 
     type: EventType
     data: Optional[Dict[str, Any]] = None
     source: Optional[str] = None
     timestamp: float = field(default_factory=time)
-    id: str = field(default_factory=lambda: str(__import__("uuid").uuid4()))
+    id: str = field(default_factory=_next_event_id)
 
     priority_key: int = field(init=False, repr=False)
+    seq: int = field(init=False, repr=False, compare=False, default_factory=lambda: next(_event_seq))
 
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = time()
         if self.id is None:
-            from uuid import uuid4
-
-            self.id = str(uuid4())
+            self.id = _next_event_id()
 
-        # Инвертируем приоритет, чтобы CRITICAL (3) -> -3, что "меньше" для PriorityQueue
-        self.priority_key = -self.type.priority.value
+        # Ключ заранее вычислен на члене перечисления типа события
+        self.priority_key = self.type.priority_key
 
     def __lt__(self, other: "Event") -> bool:
         """Сравнение приоритетов: более высокий приоритет - 'меньше' для PriorityQueue.
 
-        Если приоритеты одинаковые, сортировка идёт по времени создания (старые первыми).
+        Если приоритеты одинаковые, сортировка идёт по порядку создания (старые первыми).
+        Используется счетчик, а не timestamp: у событий, созданных в пределах
+        разрешения часов, временные метки совпадают.
         """
         if self.priority_key == other.priority_key:
-            return self.timestamp < other.timestamp  # FIFO для одинаковых приоритетов
+            return self.seq < other.seq  # FIFO для одинаковых приоритетов
         return self.priority_key < other.priority_key  # CRITICAL (-3) -> LOW (0)
@@ -1,7 +1,7 @@
 """
 Реализация обработчиков событий для приложения.
 
-Содержит базовый класс EventHandler и конкретные реализации:
+Содержит протокол EventHandler и конкретные реализации:
 - StateChangeHandler
 - ErrorHandler
 - UIActionHandler
@@ -10,8 +10,7 @@
 """
 
 import logging
-from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Protocol
 
 from pythonchik.events.events import Event, EventType
 from pythonchik.events.ui_events import UIEventType
@@ -23,24 +22,22 @@ from pythonchik.events.ui_events import UIEventType
 logger = logging.getLogger(__name__)
 
 
-class EventHandler(ABC):
-    """Абстрактный базовый класс для всех обработчиков событий.
+class EventHandler(Protocol):
+    """Протокол обработчиков событий.
 
-    Все конкретные обработчики событий должны наследоваться от этого класса
-    и реализовывать метод handle(event).
+    Обработчиком считается любой объект с методом handle(event): шина
+    событий определяет способ вызова при подписке и не проверяет
+    принадлежность классу. Конкретные обработчики модуля наследуются
+    от протокола явно, чтобы документировать контракт.
     """
 
-    @abstractmethod
     def handle(self, event: Event) -> None:
         """Обработать событие.
 
         Args:
             event (Event): Событие для обработки.
-
-        Raises:
-            NotImplementedError: Если метод не реализован в подклассе.
         """
-        pass
+        ...
 
 
 class StateChangeHandler(EventHandler):
@@ -147,10 +144,27 @@ class TaskEventHandler(EventHandler):
 class UIActionHandler(EventHandler):
     """Обработчик событий UI (действий), например UI_ACTION.
 
-    Может переводить EventType.UI_ACTION -> UIEventType(event.data["action_type"]) и
-    вызывать соответствующий метод (extract_addresses, compress_images и т.д.).
+    Определяет UIEventType по event.data["action_type"] для EventType.UI_ACTION и
+    вызывает соответствующий метод (extract_addresses, compress_images и т.д.).
+
+    Attributes:
+        _dispatch (Dict[UIEventType, Callable[[], None]]): Методы-обработчики по типу
+            UI-события. Строится один раз при создании обработчика, поэтому
+            handle не ищет метод по имени на каждое событие.
     """
 
+    def __init__(self) -> None:
+        """Строит таблицу методов-обработчиков для всех UIEventType.
+
+        Имя метода — значение типа в нижнем регистре (EXTRACT_ADDRESSES ->
+        extract_addresses); методы подклассов подхватываются так же.
+        """
+        self._dispatch: Dict[UIEventType, Callable[[], None]] = {}
+        for ui_type in UIEventType:
+            method = getattr(self, ui_type.value.lower(), None)
+            if callable(method):
+                self._dispatch[ui_type] = method
+
     def handle(self, event: Event) -> None:
         """Обрабатывает событие UI_ACTION (или уже UIEventType).
 
@@ -164,38 +178,37 @@ class UIActionHandler(EventHandler):
         logger.info("UIActionHandler получил событие: %s", event.type)
         logger.debug("Детали события: %s", event.data)
 
-        # 1) Если это EventType.UI_ACTION, превращаем в UIEventType
-        if event.type == EventType.UI_ACTION:
+        # 1) Если это EventType.UI_ACTION, определяем UIEventType по action_type.
+        # Само событие не меняем: оно общее для всех подписчиков
+        ui_type = event.type
+        if ui_type == EventType.UI_ACTION:
             action_type = event.data.get("action_type")
             if not action_type:
                 error_msg = "UI_ACTION должно содержать action_type"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
 
-            try:
-                event.type = UIEventType(action_type)
-            except ValueError as e:
+            # Поиск по словарю значений перечисления, без исключения на промахе
+            ui_type = UIEventType._value2member_map_.get(action_type)
+            if ui_type is None:
                 error_msg = f"Недопустимый action_type: {action_type}"
                 logger.error(error_msg)
-                raise ValueError(error_msg) from e
+                raise ValueError(error_msg)
 
-        # 2) Теперь event.type — это UIEventType, проверяем обработчик
-        if not isinstance(event.type, UIEventType):
-            error_msg = f"Ожидается UIEventType, получено: {event.type}"
+        # 2) Теперь ui_type — это UIEventType, проверяем обработчик
+        if not isinstance(ui_type, UIEventType):
+            error_msg = f"Ожидается UIEventType, получено: {ui_type}"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        handler_method_name = event.type.value.lower()
-        handler_method = getattr(self, handler_method_name, None)
-        logger.debug("Найден метод: %s", handler_method_name)
-
-        if not handler_method or not callable(handler_method):
-            error_msg = f"Метод обработчика не найден для {event.type}"
+        handler_method = self._dispatch.get(ui_type)
+        if handler_method is None:
+            error_msg = f"Метод обработчика не найден для {ui_type}"
             logger.error(error_msg)
             raise NotImplementedError(error_msg)
 
         # 3) Запускаем метод
-        logger.info("Выполнение обработчика: %s", handler_method_name)
+        logger.info("Выполнение обработчика: %s", handler_method.__name__)
         handler_method()
 
     def extract_addresses(self) -> None:
@@ -0,0 +1,104 @@
+"""Блокировка чтения/записи для структур, которые часто читаются и редко меняются.
+
+Используется шиной событий: публикация событий (чтение списка подписчиков)
+происходит намного чаще, чем подписка и отписка (запись).
+
+Классы:
+- RWLock: Блокировка, допускающая много читателей или одного писателя
+
+Примеры:
+    >>> lock = RWLock()
+    >>> with lock.read():
+    ...     snapshot = list(data)
+    >>> with lock.write():
+    ...     data.append(item)
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class RWLock:
+    """Блокировка, допускающая одновременных читателей и одного писателя.
+
+    Читатели не блокируют друг друга. Писатель получает исключительный доступ.
+    Ожидающий писатель имеет приоритет: новые читатели ждут, пока он не
+    закончит, поэтому поток публикаций не может бесконечно откладывать подписку.
+
+    Attributes:
+        _cond (threading.Condition): Условная переменная, защищающая счетчики.
+        _readers (int): Количество активных читателей.
+        _writers_waiting (int): Количество писателей, ожидающих доступа.
+        _writer_active (bool): Удерживает ли блокировку писатель.
+
+    Note:
+        Блокировка не реентерабельна: поток, удерживающий запись, не должен
+        повторно захватывать ни чтение, ни запись.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует свободную блокировку."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writers_waiting = 0
+        self._writer_active = False
+
+    def acquire_read(self) -> None:
+        """Захватывает блокировку на чтение, ожидая активного или ожидающего писателя."""
+        with self._cond:
+            while self._writer_active or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Освобождает блокировку на чтение и будит писателя, если читателей не осталось."""
+        with self._cond:
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """Захватывает блокировку на запись, ожидая ухода всех читателей и писателей."""
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer_active or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer_active = True
+
+    def release_write(self) -> None:
+        """Освобождает блокировку на запись и будит всех ожидающих."""
+        with self._cond:
+            self._writer_active = False
+            self._cond.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Контекстный менеджер для доступа на чтение.
+
+        Examples:
+            >>> with lock.read():
+            ...     handlers = list(subscribers)
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Контекстный менеджер для исключительного доступа на запись.
+
+        Examples:
+            >>> with lock.write():
+            ...     subscribers.append(handler)
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
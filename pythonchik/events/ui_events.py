@@ -66,8 +66,13 @@ class UIEventType(Enum):
             else EventPriority.NORMAL
         )
 
+    @property
+    def priority_key(self) -> int:
+        """Ключ сортировки события, совместимый с EventType.priority_key."""
+        return -self.get_priority().value
 
-@dataclass()
+
+@dataclass(slots=True)
 class UIActionEvent(Event):
     """Класс событий для UI действий с определенными типами данных.
 
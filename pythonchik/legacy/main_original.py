@@ -1,7 +1,38 @@
+import json
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 import tkinter.filedialog as fd
 import tkinter.messagebox as mb
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Без явного backend ijson выбирает самый быстрый доступный (yajl2_c, если собран)
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _load_json(path):
+    # orjson разбирает файл в несколько раз быстрее стандартного json
+    with open(path, "rb") as f:
+        if orjson is not None:
+            return orjson.loads(f.read())
+        return json.load(f)
+
+
+def _iter_json_array(path, key):
+    # Элементы массива верхнего уровня по одному: с ijson файл разбирается
+    # потоково и не загружается в память целиком
+    if ijson is None:
+        yield from _load_json(path)[key]
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, f"{key}.item")
+
 
 class App(tk.Tk):
     def __init__(self):
@@ -29,8 +60,6 @@ class App(tk.Tk):
         btn_price.pack(**opts)
 
     def show_adress(self):
-        import json
-
         import pandas as pd
 
         root = tk.Tk()
@@ -39,9 +68,7 @@ class App(tk.Tk):
         adress = []
         if len(file) > 0:
             for i in file:
-                with open(i, encoding="utf-8") as f:
-                    data = json.load(f)
-                for j in data["catalogs"]:
+                for j in _iter_json_array(i, "catalogs"):
                     try:
                         adress.append(j["target_regions"][0])
                     except:
@@ -65,23 +92,37 @@ class App(tk.Tk):
         files = fd.askopenfilenames()
         if len(files) > 0:
             os.mkdir("Картинки Сжатые")
-            for i in files:
+
+            def resize(i):
                 im = Image.open(i)
                 width, height = im.size
                 new_size = (width // 2, height // 2)
-                resized_image = im.resize(new_size)
+                # JPEG уменьшается прямо при декодировании, остальное - усреднением блоков 2x2
+                im.draft(im.mode, new_size)
+                if im.size == new_size:
+                    resized_image = im
+                elif im.size == (width, height) and im.mode not in ("1", "P"):
+                    resized_image = im.reduce(2, box=(0, 0, new_size[0] * 2, new_size[1] * 2))
+                else:
+                    resized_image = im.resize(new_size, resample=Image.Resampling.BILINEAR)
                 resized_image.save(
                     f"Картинки Сжатые\\{i.split('/')[-1].replace('.png', '').replace('.jpg', '').replace('.webp', '')}.png",
-                    optimize=True,
-                    quality=50,
+                    compress_level=1,
                 )
+
+            # Pillow отпускает GIL при декодировании, ресемплинге и кодировании,
+            # поэтому картинки обрабатываются параллельно в потоках
+            with ThreadPoolExecutor() as executor:
+                list(executor.map(resize, files))
             fantasy_zip = zipfile.ZipFile("Картинки Сжатые.zip", "w")
-            for folder, subfolders, files in os.walk("Картинки Сжатые"):
-                for file in files:
+            # Папка плоская: scandir отдает имя и путь записи без обхода дерева и relpath
+            with os.scandir("Картинки Сжатые") as entries:
+                for entry in entries:
                     fantasy_zip.write(
-                        os.path.join(folder, file),
-                        os.path.relpath(os.path.join(folder, file), "Картинки Сжатые"),
-                        compress_type=zipfile.ZIP_DEFLATED,
+                        entry.path,
+                        entry.name,
+                        # PNG уже сжаты deflate внутри, повторное сжатие только тратит время
+                        compress_type=zipfile.ZIP_STORED,
                     )
             fantasy_zip.close()
             shutil.rmtree("Картинки Сжатые")
@@ -91,8 +132,6 @@ class App(tk.Tk):
             mb.showinfo("Информация", "Выбери изображение/я")
 
     def koor(self):
-        import json
-
         import pandas as pd
 
         root = tk.Tk()
@@ -104,17 +143,15 @@ class App(tk.Tk):
         count = 0
         if len(files) > 0:
             for j in files:
-                with open(f"{j}", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _load_json(j)
                 for i in data["catalogs"]:
                     segment.append(i["target_shops"][0])
                 for i in data["target_shops_coords"]:
                     koor.append(i)
-                for i in segment:
-                    if i not in koor:
-                        nkoor.append(str(i))
-                    else:
-                        count += 1
+            # Проверка по множеству: O(1) на адрес вместо прохода по списку координат
+            koor_set = set(koor)
+            nkoor = [str(i) for i in segment if i not in koor_set]
+            count = len(segment) - len(nkoor)
         else:
             mb.showinfo("Информация", "Файл/файлы json")
         mb.showinfo(
@@ -137,22 +174,21 @@ class App(tk.Tk):
         quit()
 
     def barcode(self):
-        import json
-
         import pandas as pd
 
         root = tk.Tk()
         root.withdraw()
         file = fd.askopenfilenames()
         barcode = []
+        seen_barcodes = set()
         if len(file) > 0:
             for j in file:
-                with open(f"{j}", encoding="utf-8") as f:
-                    data = json.load(f)
-                for i in data["offers"]:
+                for i in _iter_json_array(j, "offers"):
                     try:
-                        if i["barcode"] not in barcode and len(i["barcode"]) > 5:
-                            barcode.append(i["barcode"])
+                        code = i["barcode"]
+                        if code not in seen_barcodes and len(code) > 5:
+                            seen_barcodes.add(code)
+                            barcode.append(code)
                     except:
                         print("null")
         else:
@@ -163,21 +199,16 @@ class App(tk.Tk):
         quit()
 
     def uniq(self):
-        import json
-
         root = tk.Tk()
         root.withdraw()
         file = fd.askopenfilenames()
-        offers = []
+        offers = set()
         count = 0
         if len(file) > 0:
             for j in file:
-                with open(f"{j}", encoding="utf-8") as f:
-                    data = json.load(f)
-                for i in data["offers"]:
+                for i in _iter_json_array(j, "offers"):
                     count += 1
-                    if i["description"] not in offers:
-                        offers.append(i["description"])
+                    offers.add(i["description"])
         else:
             mb.showinfo("Информация", "Выбери файл/ы json")
         mb.showinfo(
@@ -187,23 +218,23 @@ class App(tk.Tk):
         quit()
 
     def test(self):
-        import json
+        from collections import Counter
 
         root = tk.Tk()
         root.withdraw()
         file = fd.askopenfilenames()
         if len(file) == 1:
-            with open(file[0], encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(file[0])
             koor = []
             json_file = {}
             json_file["catalogs"] = data["catalogs"]
             for i in json_file["catalogs"]:
                 i["offers"] = [i["offers"][0]]
+            # Оффер попадает в файл по разу на каждый каталог, где он первый:
+            # счетчик ссылок вместо перебора всех каталогов для каждого оффера
+            first_offers = Counter(j["offers"][0] for j in json_file["catalogs"])
             for i in data["offers"]:
-                for j in json_file["catalogs"]:
-                    if i["id"] == j["offers"][0]:
-                        koor.append(i)
+                koor.extend([i] * first_offers[i["id"]])
             json_file["offers"] = koor
             try:
                 json_file["target_shops_coords"] = data["target_shops_coords"]
@@ -225,6 +256,7 @@ class App(tk.Tk):
 
     def image_format(self):
         import os
+        import shutil
 
         from PIL import Image
 
@@ -233,52 +265,50 @@ class App(tk.Tk):
         file = fd.askopenfilenames()
         if len(file) > 0:
             os.mkdir("Картинки формат")
-            for i in file:
+
+            def convert(i):
                 try:
                     im = Image.open(i)
-                    im.save(
-                        f"Картинки формат\\{i.split('/')[-1].replace('.tif', '').replace('.png', '').replace('.jpg', '').replace('.webp', '')}.png"
-                    )
+                    out = f"Картинки формат\\{i.split('/')[-1].replace('.tif', '').replace('.png', '').replace('.jpg', '').replace('.webp', '')}.png"
+                    # open читает только заголовок: PNG копируется байтами без декодирования
+                    if im.format == "PNG":
+                        shutil.copyfile(i, out)
+                    else:
+                        im.save(out)
                     im.close()
                 except:
                     print("Не получилось")
+
+            with ThreadPoolExecutor() as executor:
+                list(executor.map(convert, file))
             mb.showinfo("Информация", "Готово!")
             quit()
         else:
             mb.showinfo("Информация", "Выбери изображение/я")
 
     def price(self):
-        import json
-
         import matplotlib.pyplot as pl
         import numpy as np
+        import pandas as pd
 
         root = tk.Tk()
         root.withdraw()
         files = fd.askopenfilenames()
-        segment = []
+        segment = set()
         price = []
         count = 0
         if len(files) > 0:
             for file in files:
-                with open(f"{file}", encoding="utf-8") as f:
-                    data = json.load(f)
-                for i in data["offers"]:
-                    if i["description"] not in segment:
-                        segment.append(i["description"])
-                for i in segment:
-                    mass = []
-                    try:
-                        for j in data["offers"]:
-                            if i == j["description"]:
-                                if j["price_new"] not in mass:
-                                    mass.append(j["price_new"])
-                        if max(mass) - min(mass) != 0:
-                            price.append(max(mass) - min(mass))
-                        if len(mass) > 1:
-                            count += 1
-                    except:
-                        print("В фиде ошибка, нет новой цены --->" + str(i))
+                data = _load_json(file)
+                offers = pd.DataFrame(data["offers"], columns=["description", "price_new"])
+                segment.update(offers["description"].dropna())
+                for i in offers.loc[offers["price_new"].isna(), "description"].unique():
+                    print("В фиде ошибка, нет новой цены --->" + str(i))
+                # Разброс цен по каждому офферу файла одним проходом groupby
+                spread = offers.groupby("description")["price_new"].agg(["min", "max", "nunique"])
+                difference = (spread["max"] - spread["min"]).dropna()
+                price.extend(difference[difference != 0].tolist())
+                count += int((spread["nunique"] > 1).sum())
             pl.figure(figsize=(10, 8))
             a = np.array(price)
             fig = pl.hist(a)
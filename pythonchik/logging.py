@@ -10,6 +10,7 @@
 - JSONFormatter: Форматтер для вывода логов в JSON формате
 - ContextLogger: Расширенный логгер с поддержкой дополнительных полей
 - setup_logging: Функция настройки системы логирования
+- flush_logging: Функция ожидания записи накопленных сообщений
 
 Примеры:
     Базовая настройка логирования:
@@ -23,15 +24,45 @@
     >>> logger.info("Важное сообщение", extra_fields={"user_id": 123})
 """
 
+import atexit
 import json
 import logging
 import os
 import sys
+import time
 import traceback
-from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
 from typing import Any, Dict, Optional
 
+# Количество записей, накапливаемых в памяти перед записью в файл лога
+FILE_LOG_BUFFER_CAPACITY = 1024
+
+# Слушатель очереди логов, запущенный setup_logging
+_listener: Optional[QueueListener] = None
+
+try:
+    import orjson
+except ImportError:  # orjson необязателен: без него используется стандартный json
+    orjson = None
+
+
+if orjson is not None:
+
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        """Сериализует запись лога в JSON через orjson.
+
+        orjson кодирует словарь на уровне C и в разы быстрее стандартного json.
+        OPT_NON_STR_KEYS сохраняет поведение json.dumps для нестроковых ключей.
+        """
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+else:
+
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        """Сериализует запись лога в JSON через стандартный модуль json."""
+        return json.dumps(data, ensure_ascii=False)
+
 
 class JSONFormatter(logging.Formatter):
     """Форматтер для структурированного вывода логов в JSON формате.
@@ -43,8 +74,10 @@ class JSONFormatter(logging.Formatter):
         default_fields (list): Список стандартных полей, включаемых в каждую запись.
 
     Note:
+        Если установлен orjson, запись сериализуется им, иначе стандартным json.
+
         Формат JSON-лога включает следующие поля:
-        - timestamp: Временная метка в ISO формате
+        - timestamp: Временная метка в ISO формате с миллисекундами
         - message: Текст сообщения
         - level: Уровень логирования (INFO, ERROR, etc.)
         - logger: Имя логгера
@@ -59,6 +92,28 @@ class JSONFormatter(logging.Formatter):
         """Инициализирует форматтер с настройками по умолчанию."""
         super().__init__()
         self.default_fields = ["name", "levelname", "pathname", "lineno"]
+        # Кэш (секунда, отформатированные дата и время): записи одной секунды
+        # отличаются только миллисекундами
+        self._timestamp_cache: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """Возвращает временную метку записи в ISO формате с миллисекундами.
+
+        Дата и время форматируются через time.strftime один раз в секунду,
+        без создания объекта datetime на каждую запись.
+
+        Args:
+            record: Запись лога.
+
+        Returns:
+            Строка вида "2023-03-06T21:34:57.123".
+        """
+        second = int(record.created)
+        cached_second, prefix = self._timestamp_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            self._timestamp_cache = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}"
 
     def format(self, record: logging.LogRecord) -> str:
         """Форматирует запись лога в JSON.
@@ -76,10 +131,10 @@ class JSONFormatter(logging.Formatter):
             >>> formatter = JSONFormatter()
             >>> formatted_log = formatter.format(log_record)
             >>> print(formatted_log)
-            {"timestamp": "2023-03-06T21:34:57", "message": "Тестовое сообщение", ...}
+            {"timestamp": "2023-03-06T21:34:57.123", "message": "Тестовое сообщение", ...}
         """
         message_dict = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record),
             "message": record.getMessage(),
             "level": record.levelname,
             "logger": record.name,
@@ -96,17 +151,17 @@ class JSONFormatter(logging.Formatter):
                 "message": str(exc_value) if exc_value else "",
                 "traceback": (
                     traceback.format_exception(exc_type, exc_value, exc_tb)
-                    if all([exc_type, exc_value, exc_tb])
+                    if exc_type and exc_value and exc_tb
                     else []
                 ),
             }
 
-        # Добавляем дополнительные поля из extra
-        extra = getattr(record, "extra", None)
-        if extra and isinstance(extra, dict) and "extra_fields" in extra:
-            message_dict["extra_fields"] = extra["extra_fields"]
+        # Добавляем дополнительные поля, переданные через extra={"extra_fields": ...}
+        extra_fields = getattr(record, "extra_fields", None)
+        if extra_fields:
+            message_dict["extra_fields"] = extra_fields
 
-        return json.dumps(message_dict, ensure_ascii=False)
+        return _json_dumps(message_dict)
 
 
 class ContextLogger(logging.Logger):
@@ -136,7 +191,7 @@ class ContextLogger(logging.Logger):
     def _log_with_context(
         self,
         level: int,
-        msg: str,
+        msg: object,
         args: tuple[Any, ...] = (),
         extra_fields: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
@@ -144,11 +199,13 @@ class ContextLogger(logging.Logger):
         """Внутренний метод для логирования с дополнительным контекстом.
 
         Добавляет дополнительные поля в словарь extra перед передачей
-        записи базовому логгеру.
+        записи базовому логгеру. Вызывается только для включенных уровней:
+        публичные методы проверяют isEnabledFor до построения записи.
 
         Args:
             level: Уровень логирования.
-            msg: Сообщение лога.
+            msg: Сообщение лога. Передается как есть: LogRecord.getMessage сам
+                приводит его к строке, и только если запись будет выведена.
             args: Аргументы для форматирования сообщения.
             extra_fields: Дополнительные поля контекста для записи лога.
             **kwargs: Дополнительные аргументы для базового метода _log.
@@ -174,7 +231,8 @@ class ContextLogger(logging.Logger):
             >>> logger = logging.getLogger("pythonchik")
             >>> logger.info("Файл успешно обработан", extra_fields={"file_size": 1024, "duration": 0.5})
         """
-        self._log_with_context(logging.INFO, str(msg), args, extra_fields, **kwargs)
+        if self.isEnabledFor(logging.INFO):
+            self._log_with_context(logging.INFO, msg, args, extra_fields, **kwargs)
 
     def error(
         self, msg: object, *args: object, extra_fields: Optional[Dict[str, Any]] = None, **kwargs: Any
@@ -194,7 +252,8 @@ class ContextLogger(logging.Logger):
             ... except ValueError as e:
             ...     logger.error("Ошибка обработки", extra_fields={"error_code": 500})
         """
-        self._log_with_context(logging.ERROR, str(msg), args, extra_fields, **kwargs)
+        if self.isEnabledFor(logging.ERROR):
+            self._log_with_context(logging.ERROR, msg, args, extra_fields, **kwargs)
 
     def warning(
         self, msg: object, *args: object, extra_fields: Optional[Dict[str, Any]] = None, **kwargs: Any
@@ -207,7 +266,8 @@ class ContextLogger(logging.Logger):
             extra_fields: Дополнительные поля контекста.
             **kwargs: Дополнительные аргументы для базового метода.
         """
-        self._log_with_context(logging.WARNING, str(msg), args, extra_fields, **kwargs)
+        if self.isEnabledFor(logging.WARNING):
+            self._log_with_context(logging.WARNING, msg, args, extra_fields, **kwargs)
 
     def debug(
         self, msg: object, *args: object, extra_fields: Optional[Dict[str, Any]] = None, **kwargs: Any
@@ -220,14 +280,66 @@ class ContextLogger(logging.Logger):
             extra_fields: Дополнительные поля контекста.
             **kwargs: Дополнительные аргументы для базового метода.
         """
-        self._log_with_context(logging.DEBUG, str(msg), args, extra_fields, **kwargs)
+        if self.isEnabledFor(logging.DEBUG):
+            self._log_with_context(logging.DEBUG, msg, args, extra_fields, **kwargs)
+
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler для очереди внутри процесса.
+
+    Стандартный prepare форматирует запись и удаляет exc_info, чтобы ее можно
+    было сериализовать. Здесь запись не покидает процесс, поэтому exc_info
+    сохраняется для JSONFormatter, а подставляются только аргументы сообщения:
+    к моменту обработки в другом потоке они могут измениться.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Подставляет аргументы в сообщение и возвращает ту же запись.
+
+        Args:
+            record: Запись лога.
+
+        Returns:
+            Запись с готовым сообщением.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def flush_logging() -> None:
+    """Дожидается обработки всех записей лога и сбрасывает буфер файла.
+
+    Останавливает слушатель очереди (он обрабатывает оставшиеся записи),
+    сбрасывает буферы обработчиков и запускает слушатель снова.
+
+    Examples:
+        >>> logger.info("Сообщение")
+        >>> flush_logging()  # Сообщение уже записано в файл
+    """
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    """Останавливает слушатель при завершении процесса, дописывая очередь."""
+    if _listener is not None:
+        _listener.stop()
 
 
 def setup_logging(log_dir: str = "logs") -> None:
     """Настраивает систему логирования.
 
     Создает директорию для логов, настраивает логгеры и обработчики
-    для файлового и консольного вывода.
+    для файлового и консольного вывода. Обработчики работают в отдельном
+    потоке QueueListener: вызов логгера только ставит запись в очередь.
+    Файловый вывод буферизуется: записи попадают в файл пачками, при записи
+    уровня ERROR и выше или при завершении работы. Повторный вызов
+    заменяет предыдущую конфигурацию.
 
     Args:
         log_dir: Директория для хранения лог-файлов. По умолчанию "logs".
@@ -246,9 +358,26 @@ def setup_logging(log_dir: str = "logs") -> None:
     # Создаём директорию для логов если её нет
     os.makedirs(log_dir, exist_ok=True)
 
+    global _listener
+
     # Регистрируем наш кастомный логгер
     logging.setLoggerClass(ContextLogger)
     logger = logging.getLogger("pythonchik")
+
+    # Повторный вызов заменяет прежнюю конфигурацию, а не добавляет к ней обработчики
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            # MemoryHandler при закрытии сбрасывает буфер, но не закрывает целевой файл
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+        _listener = None
+    for handler in list(logger.handlers):
+        if isinstance(handler, _LocalQueueHandler):
+            logger.removeHandler(handler)
+            handler.close()
     logger.setLevel(logging.DEBUG)
     logger.propagate = False
 
@@ -269,15 +398,34 @@ def setup_logging(log_dir: str = "logs") -> None:
     )
     file_handler.setFormatter(json_formatter)
     file_handler.setLevel(logging.DEBUG)
-    logger.addHandler(file_handler)
+
+    # Буфер перед файлом: записи пишутся пачками по FILE_LOG_BUFFER_CAPACITY штук вместо
+    # системного вызова write на каждую. Ошибка сразу сбрасывает буфер вместе с
+    # предшествующим контекстом, при завершении работы буфер сбрасывается в logging.shutdown
+    buffered_file_handler = MemoryHandler(
+        capacity=FILE_LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    buffered_file_handler.setLevel(logging.DEBUG)
 
     # Консольный лог
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(console_formatter)
     console_handler.setLevel(logging.INFO)  # Консоль только INFO и выше
-    logger.addHandler(console_handler)
+
+    # Логгер только кладет записи в очередь; форматирование JSON, ротация и запись
+    # выполняются в потоке слушателя и не задерживают рабочие потоки и UI
+    log_queue: SimpleQueue = SimpleQueue()
+    logger.addHandler(_LocalQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, buffered_file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
 
     logger.info(
         "Система логирования инициализирована",
         extra={"version": "1.0", "environment": os.getenv("ENV", "development")},
     )
+
+
+atexit.register(_stop_listener)
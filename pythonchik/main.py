@@ -20,6 +20,8 @@
     - pythonchik.ui.app: Пользовательский интерфейс
 """
 
+import atexit
+
 from pythonchik.core.application_core import ApplicationCore
 from pythonchik.events.eventbus import EventBus
 from pythonchik.logging import setup_logging
@@ -43,6 +45,7 @@ def main() -> None:
     setup_logging()
     bus = EventBus()
     core = ApplicationCore(bus)
+    atexit.register(core.image_executor.shutdown)
     app = ModernApp(core, event_bus=bus)
     app.mainloop()
 
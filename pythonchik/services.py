@@ -26,9 +26,12 @@
     ['1234567890', '0987654321']
 """
 
+from collections import Counter
 from decimal import Decimal
 from typing import Any
 
+import pandas as pd
+
 from pythonchik.events.eventbus import EventBus
 from pythonchik.events.events import Event, EventType
 
@@ -62,29 +65,37 @@ def extract_addresses(data: dict[str, Any], event_bus=None) -> list[str]:
     addresses = []
     catalogs = data.get("catalogs", [])
     total_catalogs = len(catalogs)
+    # Прогресс публикуется только при смене целого процента: не больше 100 событий
+    # на файл вместо события на каждый каталог
+    publish = event_bus.publish if event_bus else None
+    last_progress = -1
 
     for i, catalog in enumerate(catalogs):
         try:
-            if catalog.get("target_regions"):
-                if not isinstance(catalog["target_regions"], list):
+            regions = catalog.get("target_regions")
+            if regions:
+                if not isinstance(regions, list):
                     raise TypeError("target_regions должен быть списком")
-                addresses.append(catalog["target_regions"][0])
+                addresses.append(regions[0])
             else:
-                if not isinstance(catalog.get("target_shops", []), list):
+                shops = catalog.get("target_shops", [])
+                if not isinstance(shops, list):
                     raise TypeError("target_shops должен быть списком")
-                addresses.append(catalog["target_shops"][0])
-
-            if event_bus:
-                progress = int((i + 1) / total_catalogs * 100)
-                event_bus.publish(
-                    Event(
-                        EventType.PROGRESS_UPDATED,
-                        {
-                            "progress": progress,
-                            "message": f"Обработано {i + 1} из {total_catalogs} каталогов",
-                        },
+                addresses.append(shops[0])
+
+            if publish is not None:
+                progress = (i + 1) * 100 // total_catalogs
+                if progress != last_progress:
+                    last_progress = progress
+                    publish(
+                        Event(
+                            EventType.PROGRESS_UPDATED,
+                            {
+                                "progress": progress,
+                                "message": f"Обработано {i + 1} из {total_catalogs} каталогов",
+                            },
+                        )
                     )
-                )
 
         except (KeyError, IndexError):
             continue
@@ -125,9 +136,10 @@ def check_coordinates_match(data: dict[str, Any]) -> tuple[list[str], int, int,
         for catalog in data["catalogs"]:
             if not isinstance(catalog, dict):
                 raise ValueError("Каталог должен быть словарем")
-            if "target_shops" not in catalog or not catalog["target_shops"]:
+            shops = catalog.get("target_shops")
+            if not shops:
                 continue
-            catalog_shops.append(catalog["target_shops"][0])
+            catalog_shops.append(shops[0])
         return catalog_shops, len(catalog_shops), 0, 0
 
     try:
@@ -143,11 +155,15 @@ def check_coordinates_match(data: dict[str, Any]) -> tuple[list[str], int, int,
                 raise ValueError(f"Каталог #{i + 1} должен быть словарем")
             if "target_shops" not in catalog:
                 raise ValueError(f"Отсутствует поле target_shops в каталоге #{i + 1}")
-            if not catalog["target_shops"]:
+            shops = catalog["target_shops"]
+            if not shops:
                 raise ValueError(f"Пустой список target_shops в каталоге #{i + 1}")
-            catalog_shops.append(catalog["target_shops"][0])
+            catalog_shops.append(shops[0])
 
-        unmatched_shops = [shop for shop in catalog_shops if shop not in shop_coords]
+        # Несовпавшие адреса находятся разностью множеств; список фильтруется, только
+        # если они есть, чтобы сохранить порядок и повторы адресов из каталогов
+        unmatched_set = set(catalog_shops).difference(shop_coords)
+        unmatched_shops = [shop for shop in catalog_shops if shop in unmatched_set] if unmatched_set else []
         matched_count = len(catalog_shops) - len(unmatched_shops)
 
         return unmatched_shops, len(catalog_shops), len(shop_coords), matched_count
@@ -156,16 +172,18 @@ def check_coordinates_match(data: dict[str, Any]) -> tuple[list[str], int, int,
 
 
 def extract_barcodes(data: dict[str, Any]) -> list[str]:
-    """Извлечь уникальные штрих-коды из предложений."""
-    barcodes = []
-    for offer in data.get("offers", []):
-        try:
-            barcode = offer.get("barcode")
-            if barcode and isinstance(barcode, str) and len(barcode) > 5 and barcode not in barcodes:
-                barcodes.append(barcode)
-        except (KeyError, TypeError):
-            continue
-    return barcodes
+    """Извлечь уникальные штрих-коды из предложений.
+
+    Штрих-коды возвращаются в порядке первого появления; повторы
+    отсеивает dict.fromkeys, который сохраняет порядок вставки.
+    """
+    return list(
+        dict.fromkeys(
+            barcode
+            for offer in data.get("offers", [])
+            if isinstance(barcode := offer.get("barcode"), str) and len(barcode) > 5
+        )
+    )
 
 
 def count_unique_offers(data: dict[str, Any]) -> tuple[int, int]:
@@ -196,27 +214,37 @@ def count_unique_offers(data: dict[str, Any]) -> tuple[int, int]:
             raise ValueError("Некорректный формат предложения")
         if "description" not in offer:
             raise ValueError("Отсутствует поле 'description' в предложении")
-        if not offer["description"]:
+        description = offer["description"]
+        if not description:
             raise ValueError("Пустое поле 'description' в предложении")
 
-        unique_descriptions.add(offer["description"])
+        unique_descriptions.add(description)
 
     return len(offers), len(unique_descriptions)
 
 
 def create_test_json(data: dict[str, Any]) -> dict[str, Any]:
-    """Создать тестовый JSON с ограниченными данными."""
-    json_file = {"catalogs": data.get("catalogs", [])}
-
-    for catalog in json_file["catalogs"]:
-        if catalog.get("offers"):
-            catalog["offers"] = [catalog["offers"][0]]
+    """Создать тестовый JSON с ограниченными данными.
 
+    Входные данные не изменяются: каталоги с предложениями копируются
+    поверхностно, так как загруженные данные могут быть общими (см. load_json_file).
+    """
+    json_file = {
+        "catalogs": [
+            {**catalog, "offers": [catalog["offers"][0]]} if catalog.get("offers") else catalog
+            for catalog in data.get("catalogs", [])
+        ]
+    }
+
+    # Число ссылок каталогов на каждое первое предложение: два линейных прохода вместо
+    # вложенного цикла. Предложение попадает в результат по разу на каждую ссылку
+    first_offer_refs = Counter(
+        catalog["offers"][0] for catalog in json_file["catalogs"] if catalog.get("offers")
+    )
     koor = []
-    for offer in data.get("offers", []):
-        for catalog in json_file["catalogs"]:
-            if catalog.get("offers") and offer["id"] == catalog["offers"][0]:
-                koor.append(offer)
+    if first_offer_refs:
+        for offer in data.get("offers", []):
+            koor.extend([offer] * first_offer_refs[offer["id"]])
 
     json_file["offers"] = koor
     json_file["target_shops_coords"] = data.get("target_shops_coords", [])
@@ -242,29 +270,30 @@ def analyze_price_differences(data: dict[str, Any]) -> tuple[list[float], int, i
     if not data.get("offers"):
         return [], 0, 0
 
-    unique_products = {}
+    descriptions = []
+    prices = []
     for offer in data["offers"]:
         if "description" not in offer:
             raise KeyError("Missing 'description' field in offer")
+        description = offer["description"]
         if "price_new" not in offer:
-            raise KeyError(f"Missing 'price_new' field for offer: {offer['description']}")
+            raise KeyError(f"Missing 'price_new' field for offer: {description}")
 
         price = offer["price_new"]
         if not isinstance(price, (int, float, Decimal)):
-            raise ValueError(f"Invalid price value for {offer['description']}: {price}")
+            raise ValueError(f"Invalid price value for {description}: {price}")
         if price < 0:
             raise ValueError("Negative price value")
 
-        desc = offer["description"]
-        if desc not in unique_products:
-            unique_products[desc] = set()
-        unique_products[desc].add(price)
-
-    price_diffs = []
-    diff_count = 0
-    for prices in unique_products.values():
-        if len(prices) > 1:
-            price_diffs.append(max(prices) - min(prices))
-            diff_count += 1
-
-    return price_diffs, diff_count, len(unique_products)
+        descriptions.append(description)
+        prices.append(price)
+
+    # Минимум и максимум цены по каждому товару считаются одним groupby в pandas;
+    # sort=False сохраняет порядок первого появления товаров. Цены числовые, поэтому
+    # различных цен больше одной ровно тогда, когда максимум больше минимума:
+    # подсчет различных значений (nunique) с хешированием по группам не нужен
+    spread = pd.Series(prices).groupby(pd.Series(descriptions), sort=False, dropna=False).agg(["min", "max"])
+    diffs = spread["max"] - spread["min"]
+    differs = diffs > 0
+    price_diffs = diffs[differs].tolist()
+    return price_diffs, int(differs.sum()), len(spread)
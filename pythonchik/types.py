@@ -25,16 +25,12 @@ class Offer(BaseModel):
 
     id: str = Field(..., description="Уникальный идентификатор предложения")
     description: str = Field(..., min_length=1, description="Описание продукта")
-    barcode: str = Field(..., min_length=5, description="Штрих-код продукта")
+    # Состав штрих-кода проверяется ограничением pattern в ядре pydantic,
+    # без вызова Python-валидатора для каждого предложения
+    barcode: str = Field(..., min_length=5, pattern=r"^\d+$", description="Штрих-код продукта")
     price_new: Decimal = Field(..., ge=0, description="Текущая цена предложения")
     price_old: Optional[Decimal] = Field(None, ge=0, description="Предыдущая цена, если доступна")
 
-    @field_validator("barcode")
-    def validate_barcode(cls, v: str) -> str:
-        if not v.isdigit():
-            raise ValueError("Штрих-код должен содержать только цифры")
-        return v
-
 
 class Catalog(BaseModel):
     """Модель каталога с валидацией.
@@ -11,15 +11,18 @@
     - Интеграция с системой событий
 """
 
-import json
 import logging
+import os
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog as fd
 from tkinter import messagebox as mb
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple
 
 import customtkinter as ctk
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
 
 from pythonchik import config
 from pythonchik.core.application_core import ApplicationCore
@@ -43,6 +46,9 @@ from pythonchik.ui.frames import ActionMenuFrame, LogFrame, ResultFrame, SideBar
 from pythonchik.utils import (
     create_archive,
     load_json_file,
+    load_json_result,
+    process_json_items,
+    save_json_file,
     save_to_csv,
 )
 from pythonchik.utils.image import ImageProcessor
@@ -50,6 +56,28 @@ from pythonchik.utils.metrics import MetricsCollector
 from pythonchik.utils.settings import SettingsManager
 
 
+def _count_offer_descriptions(offers: Iterable[Dict[str, Any]]) -> Tuple[int, FrozenSet[str]]:
+    """Считает предложения файла и собирает их описания.
+
+    Функция модуля, а не замыкание: результат кэшируется вместе с файлом
+    (см. process_json_items) по самой функции.
+
+    Args:
+        offers: Предложения файла.
+
+    Returns:
+        Количество предложений и множество их описаний (предложения без
+        описания только учитываются в количестве).
+    """
+    count = 0
+    descriptions = set()
+    for offer in offers:
+        count += 1
+        if "description" in offer:
+            descriptions.add(offer["description"])
+    return count, frozenset(descriptions)
+
+
 class ModernApp(ctk.CTk):
     """Главное окно приложения, реализующее современный интерфейс.
 
@@ -77,6 +105,12 @@ class ModernApp(ctk.CTk):
 
         self.core.start()
 
+        # Пул для анализа JSON: загрузка больших файлов не должна блокировать
+        # поток Tk и замораживать интерфейс (см. _run_in_background)
+        self._analysis_executor = ThreadPoolExecutor(
+            max_workers=config.ANALYSIS_WORKERS, thread_name_prefix="analysis"
+        )
+
         # Инициализируем менеджер настроек
         self.settings_manager = SettingsManager()
 
@@ -193,9 +227,25 @@ class ModernApp(ctk.CTk):
         self.settings_manager.save_settings()
         # Останавливаем ядро (и ждём, пока поток завершится)
         self.core.stop()
+        # Незапущенные задачи анализа отменяем, окно их результатов уже не покажет
+        self._analysis_executor.shutdown(wait=False, cancel_futures=True)
         # Закрываем окно
         self.destroy()
 
+    def _run_in_background(self, task: Callable[[], Any], on_done: Callable[[Future], None]) -> None:
+        """Выполняет задачу в фоновом потоке и передает результат в поток Tk.
+
+        Виджеты Tk можно изменять только из главного потока, поэтому
+        on_done вызывается через after(0, ...), когда задача завершится.
+
+        Args:
+            task: Функция без аргументов, выполняемая в пуле анализа.
+            on_done: Обработчик результата; получает завершенный Future
+                и может вызывать future.result() для получения значения или исключения.
+        """
+        future = self._analysis_executor.submit(task)
+        future.add_done_callback(lambda done: self.after(0, on_done, done))
+
     def setup_ui(self) -> None:
         """Настройка компонентов интерфейса.
 
@@ -358,6 +408,8 @@ class ModernApp(ctk.CTk):
                             )
                         )
 
+                        # extract_addresses публикует события прогресса, поэтому результат не кэшируется;
+                        # повторный запуск для неизмененного файла берет из кэша только разобранный JSON
                         data = load_json_file(str(file_path))
                         result = extract_addresses(data, self.event_bus)
                         addresses.extend(result)
@@ -435,7 +487,9 @@ class ModernApp(ctk.CTk):
                     output_dir.mkdir(exist_ok=True)
 
                     self.result_frame.update_progress(20, "Сжатие изображений...")
-                    processed_files = ImageProcessor.compress_multiple_images(list(files), str(output_dir))
+                    processed_files = ImageProcessor.resize_images(
+                        list(files), str(output_dir), executor=self.core.image_executor
+                    )
 
                     self.result_frame.update_progress(60, "Создание архива...")
                     archive_path = config.get_archive_path()
@@ -503,8 +557,9 @@ class ModernApp(ctk.CTk):
                         self.result_frame.update_progress(
                             progress, f"Обработка файла: {Path(file_path).name}"
                         )
-                        data = load_json_file(file_path)
-                        no_coords, catalogs, coords, matched = check_coordinates_match(data)
+                        no_coords, catalogs, coords, matched = load_json_result(
+                            file_path, check_coordinates_match
+                        )
                         no_coords_list.extend(no_coords)
                         total_catalogs += catalogs
                         total_coords += coords
@@ -584,9 +639,10 @@ class ModernApp(ctk.CTk):
                             progress, f"Обработка файла {idx}/{total_files}: {Path(file_path).name}"
                         )
 
-                        data = load_json_file(str(file_path))
-                        barcodes = extract_barcodes(data)
-                        all_barcodes.extend(barcodes)
+                        all_barcodes.extend(load_json_result(str(file_path), extract_barcodes))
+                    # Штрих-коды, повторяющиеся в разных файлах, оставляем один раз
+                    # в порядке первого появления
+                    all_barcodes = list(dict.fromkeys(all_barcodes))
 
                     if all_barcodes:
                         output_path = config.get_unique_filename(
@@ -649,10 +705,8 @@ class ModernApp(ctk.CTk):
             json_file = create_test_json(data)
 
             output_path = config.get_unique_filename(Path(files[0]).stem, config.TEST_JSON_SUFFIX, ".json")
-            with open(output_path, "w", encoding="utf-8") as outfile:
-                json_content = json.dumps(json_file, ensure_ascii=False, indent=2)
-                json.dump(json_file, outfile, ensure_ascii=False, indent=2)
-                self.result_frame.show_text(json_content)
+            json_content = save_json_file(json_file, str(output_path))
+            self.result_frame.show_text(json_content)
 
             self.log_frame.log(f"Тестовый JSON сохранен в файл: {output_path}")
             self.log_frame.log("Операция успешно завершена!")
@@ -679,12 +733,19 @@ class ModernApp(ctk.CTk):
             mb.showinfo("Информация", "Пожалуйста, выберите файл(ы) изображений")
             return
 
-        output_dir = Path(config.FORMAT_CONVERTED_IMAGES_DIR)
-        output_dir.mkdir(exist_ok=True)
+        config.FORMAT_CONVERTED_IMAGES_DIR.mkdir(exist_ok=True)
+        # Пути собираются строками один раз на файл, без промежуточных объектов Path
+        output_dir = os.fspath(config.FORMAT_CONVERTED_IMAGES_DIR)
 
+        futures = {}
         for file_path in files:
+            stem = os.path.splitext(os.path.basename(file_path))[0]
+            futures[file_path] = self.core.submit_image_task(
+                ImageProcessor.convert_format, file_path, os.path.join(output_dir, stem + ".png")
+            )
+        for file_path, future in futures.items():
             try:
-                ImageProcessor.convert_format(file_path, str(output_dir / f"{Path(file_path).stem}.png"))
+                future.result()
             except (FileNotFoundError, PermissionError, OSError) as e:
                 mb.showerror(
                     "Ошибка",
@@ -694,16 +755,20 @@ class ModernApp(ctk.CTk):
         mb.showinfo("Успех", "Изображения успешно конвертированы!")
 
     def count_unique_offers(self) -> None:
-        """Подсчитывает количество уникальных предложений в JSON-файлах."""
+        """Подсчитывает количество уникальных предложений в JSON-файлах.
+
+        Файлы загружаются и анализируются в фоновом потоке, результат
+        отображается в потоке Tk (см. _run_in_background).
+        """
         files = fd.askopenfilenames(filetypes=config.JSON_FILE_TYPES)
         if not files:
             mb.showinfo("Информация", "Пожалуйста, выберите JSON файл(ы)")
             return
 
-        try:
-            self.log_frame.log("Начало анализа файлов...")
-            total_files = len(files)
+        self.log_frame.log("Начало анализа файлов...")
 
+        def task() -> Tuple[int, int]:
+            total_files = len(files)
             total_count = 0
             unique_descriptions = set()
 
@@ -712,55 +777,71 @@ class ModernApp(ctk.CTk):
                 self.result_frame.update_progress(
                     progress, f"Обработка файла {index}/{total_files}: {Path(file).name}"
                 )
-                self.log_frame.log(f"Анализ файла: {Path(file).name}")
+                self.after(0, self.log_frame.log, f"Анализ файла: {Path(file).name}")
 
-                data = load_json_file(file)
-                offers = data.get("offers", [])
-                total_count += len(offers)
-                unique_descriptions.update(offer["description"] for offer in offers if "description" in offer)
+                # Нужен только массив предложений: очень большие файлы читаются потоково,
+                # для остальных повторный подсчет по неизмененному файлу берется из кэша
+                count, descriptions = process_json_items(file, "offers", _count_offer_descriptions)
+                total_count += count
+                unique_descriptions.update(descriptions)
 
             self.result_frame.update_progress(90, "Подсчет итоговых результатов...")
-            unique_count = len(unique_descriptions)
+            return total_count, len(unique_descriptions)
 
-            result_message = f"Всего предложений: {total_count}\n" f"Уникальных предложений: {unique_count}"
-            self.log_frame.log("Анализ завершен.")
-            self.log_frame.log(result_message)
-            self.result_frame.show_text(result_message)
-            self.result_frame.update_progress(100, "Готово!")
+        def on_done(future: Future) -> None:
+            try:
+                total_count, unique_count = future.result()
 
-        except (KeyError, ValueError, TypeError, FileNotFoundError) as e:
-            from pythonchik.errors.error_context import ErrorSeverity
-            from pythonchik.errors.error_handlers import DataProcessingErrorHandler
+                result_message = (
+                    f"Всего предложений: {total_count}\n" f"Уникальных предложений: {unique_count}"
+                )
+                self.log_frame.log("Анализ завершен.")
+                self.log_frame.log(result_message)
+                self.result_frame.show_text(result_message)
+                self.result_frame.update_progress(100, "Готово!")
 
-            error_handler = DataProcessingErrorHandler()
-            error_handler.handle_error(
-                error=e,
-                operation="Подсчет предложений",
-                severity=ErrorSeverity.ERROR,
-                recovery_action="Проверьте структуру JSON файла",
-                additional_context={"files": [str(f) for f in files if files]},
-            )
-            error_message = f"Ошибка: {str(e)}"
-            self.log_frame.log(error_message, "ERROR")
-            mb.showerror("Ошибка", error_message)
-            self.result_frame.update_progress(0, "")
-        finally:
-            self.result_frame.update_progress(0, "")
+            except (KeyError, ValueError, TypeError, FileNotFoundError) as e:
+                from pythonchik.errors.error_context import ErrorSeverity
+                from pythonchik.errors.error_handlers import DataProcessingErrorHandler
+
+                error_handler = DataProcessingErrorHandler()
+                error_handler.handle_error(
+                    error=e,
+                    operation="Подсчет предложений",
+                    severity=ErrorSeverity.ERROR,
+                    recovery_action="Проверьте структуру JSON файла",
+                    additional_context={"files": [str(f) for f in files if files]},
+                )
+                error_message = f"Ошибка: {str(e)}"
+                self.log_frame.log(error_message, "ERROR")
+                mb.showerror("Ошибка", error_message)
+                self.result_frame.update_progress(0, "")
+            finally:
+                self.result_frame.update_progress(0, "")
+
+        self._run_in_background(task, on_done)
 
     def compare_prices(self) -> None:
-        """Анализирует и визуализирует различия цен в выбранных JSON-файлах."""
+        """Анализирует и визуализирует различия цен в выбранных JSON-файлах.
+
+        Файлы загружаются и анализируются в фоновом потоке, график строится
+        и отображается в потоке Tk (см. _run_in_background).
+        """
         files = fd.askopenfilenames(filetypes=config.JSON_FILE_TYPES)
         if not files:
             self.log_frame.log("Пожалуйста, выберите JSON файл(ы)")
             return
 
-        try:
-            self.log_frame.log("Начало анализа разницы цен...")
-            self.log_frame.log(f"Выбрано {len(files)} файлов для обработки")
+        self.log_frame.log("Начало анализа разницы цен...")
+        self.log_frame.log(f"Выбрано {len(files)} файлов для обработки")
+
+        def task() -> Tuple[List[float], int, int]:
             total_files = len(files)
 
             price_diffs = []
             total_count = 0
+            # Товары с разными ценами и все уникальные товары считаются по каждому
+            # файлу отдельно и суммируются: у процента одно основание
             total_offers = 0
 
             self.result_frame.update_progress(0, "Начало обработки файлов...")
@@ -769,67 +850,81 @@ class ModernApp(ctk.CTk):
                 self.result_frame.update_progress(
                     progress, f"Обработка файла {index}/{total_files}: {Path(file_path).name}"
                 )
-                self.log_frame.log(f"Анализ файла: {Path(file_path).name}")
+                self.after(0, self.log_frame.log, f"Анализ файла: {Path(file_path).name}")
 
-                data = load_json_file(file_path)
-                diffs, diff_count, total = analyze_price_differences(dict(data))
+                diffs, diff_count, unique_count = load_json_result(file_path, analyze_price_differences)
                 price_diffs.extend(diffs)
                 total_count += diff_count
-                total_offers += total
-                self.log_frame.log(f"Найдено {diff_count} предложений с разными ценами в файле")
-
-            if total_offers > 0:
-                self.result_frame.update_progress(90, "Создание графика...")
-                percentage = int(total_count * 100 / total_offers)
-                fig = plt.figure(figsize=config.PRICE_PLOT_SIZE)
-                plt.hist(price_diffs, bins=config.PRICE_PLOT_BINS)
-                self.result_frame.show_figure(fig)
-                plt.close(fig)
-                plot_filename = config.get_plot_filename()
-                plt.savefig(plot_filename)
-
-                result_message = (
-                    f"Всего уникальных предложений: {total_offers}\n"
-                    f"Предложений с различными ценами: {total_count}\n"
-                    f"Процент предложений с различными ценами: {percentage}%"
+                total_offers += unique_count
+                self.after(
+                    0, self.log_frame.log, f"Найдено {diff_count} предложений с разными ценами в файле"
                 )
-                self.log_frame.log("Анализ завершен.")
-                self.log_frame.log(result_message)
 
-                self.result_frame.update_progress(100, "Готово!")
-            else:
-                self.log_frame.log("Предложения не найдены в выбранных файлах")
+            return price_diffs, total_count, total_offers
 
-        except (FileNotFoundError, PermissionError) as e:
-            from pythonchik.errors.error_context import ErrorSeverity
-            from pythonchik.errors.error_handlers import FileProcessingErrorHandler
+        def on_done(future: Future) -> None:
+            try:
+                price_diffs, total_count, total_offers = future.result()
+
+                if total_offers > 0:
+                    self.result_frame.update_progress(90, "Создание графика...")
+                    percentage = int(total_count * 100 / total_offers)
+                    # Figure создается без pyplot: график встраивается в окно и сохраняется
+                    # в файл, менеджер окон pyplot и его глобальное состояние не нужны.
+                    # Столбцы считает numpy, а рисуются они одной ступенчатой фигурой
+                    counts, edges = np.histogram(
+                        np.asarray(price_diffs, dtype=float), bins=config.PRICE_PLOT_BINS
+                    )
+                    fig = Figure(figsize=config.PRICE_PLOT_SIZE)
+                    fig.add_subplot().stairs(counts, edges, fill=True)
+                    self.result_frame.show_figure(fig)
+                    plot_filename = config.get_plot_filename()
+                    fig.savefig(plot_filename)
+
+                    result_message = (
+                        f"Всего уникальных предложений: {total_offers}\n"
+                        f"Предложений с различными ценами: {total_count}\n"
+                        f"Процент предложений с различными ценами: {percentage}%"
+                    )
+                    self.log_frame.log("Анализ завершен.")
+                    self.log_frame.log(result_message)
 
-            error_handler = FileProcessingErrorHandler()
-            error_handler.handle_error(
-                error=e,
-                operation="Доступ к файлам для анализа цен",
-                severity=ErrorSeverity.ERROR,
-                recovery_action="Проверьте наличие и доступность выбранных файлов",
-                additional_context={"files": [str(f) for f in files if files]},
-            )
-            error_msg = f"Ошибка доступа к файлам: {str(e)}"
-            self.log_frame.log(error_msg, "ERROR")
-            mb.showerror("Ошибка", error_msg)
-        except (KeyError, ValueError, TypeError) as e:
-            from pythonchik.errors.error_context import ErrorSeverity
-            from pythonchik.errors.error_handlers import DataProcessingErrorHandler
+                    self.result_frame.update_progress(100, "Готово!")
+                else:
+                    self.log_frame.log("Предложения не найдены в выбранных файлах")
 
-            error_handler = DataProcessingErrorHandler()
-            error_handler.handle_error(
-                error=e,
-                operation="Обработка данных для анализа цен",
-                severity=ErrorSeverity.ERROR,
-                recovery_action="Проверьте структуру JSON файла",
-                additional_context={"files": [str(f) for f in files if files]},
-            )
-            error_msg = f"Ошибка обработки данных: {str(e)}"
-            self.log_frame.log(error_msg, "ERROR")
-            mb.showerror("Ошибка", error_msg)
-        finally:
-            self.result_frame.update_progress(0, "")
-            self.log_frame.log("Процесс завершен")
+            except (FileNotFoundError, PermissionError) as e:
+                from pythonchik.errors.error_context import ErrorSeverity
+                from pythonchik.errors.error_handlers import FileProcessingErrorHandler
+
+                error_handler = FileProcessingErrorHandler()
+                error_handler.handle_error(
+                    error=e,
+                    operation="Доступ к файлам для анализа цен",
+                    severity=ErrorSeverity.ERROR,
+                    recovery_action="Проверьте наличие и доступность выбранных файлов",
+                    additional_context={"files": [str(f) for f in files if files]},
+                )
+                error_msg = f"Ошибка доступа к файлам: {str(e)}"
+                self.log_frame.log(error_msg, "ERROR")
+                mb.showerror("Ошибка", error_msg)
+            except (KeyError, ValueError, TypeError) as e:
+                from pythonchik.errors.error_context import ErrorSeverity
+                from pythonchik.errors.error_handlers import DataProcessingErrorHandler
+
+                error_handler = DataProcessingErrorHandler()
+                error_handler.handle_error(
+                    error=e,
+                    operation="Обработка данных для анализа цен",
+                    severity=ErrorSeverity.ERROR,
+                    recovery_action="Проверьте структуру JSON файла",
+                    additional_context={"files": [str(f) for f in files if files]},
+                )
+                error_msg = f"Ошибка обработки данных: {str(e)}"
+                self.log_frame.log(error_msg, "ERROR")
+                mb.showerror("Ошибка", error_msg)
+            finally:
+                self.result_frame.update_progress(0, "")
+                self.log_frame.log("Процесс завершен")
+
+        self._run_in_background(task, on_done)
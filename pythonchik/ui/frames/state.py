@@ -2,7 +2,7 @@
 
 import customtkinter as ctk
 
-from pythonchik.core.application_state import ApplicationState
+from pythonchik.core.application_state import STATE_NAMES, ApplicationState
 
 
 class StateFrame(ctk.CTkFrame):
@@ -53,7 +53,7 @@ class StateFrame(ctk.CTkFrame):
 
         def _update():
             self.state_label.configure(
-                text=state.value.upper(), fg_color=self.STATE_COLORS.get(state, "#95a5a6")
+                text=STATE_NAMES[state].upper(), fg_color=self.STATE_COLORS.get(state, "#95a5a6")
             )
 
         # Schedule the update on the main thread
@@ -22,6 +22,11 @@
 - process_multiple_files: Пакетная обработка нескольких файлов заданной функцией
 - save_to_csv: Сохранение данных в CSV файл с указанными заголовками
 - load_json_file: Загрузка и парсинг JSON файла с обработкой ошибок
+- load_json_result: Результат обработки JSON файла, кэшируемый вместе с файлом
+- clear_json_cache: Очистка кэша разобранных JSON файлов
+- iter_json_items: Перебор элементов массива JSON файла (потоково для очень больших файлов)
+- process_json_items: Обработка элементов массива JSON файла с кэшированием результата
+- save_json_file: Сохранение данных в JSON файл с отступами
 - create_archive: Создание ZIP-архива с указанными файлами
 - validate_json_structure: Валидация JSON данных согласно ожидаемой структуре
 
@@ -70,14 +75,74 @@
 
 import csv
 import json
+import mmap
+import os
+import re
+import threading
 import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 
 from pythonchik.errors.error_handlers import ErrorContext, ErrorHandler, ErrorSeverity, FileOperationError
 
+try:
+    import orjson
+except ImportError:  # orjson необязателен: без него используется стандартный json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson необязателен: без него очень большие файлы загружаются целиком
+    ijson = None
+
 T = TypeVar("T")
 
+# Форматы, уже сжатые внутри себя: повторное сжатие deflate почти не уменьшает их
+# размер, поэтому в архив они кладутся без сжатия (ZIP_STORED)
+_STORED_ARCHIVE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".webp", ".gif", ".zip"})
+
+# Файлы JSON от этого размера разбираются через mmap: orjson читает отображенные
+# страницы напрямую, без копирования всего файла в буфер Python. Для небольших
+# файлов обычное чтение дешевле настройки отображения
+_JSON_MMAP_MIN_SIZE = 1 << 20
+
+# Файлы JSON от этого размера iter_json_items разбирает потоково через ijson:
+# дерево объектов всего документа для них занимает больше памяти, чем выигрыш
+# в скорости от orjson
+_JSON_STREAM_MIN_SIZE = 64 << 20
+
+# Размер буфера записи CSV: большие выгрузки пишутся крупными блоками, а не построчно
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Признаки строк CSV, которые csv.writer записал бы иначе, чем простое соединение:
+# разделитель или кавычка в значении и пустые значения (единственное пустое поле
+# строки csv.writer записывает как ""). Проверяется текст, соединенный через \r\n
+_CSV_UNSAFE_ROWS = re.compile(r'[,"]|^$|^\r\n|\r\n\r\n|\r\n$')
+_CSV_UNSAFE_FIELD = re.compile(r'[,"\r\n]|^$')
+
+
+@dataclass(slots=True)
+class _CachedJson:
+    """Запись кэша JSON файлов: разобранные данные и результаты их обработки.
+
+    Attributes:
+        data: Разобранное содержимое файла.
+        results: Результаты load_json_result по ключу (функция, аргументы).
+    """
+
+    data: Any
+    results: Dict[Tuple[Any, ...], Any] = field(default_factory=dict)
+
+
+# Кэш разобранных JSON файлов: пользователь обычно запускает несколько операций
+# над одними и теми же файлами. Ключ - абсолютный путь, время изменения и размер
+# файла, поэтому измененный на диске файл разбирается заново
+_JSON_CACHE_SIZE = 8
+_json_cache: "OrderedDict[Tuple[str, int, int], _CachedJson]" = OrderedDict()
+_json_cache_lock = threading.Lock()
+
 
 def process_multiple_files(
     files: List[str], processor_func: Callable[[Dict[str, Any], Any], T], *args: Any
@@ -131,12 +196,45 @@ def process_multiple_files(
     return results
 
 
+def _format_single_column_csv(data: List[Any], header: List[str]) -> Optional[str]:
+    """Формирует CSV с одним столбцом данных без csv.writer.
+
+    Все значения соединяются одним вызовом str.join и проверяются одним
+    поиском по регулярному выражению вместо проверки каждой строки в csv.writer.
+
+    Args:
+        data: Значения столбца.
+        header: Заголовки столбцов.
+
+    Returns:
+        Текст CSV, совпадающий с выводом csv.writer, или None, если значения
+        не строки либо требуют кавычек; тогда данные пишутся через csv.writer.
+    """
+    if not all(isinstance(name, str) and not _CSV_UNSAFE_FIELD.search(name) for name in header):
+        return None
+    header_row = ",".join(header) + "\r\n"
+    if not data:
+        return header_row
+
+    try:
+        rows = "\r\n".join(data)
+    except TypeError:
+        return None
+    # Перевод строки внутри значения меняет число разделителей строк
+    separators = len(data) - 1
+    if rows.count("\r") != separators or rows.count("\n") != separators or _CSV_UNSAFE_ROWS.search(rows):
+        return None
+    return header_row + rows + "\r\n"
+
+
 def save_to_csv(data: List[Any], header: List[str], output_path: str) -> None:
     """Сохраняет данные в CSV файл.
 
     Записывает переданные данные в CSV файл с указанными заголовками.
     Каждый элемент данных записывается в отдельную строку. Автоматически
-    создает директорию для файла, если она не существует.
+    создает директорию для файла, если она не существует. Строковые значения
+    без символов, требующих кавычек, записываются одним блоком текста;
+    остальные данные записываются через csv.writer.
 
     Args:
         data: Список данных для сохранения в CSV. Каждый элемент
@@ -161,10 +259,17 @@ def save_to_csv(data: List[Any], header: List[str], output_path: str) -> None:
         if not output_dir.exists():
             output_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
+        text = _format_single_column_csv(data, header)
+        with open(output_path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as f:
+            if text is not None:
+                f.write(text)
+                return
             writer = csv.writer(f)
             writer.writerow(header)
-            writer.writerows([[item] for item in data])
+            # Значения с запятыми и кавычками (например, адреса) csv.writer заключает
+            # в кавычки. Строки из одного значения выдает zip: кортежи создаются в C
+            # (и переиспользуются), без списка и байткода Python на каждую строку
+            writer.writerows(zip(data))
     except PermissionError as e:
         error_handler.handle_error(
             FileOperationError("Отказано в доступе", output_path, "Сохранение CSV"),
@@ -185,12 +290,120 @@ def save_to_csv(data: List[Any], header: List[str], output_path: str) -> None:
         raise error
 
 
+def _parse_json(raw: Union[bytes, memoryview]) -> Any:
+    """Разбирает содержимое JSON файла в кодировке UTF-8.
+
+    Если установлен orjson, байты разбираются им напрямую, без промежуточного
+    декодирования в строку; иначе используется стандартный json.
+
+    Raises:
+        JSONDecodeError: При некорректном формате JSON.
+        UnicodeDecodeError: Если содержимое не является корректным UTF-8.
+    """
+    if orjson is None:
+        return json.loads(raw.decode("utf-8"))
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson сообщает о некорректном UTF-8 как об ошибке формата;
+        # повторное декодирование отличает ошибку кодировки, как в json
+        str(raw, "utf-8")
+        raise
+
+
+def _read_json(f: BinaryIO, size: int) -> Any:
+    """Разбирает JSON из открытого в двоичном режиме файла.
+
+    Большие файлы при установленном orjson отображаются в память (mmap) и
+    разбираются без промежуточной копии; остальные читаются целиком.
+
+    Args:
+        f: Открытый файл.
+        size: Размер файла в байтах.
+    """
+    if orjson is not None and size >= _JSON_MMAP_MIN_SIZE:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return _parse_json(view)
+    return _parse_json(f.read())
+
+
+def _read_json_cached(file_path: str, f: BinaryIO) -> _CachedJson:
+    """Возвращает запись кэша для файла, при промахе разбирает файл и кэширует его.
+
+    Файл уже открыт, поэтому ошибки доступа возникают до обращения к кэшу.
+    Ключ кэша строится по fstat открытого файла; при переполнении вытесняется
+    давно не использовавшаяся запись.
+    """
+    stat = os.fstat(f.fileno())
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    with _json_cache_lock:
+        entry = _json_cache.get(key)
+        if entry is not None:
+            _json_cache.move_to_end(key)
+            return entry
+
+    # Разбор идет без блокировки: другие потоки могут читать свои файлы параллельно
+    data = _read_json(f, stat.st_size)
+    with _json_cache_lock:
+        # Если тот же файл параллельно разобрал другой поток, остается его запись
+        entry = _json_cache.setdefault(key, _CachedJson(data))
+        _json_cache.move_to_end(key)
+        while len(_json_cache) > _JSON_CACHE_SIZE:
+            _json_cache.popitem(last=False)
+    return entry
+
+
+def clear_json_cache() -> None:
+    """Очищает кэш разобранных JSON файлов вместе с результатами их обработки."""
+    with _json_cache_lock:
+        _json_cache.clear()
+
+
+def _load_json_entry(file_path: str) -> _CachedJson:
+    """Загружает JSON файл через кэш с обработкой ошибок load_json_file."""
+    error_handler = ErrorHandler()
+    try:
+        with open(file_path, "rb") as f:
+            return _read_json_cached(file_path, f)
+    except FileNotFoundError as e:
+        error_handler.handle_error(
+            FileOperationError("JSON файл не найден", file_path, "Загрузка JSON"),
+            "Загрузка JSON",
+            ErrorSeverity.ERROR,
+        )
+        raise FileNotFoundError("JSON файл не найден")
+    except json.JSONDecodeError as e:
+        error_handler.handle_error(
+            FileOperationError("Некорректный формат JSON", file_path, "Загрузка JSON"),
+            "Загрузка JSON",
+            ErrorSeverity.ERROR,
+        )
+        raise json.JSONDecodeError("Некорректный формат JSON", e.doc, e.pos)
+    except UnicodeDecodeError as e:
+        error_handler.handle_error(
+            FileOperationError("Некорректная кодировка файла", file_path, "Загрузка JSON"),
+            "Загрузка JSON",
+            ErrorSeverity.ERROR,
+        )
+        raise UnicodeDecodeError(e.encoding, e.object, e.start, e.end, "Некорректная кодировка файла")
+    except Exception as e:
+        error = FileOperationError(str(e), file_path, "Загрузка JSON")
+        error_handler.handle_error(error, "Загрузка JSON", ErrorSeverity.ERROR)
+        raise error
+
+
 def load_json_file(file_path: str) -> Dict[str, Any]:
     """Загружает и парсит JSON файл.
 
     Загружает JSON файл по указанному пути и преобразует его в словарь Python.
     Поддерживает обработку файлов в кодировке UTF-8 и централизованно обрабатывает
-    все возможные исключения при чтении и парсинге.
+    все возможные исключения при чтении и парсинге. Если установлен orjson,
+    файл разбирается им (в несколько раз быстрее стандартного json).
+
+    Результаты разбора последних файлов кэшируются: повторная загрузка
+    неизмененного файла возвращает тот же объект без чтения и разбора.
+    Поэтому возвращаемые данные нельзя изменять на месте; если изменения
+    нужны, работайте с копией.
 
     Args:
         file_path: Полный путь к JSON файлу для загрузки.
@@ -212,43 +425,186 @@ def load_json_file(file_path: str) -> Dict[str, Any]:
         ...     print(f'Ошибка при загрузке файла: {e}')
         'Основной каталог'
     """
-    error_handler = ErrorHandler()
+    return _load_json_entry(file_path).data
+
+
+def load_json_result(file_path: str, processor_func: Callable[..., T], *args: Any) -> T:
+    """Возвращает результат обработки JSON файла, запоминая его вместе с файлом.
+
+    Результат processor_func(data, *args) хранится в записи кэша разобранного
+    файла (см. load_json_file). Пока файл не изменился и остается в кэше,
+    повторный вызов с той же функцией и аргументами возвращает запомненный
+    результат без повторной обработки. Результат общий для всех вызовов,
+    поэтому изменять его на месте нельзя.
+
+    Args:
+        file_path: Путь к JSON файлу.
+        processor_func: Функция обработки, принимающая данные файла первым аргументом.
+        *args: Дополнительные аргументы processor_func; должны быть хешируемыми.
+
+    Returns:
+        Результат processor_func для данных файла.
+
+    Raises:
+        FileNotFoundError: Если файл не найден.
+        JSONDecodeError: При некорректном формате JSON.
+        Exception: Исключения processor_func передаются без изменений и не кэшируются.
+
+    Examples:
+        >>> from pythonchik.services import extract_barcodes
+        >>> barcodes = load_json_result("catalog.json", extract_barcodes)
+    """
+    entry = _load_json_entry(file_path)
+    key = (processor_func, *args)
+    with _json_cache_lock:
+        if key in entry.results:
+            return entry.results[key]
+
+    # Обработка идет без блокировки, как и разбор файла
+    result = processor_func(entry.data, *args)
+    with _json_cache_lock:
+        return entry.results.setdefault(key, result)
+
+
+def _is_streamed_json(file_path: str) -> bool:
+    """Проверяет, разбирается ли файл потоково: установлен ijson и файл очень большой.
+
+    Raises:
+        FileNotFoundError: Если файл не найден (ошибка логируется, как в load_json_file).
+    """
+    if ijson is None:
+        return False
     try:
-        with open(file_path, encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError as e:
-        error_handler.handle_error(
+        return os.path.getsize(file_path) >= _JSON_STREAM_MIN_SIZE
+    except FileNotFoundError:
+        ErrorHandler().handle_error(
             FileOperationError("JSON файл не найден", file_path, "Загрузка JSON"),
             "Загрузка JSON",
             ErrorSeverity.ERROR,
         )
         raise FileNotFoundError("JSON файл не найден")
-    except json.JSONDecodeError as e:
+
+
+def _iter_json_stream(file_path: str, key: str) -> Iterator[Any]:
+    """Потоково перебирает элементы массива через ijson с обработкой ошибок load_json_file."""
+    error_handler = ErrorHandler()
+    try:
+        with open(file_path, "rb") as f:
+            # use_float: дробные числа - float, как при разборе orjson и json, а не Decimal
+            yield from ijson.items(f, f"{key}.item", use_float=True)
+    except FileNotFoundError:
         error_handler.handle_error(
-            FileOperationError("Некорректный формат JSON", file_path, "Загрузка JSON"),
+            FileOperationError("JSON файл не найден", file_path, "Загрузка JSON"),
             "Загрузка JSON",
             ErrorSeverity.ERROR,
         )
-        raise json.JSONDecodeError("Некорректный формат JSON", e.doc, e.pos)
-    except UnicodeDecodeError as e:
+        raise FileNotFoundError("JSON файл не найден")
+    except ijson.JSONError as e:
         error_handler.handle_error(
-            FileOperationError("Некорректная кодировка файла", file_path, "Загрузка JSON"),
+            FileOperationError("Некорректный формат JSON", file_path, "Загрузка JSON"),
             "Загрузка JSON",
             ErrorSeverity.ERROR,
         )
-        raise UnicodeDecodeError(e.encoding, e.object, e.start, e.end, "Некорректная кодировка файла")
-    except Exception as e:
-        error = FileOperationError(str(e), file_path, "Загрузка JSON")
-        error_handler.handle_error(error, "Загрузка JSON", ErrorSeverity.ERROR)
-        raise error
+        raise json.JSONDecodeError("Некорректный формат JSON", "", 0) from e
+
+
+def iter_json_items(file_path: str, key: str) -> Iterator[Any]:
+    """Перебирает элементы массива верхнего уровня JSON файла.
+
+    Файлы от 64 МиБ при установленном ijson разбираются потоково: в памяти
+    находится один элемент массива, а не весь документ. Остальные файлы
+    загружаются через load_json_file (orjson и кэш разобранных файлов).
+    Числа в обоих случаях одного типа: целые - int, дробные - float.
+
+    Args:
+        file_path: Путь к JSON файлу.
+        key: Ключ массива в объекте верхнего уровня, например "offers".
+
+    Yields:
+        Элементы массива по порядку. Если ключа нет, элементов нет.
+
+    Raises:
+        FileNotFoundError: Если файл не найден.
+        JSONDecodeError: При некорректном формате JSON.
+
+    Examples:
+        >>> total = sum(1 for _ in iter_json_items("catalog.json", "offers"))
+    """
+    if _is_streamed_json(file_path):
+        yield from _iter_json_stream(file_path, key)
+        return
+    yield from load_json_file(file_path).get(key, [])
+
+
+def _process_json_items(data: Any, key: str, processor_func: Callable[[Iterable[Any]], T]) -> T:
+    """Применяет processor_func к массиву data[key] (для кэширования в load_json_result)."""
+    return processor_func(data.get(key, []))
+
+
+def process_json_items(file_path: str, key: str, processor_func: Callable[[Iterable[Any]], T]) -> T:
+    """Обрабатывает элементы массива JSON файла, кэшируя результат для небольших файлов.
+
+    Файлы, которые iter_json_items разбирает потоково, обрабатываются по одному
+    элементу, и результат не кэшируется: кэш держал бы в памяти весь документ.
+    Для остальных файлов результат запоминается вместе с файлом, как в
+    load_json_result, поэтому processor_func должна быть одной и той же функцией
+    (например, функцией модуля), а ее результат нельзя изменять на месте.
+
+    Args:
+        file_path: Путь к JSON файлу.
+        key: Ключ массива в объекте верхнего уровня, например "offers".
+        processor_func: Функция, принимающая итерируемые элементы массива.
+
+    Returns:
+        Результат processor_func.
+
+    Raises:
+        FileNotFoundError: Если файл не найден.
+        JSONDecodeError: При некорректном формате JSON.
+
+    Examples:
+        >>> total = process_json_items("catalog.json", "offers", lambda offers: sum(1 for _ in offers))
+    """
+    if _is_streamed_json(file_path):
+        return processor_func(_iter_json_stream(file_path, key))
+    return load_json_result(file_path, _process_json_items, key, processor_func)
+
+
+def save_json_file(data: Any, output_path: str) -> str:
+    """Сохраняет данные в JSON файл с отступом в два пробела.
+
+    Данные сериализуются один раз (через orjson, если он установлен), и
+    готовый текст записывается в файл в кодировке UTF-8 без экранирования
+    не-ASCII символов.
+
+    Args:
+        data: Данные для сохранения.
+        output_path: Путь к создаваемому файлу.
+
+    Returns:
+        Записанный JSON-текст, например для показа пользователю.
+
+    Examples:
+        >>> text = save_json_file({"offers": []}, "test.json")
+    """
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    with open(output_path, "wb") as f:
+        f.write(content)
+    return content.decode("utf-8")
 
 
 def create_archive(files: List[str], archive_path: str) -> None:
     """Создает ZIP-архив с указанными файлами.
 
     Создает ZIP-архив и добавляет в него все указанные файлы, используя сжатие
-    DEFLATED для уменьшения размера. Автоматически создает директорию для архива,
-    если она не существует, и предварительно проверяет существование всех файлов.
+    DEFLATED для уменьшения размера. Уже сжатые форматы (PNG, JPEG, WebP, GIF, ZIP)
+    записываются без сжатия: deflate для них почти не дает выигрыша в размере,
+    но занимает большую часть времени создания архива. Автоматически создает
+    директорию для архива, если она не существует, и предварительно проверяет
+    существование всех файлов.
 
     Args:
         files: Список путей к файлам для включения в архив.
@@ -284,8 +640,11 @@ def create_archive(files: List[str], archive_path: str) -> None:
         # Создаем архив только если все файлы существуют
         with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
             for file_path in files:
-                arcname = Path(file_path).name
-                zipf.write(file_path, arcname=arcname)
+                file_path_obj = Path(file_path)
+                compress_type = (
+                    zipfile.ZIP_STORED if file_path_obj.suffix.lower() in _STORED_ARCHIVE_SUFFIXES else None
+                )
+                zipf.write(file_path, arcname=file_path_obj.name, compress_type=compress_type)
     except FileNotFoundError:
         # Пробрасываем исключение FileNotFoundError напрямую
         raise
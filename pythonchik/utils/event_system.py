@@ -20,10 +20,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from functools import wraps
+from itertools import count
 from queue import PriorityQueue
 from threading import Lock
 from time import time
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
@@ -168,10 +169,15 @@ class EventBus:
         if not hasattr(self, "_initialized"):
             self._logger = logging.getLogger(__name__)
             self._lock = Lock()
-            self._queue = PriorityQueue()  # Храним события (Event)
-            self._handlers: Dict[EventType, List[EventHandler]] = {}
+            # Храним кортежи (priority_key, порядковый_номер, Event): кортежи сравниваются
+            # на уровне C по первым двум полям, и Event.__lt__ не вызывается
+            self._queue: PriorityQueue = PriorityQueue()
+            self._seq = count()
+            # Кортежи неизменяемы: писатели под локом подменяют кортеж целиком,
+            # а _handle_event берет его одной ссылкой, без лока и копирования
+            self._handlers: Dict[EventType, Tuple[EventHandler, ...]] = {}
             for et in EventType:
-                self._handlers[et] = []  # Инициализируем списки обработчиков
+                self._handlers[et] = ()
             self._error_handlers: List[Callable[[Exception], None]] = []
             self._processing = False
             self._initialized = True
@@ -184,9 +190,7 @@ class EventBus:
             handler (EventHandler): Обработчик события.
         """
         with self._lock:
-            if event_type not in self._handlers:
-                self._handlers[event_type] = []
-            self._handlers[event_type].append(handler)
+            self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
             self._logger.debug(f"Подписка на {event_type}: {handler.__class__.__name__}")
 
     def unsubscribe(self, event_type: EventType, handler: EventHandler) -> None:
@@ -199,7 +203,7 @@ class EventBus:
         with self._lock:
             if event_type in self._handlers:
                 before_count = len(self._handlers[event_type])
-                self._handlers[event_type] = [h for h in self._handlers[event_type] if h != handler]
+                self._handlers[event_type] = tuple(h for h in self._handlers[event_type] if h != handler)
                 after_count = len(self._handlers[event_type])
                 self._logger.debug(
                     f"Отписка от {event_type}: {handler.__class__.__name__}. "
@@ -217,7 +221,7 @@ class EventBus:
                 произойдёт при явном вызове _process_queue() или в другой момент.
         """
         self._logger.debug(f"Публикую событие: {event.type}, ID={event.id}, приоритет={event.type.priority}")
-        self._queue.put(event)
+        self._queue.put((event.priority_key, next(self._seq), event))
 
         # Если immediate=True и сейчас не идёт обработка, запускаем _process_queue()
         if immediate and not self._processing:
@@ -228,7 +232,7 @@ class EventBus:
         self._processing = True
         try:
             while not self._queue.empty():
-                event = self._queue.get()
+                _, _, event = self._queue.get()
                 self._logger.debug(f"Взяли событие из очереди: {event.type}, ID={event.id}")
                 self._handle_event(event)
         finally:
@@ -237,9 +241,8 @@ class EventBus:
 
     def _handle_event(self, event: Event) -> None:
         """Внутренняя обработка одного события, вызывает подписчиков."""
-        with self._lock:
-            # Копируем список подписчиков под локом, а вызываем колбэки уже вне лока.
-            handlers = self._handlers.get(event.type, [])[:]
+        # Снимок подписчиков: кортеж, который писатели подменяют целиком
+        handlers = self._handlers.get(event.type, ())
 
         self._logger.debug(f"Обработка события {event.type}, подписчиков: {len(handlers)}, ID={event.id}")
 
@@ -278,7 +281,7 @@ class EventBus:
         """Удаляет все зарегистрированные обработчики событий и ошибок."""
         with self._lock:
             for et in self._handlers:
-                self._handlers[et].clear()
+                self._handlers[et] = ()
             self._error_handlers.clear()
             self._logger.debug("Очищены все обработчики событий и ошибок.")
 
@@ -293,5 +296,5 @@ class EventBus:
         """
         with self._lock:
             if event_type:
-                return len(self._handlers.get(event_type, []))
+                return len(self._handlers.get(event_type, ()))
             return sum(len(hlist) for hlist in self._handlers.values())
@@ -12,6 +12,9 @@
 Классы:
 - ImageProcessor: Основной класс для обработки изображений
 
+Функции:
+- configure_image_block_cache: Настройка кэша памяти растров Pillow под пул потоков
+
 Примеры:
     Изменение размера одного изображения:
 
@@ -26,10 +29,18 @@
 
     >>> files = ["input/img1.jpg", "input/img2.png", "input/img3.jpeg"]
     >>> ImageProcessor.compress_multiple_images(files, "output/")
+
+    Параллельная обработка нескольких изображений:
+
+    >>> ImageProcessor.resize_images(files, "output/")
 """
 
+import io
 import os
+import shutil
 from collections.abc import Callable
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -39,6 +50,82 @@ from pythonchik import config
 from pythonchik.errors.error_handlers import ErrorHandler, ErrorSeverity, ImageProcessingError
 from pythonchik.utils.metrics import count_calls, track_timing
 
+# Параметры обработки читаются из конфигурации один раз при импорте,
+# а не поиском атрибута модуля config на каждый файл пакета
+_RESIZE_RATIO = config.IMAGE_RESIZE_RATIO
+_PNG_COMPRESS_LEVEL = config.PNG_COMPRESS_LEVEL
+
+# Сигнатура, с которой начинается любой PNG-файл
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _is_png(path: str) -> bool:
+    """Проверяет по сигнатуре, что файл действительно в формате PNG.
+
+    Args:
+        path: Путь к файлу.
+
+    Returns:
+        True, если файл начинается с сигнатуры PNG.
+    """
+    with open(path, "rb") as f:
+        return f.read(len(_PNG_SIGNATURE)) == _PNG_SIGNATURE
+
+
+def _write_file(path: str, data: memoryview) -> None:
+    """Записывает содержимое в файл напрямую через файловый дескриптор.
+
+    Готовое содержимое файла пишется вызовами os.write без буферизованного
+    файлового объекта Python; для небольших файлов это обычно один системный вызов.
+
+    Args:
+        path: Путь к файлу. Существующий файл перезаписывается.
+        data: Содержимое файла.
+    """
+    # На Windows без O_BINARY дескриптор открывается в текстовом режиме и \n превращается в \r\n
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while data:
+            # os.write может записать только часть данных
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+
+
+def _png_output_path(output_dir: str, image_path: str) -> str:
+    """Возвращает путь PNG-файла для изображения в выходной директории.
+
+    Путь собирается строками через os.path, без промежуточных объектов Path:
+    функция вызывается для каждого файла пакета.
+
+    Args:
+        output_dir: Директория для сохранения результата.
+        image_path: Путь к исходному изображению.
+
+    Returns:
+        Путь вида <output_dir>/<имя исходного файла без расширения>.png.
+    """
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    return os.path.join(output_dir, stem + ".png")
+
+
+def configure_image_block_cache(workers: int) -> None:
+    """Включает повторное использование памяти растров Pillow.
+
+    Pillow выделяет растры блоками и по умолчанию сразу возвращает
+    освобожденные блоки системе. Увеличенный кэш блоков позволяет растрам
+    следующих файлов занимать уже выделенную память без повторных mmap/munmap.
+    Размер кэша - глобальная настройка Pillow, поэтому она задается один раз
+    при запуске под размер общего пула обработки изображений, а не на время
+    каждого пакета. Текущий размер кэша никогда не уменьшается.
+
+    Args:
+        workers: Количество потоков, одновременно обрабатывающих изображения.
+    """
+    Image.core.set_blocks_max(
+        max(Image.core.get_blocks_max(), workers * config.IMAGE_CACHED_BLOCKS_PER_WORKER)
+    )
+
 
 class ImageProcessor:
     """Класс для обработки и манипуляции изображениями.
@@ -53,7 +140,7 @@ class ImageProcessor:
 
     Note:
         - Поддерживает форматы: JPEG, PNG, GIF, BMP, TIFF и другие (через Pillow)
-        - Использует оптимизацию и настраиваемое качество из конфигурации
+        - Использует настраиваемые коэффициент уменьшения и уровень сжатия из конфигурации
         - Предоставляет коллбэки для отслеживания прогресса выполнения
         - Интегрируется с системой обработки ошибок приложения
     """
@@ -70,8 +157,10 @@ class ImageProcessor:
         """Изменяет размер изображения и сохраняет в формате PNG.
 
         Загружает изображение из указанного пути, изменяет его размер в соответствии
-        с коэффициентом IMAGE_RESIZE_RATIO из конфигурации, оптимизирует и сохраняет
-        в указанную директорию в формате PNG с настраиваемым качеством.
+        с коэффициентом IMAGE_RESIZE_RATIO из конфигурации и сохраняет в указанную
+        директорию в формате PNG с уровнем сжатия PNG_COMPRESS_LEVEL. Многопроходная
+        оптимизация (optimize) не используется: она в разы дороже однократного
+        кодирования, а результат все равно упаковывается в архив.
 
         Args:
             image_path: Путь к исходному изображению, которое нужно обработать.
@@ -97,14 +186,16 @@ class ImageProcessor:
             ...                            progress_callback=on_progress)
         """
         try:
-            output_dir_path = Path(output_dir)
-            if not output_dir_path.exists():
+            # Пути собираются строками через os.path: при пакетной обработке тысяч файлов
+            # создание и нормализация объектов Path заметны на фоне маленьких изображений
+            file_name = os.path.basename(image_path)
+            if not os.path.exists(output_dir):
                 raise ImageProcessingError(
                     f"Директория не существует: {output_dir}",
                     image_path="none",
                     operation="Проверка директории",
                 )
-            if not os.access(str(output_dir_path), os.W_OK):
+            if not os.access(output_dir, os.W_OK):
                 raise ImageProcessingError(
                     f"Нет прав на запись в директорию: {output_dir}",
                     image_path="none",
@@ -112,20 +203,23 @@ class ImageProcessor:
                 )
 
             if progress_callback is not None:
-                progress_callback(0, f"Обработка {Path(image_path).name}...")
+                progress_callback(0, f"Обработка {file_name}...")
 
             with Image.open(image_path) as im:
-                width, height = im.size
-                new_size = (
-                    width // config.IMAGE_RESIZE_RATIO,
-                    height // config.IMAGE_RESIZE_RATIO,
-                )
-                with im.resize(new_size) as resized_image:
-                    output_path = output_dir_path / f"{Path(image_path).stem}.png"
-                    resized_image.save(output_path, optimize=True, quality=config.IMAGE_QUALITY)
+                resized_image = ImageProcessor._downscale(im)
+                try:
+                    output_path = _png_output_path(output_dir, image_path)
+                    # Кодируем в память и записываем файл целиком одним вызовом
+                    buffer = io.BytesIO()
+                    resized_image.save(buffer, format="PNG", compress_level=_PNG_COMPRESS_LEVEL)
+                    _write_file(output_path, buffer.getbuffer())
+                finally:
+                    # Исходное изображение закрывает with, промежуточное - закрываем сами
+                    if resized_image is not im:
+                        resized_image.close()
 
-                    if progress_callback is not None:
-                        progress_callback(100, f"Обработано {Path(image_path).name}")
+                if progress_callback is not None:
+                    progress_callback(100, f"Обработано {file_name}")
 
         except FileNotFoundError:
             error = ImageProcessingError(
@@ -149,6 +243,81 @@ class ImageProcessor:
                 error_handler.handle_error(error, "Изменение размера изображения", ErrorSeverity.ERROR)
             raise error
 
+    @staticmethod
+    def _downscale(im: Image.Image) -> Image.Image:
+        """Уменьшает изображение в IMAGE_RESIZE_RATIO раз.
+
+        Сначала вызывается Image.draft: декодер JPEG сразу получает изображение
+        в 2, 4 или 8 раз меньше (масштабированное IDCT), пропуская большую часть
+        работы декодирования; для других форматов вызов ничего не делает. Если
+        draft дал точный целевой размер, дальнейшая обработка не нужна, иначе
+        уменьшенное декодером изображение доводится до размера BILINEAR.
+
+        Без draft при целом коэффициенте используется Image.reduce: усреднение блоков
+        пикселей на целых числах, намного дешевле ресемплинга. Область
+        источника обрезается до кратной коэффициенту, чтобы размер результата
+        совпадал с width // ratio. Для дробного коэффициента используется BILINEAR
+        с reducing_gap: Pillow сначала дешево уменьшает изображение, а затем
+        ресемплирует результат меньшего размера.
+
+        Изображения в режимах, отличных от RGB, RGBA и L, перед уменьшением
+        приводятся к одному из них (см. _resample_source).
+
+        Args:
+            im: Исходное изображение, еще не загруженное (сразу после Image.open).
+
+        Returns:
+            Уменьшенное изображение. Может быть тем же объектом im, если
+            уменьшение целиком выполнил декодер.
+        """
+        ratio = _RESIZE_RATIO
+        width, height = im.size
+        new_width, new_height = int(width // ratio), int(height // ratio)
+
+        if new_width and new_height:
+            im.draft(im.mode, (new_width, new_height))
+
+        source = ImageProcessor._resample_source(im)
+        if source.size == (new_width, new_height):
+            return source
+
+        if source.size != (width, height):
+            resized = source.resize((new_width, new_height), resample=Image.Resampling.BILINEAR)
+        elif isinstance(ratio, int):
+            resized = source.reduce(ratio, box=(0, 0, new_width * ratio, new_height * ratio))
+        else:
+            resized = source.resize(
+                (new_width, new_height), resample=Image.Resampling.BILINEAR, reducing_gap=2.0
+            )
+
+        if source is not im:
+            source.close()
+        return resized
+
+    @staticmethod
+    def _resample_source(im: Image.Image) -> Image.Image:
+        """Приводит изображение к режиму с быстрым путем ресемплинга.
+
+        Для RGB, RGBA и L у reduce и resize есть векторизованные реализации
+        (в Pillow-SIMD - на AVX2). Палитровые, CMYK и прочие режимы
+        либо обрабатываются медленным попиксельным путем, либо не
+        поддерживаются вовсе, поэтому они конвертируются: в RGBA, если у
+        изображения есть прозрачность (результат сохраняется в PNG и должен
+        ее сохранить), иначе в RGB.
+
+        Args:
+            im: Исходное изображение.
+
+        Returns:
+            Изображение в режиме RGB, RGBA или L. Тот же объект im, если
+            конвертация не нужна.
+        """
+        if im.mode in ("RGB", "RGBA", "L"):
+            return im
+        if im.mode in ("LA", "PA") or "transparency" in im.info:
+            return im.convert("RGBA")
+        return im.convert("RGB")
+
     @staticmethod
     @track_timing(name="compress_multiple_images")
     @count_calls()
@@ -191,8 +360,7 @@ class ImageProcessor:
             ... )
         """
         processed_files = []
-        output_dir_path = Path(output_dir)
-        output_dir_path.mkdir(exist_ok=True)
+        Path(output_dir).mkdir(exist_ok=True)
 
         total_files = len(files)
         for i, file_path in enumerate(files, 1):
@@ -201,11 +369,10 @@ class ImageProcessor:
                     progress = (i / total_files) * 100
                     progress_callback(progress, f"Обработка файла {i}/{total_files}")
 
-                output_path = output_dir_path / f"{Path(file_path).stem}.png"
                 # Используем resize_image внутри try-except для обработки любых ошибок
                 try:
-                    ImageProcessor.resize_image(file_path, str(output_dir_path), progress_callback)
-                    processed_files.append(output_path)
+                    ImageProcessor.resize_image(file_path, output_dir, progress_callback)
+                    processed_files.append(Path(_png_output_path(output_dir, file_path)))
                 except (FileNotFoundError, ImageProcessingError, PermissionError, OSError) as exc:
                     # Логируем ошибку через callback, если он доступен
                     if progress_callback is not None:
@@ -221,6 +388,79 @@ class ImageProcessor:
 
         return processed_files
 
+    @staticmethod
+    @track_timing(name="resize_images")
+    @count_calls()
+    def resize_images(
+        paths: List[str],
+        output_dir: str,
+        progress_callback: Optional[Callable[[float, str], Any]] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[Path]:
+        """Параллельно изменяет размер нескольких изображений.
+
+        Вызывает resize_image для каждого файла в пуле потоков. Pillow отпускает
+        GIL на время ресемплинга и кодирования, поэтому потоки загружают все ядра
+        без накладных расходов на процессы. Как и compress_multiple_images,
+        ошибки отдельных файлов не прерывают обработку остальных.
+
+        Args:
+            paths: Список путей к файлам изображений для обработки.
+            output_dir: Директория для сохранения обработанных изображений.
+            progress_callback: Опциональная функция обратного вызова для отслеживания прогресса.
+                Принимает параметры (прогресс от 0 до 100 или -1 при ошибке, сообщение о статусе)
+                и вызывается в потоке, запустившем resize_images.
+            max_workers: Количество рабочих потоков. По умолчанию os.cpu_count().
+            executor: Готовый пул потоков (например, ApplicationCore.image_executor).
+                Если передан, файлы обрабатываются в нем, и пул не закрывается
+                после обработки; иначе создается временный пул на max_workers потоков.
+
+        Returns:
+            Список путей к успешно обработанным файлам в порядке входного списка.
+
+        Examples:
+            >>> files = ["image1.jpg", "image2.png", "image3.jpeg"]
+            >>> processed = ImageProcessor.resize_images(
+            ...     files, "output/", progress_callback=lambda p, msg: print(f"{p:.0f}%: {msg}")
+            ... )
+        """
+        output_dir_path = Path(output_dir)
+        output_dir_path.mkdir(exist_ok=True)
+        # Рабочим потокам передается готовая строка, а не Path
+        output_dir_str = os.fspath(output_dir_path)
+
+        total_files = len(paths)
+        if not total_files:
+            return []
+
+        workers = max_workers or os.cpu_count() or 1
+        succeeded = [False] * total_files
+        pool = nullcontext(executor) if executor is not None else ThreadPoolExecutor(max_workers=workers)
+        with pool as pool_executor:
+            futures = {
+                pool_executor.submit(ImageProcessor.resize_image, file_path, output_dir_str): i
+                for i, file_path in enumerate(paths)
+            }
+            for completed, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                file_path = paths[index]
+                try:
+                    future.result()
+                except Exception as e:
+                    # Ошибка одного файла не прерывает обработку остальных
+                    if progress_callback is not None:
+                        progress_callback(-1, f"Ошибка обработки {file_path}: {str(e)}")
+                    continue
+
+                succeeded[index] = True
+                if progress_callback is not None:
+                    progress_callback(completed / total_files * 100, f"Обработано {completed}/{total_files}")
+
+        return [
+            Path(_png_output_path(output_dir_str, file_path)) for file_path, ok in zip(paths, succeeded) if ok
+        ]
+
     @staticmethod
     @track_timing(name="convert_format")
     @count_calls()
@@ -229,7 +469,8 @@ class ImageProcessor:
 
         Выполняет конвертацию изображения из любого поддерживаемого формата в формат PNG,
         сохраняя оригинальные размеры и максимальное качество. Перед сохранением проверяет
-        существование выходной директории и наличие прав на запись.
+        существование выходной директории и наличие прав на запись. Файлы, которые уже
+        являются PNG, копируются без перекодирования.
 
         Args:
             input_path: Путь к исходному изображению любого поддерживаемого формата.
@@ -252,14 +493,19 @@ class ImageProcessor:
         """
         try:
             # Проверка существования директории и прав на запись
-            output_dir = Path(output_path).parent
-            if not output_dir.exists():
+            output_dir = os.path.dirname(output_path) or os.curdir
+            if not os.path.exists(output_dir):
                 raise PermissionError(f"Директория не существует: {output_dir}")
-            if not os.access(str(output_dir), os.W_OK):
+            if not os.access(output_dir, os.W_OK):
                 raise PermissionError(f"Нет прав на запись в директорию: {output_dir}")
 
+            # Файл уже в PNG: копируем байты без декодирования и повторного сжатия
+            if os.path.splitext(input_path)[1].lower() == ".png" and _is_png(input_path):
+                shutil.copyfile(input_path, output_path)
+                return
+
             with Image.open(input_path) as img:
-                img.save(output_path, format="PNG")
+                img.save(output_path, format="PNG", compress_level=_PNG_COMPRESS_LEVEL)
         except FileNotFoundError:
             raise FileNotFoundError(f"Файл не найден: {input_path}")
         except PermissionError as e:
@@ -270,17 +516,28 @@ class ImageProcessor:
     @staticmethod
     @track_timing(name="convert_multiple_images")
     @count_calls()
-    def convert_multiple_images(files: List[str], output_dir: str) -> None:
+    def convert_multiple_images(
+        files: List[str],
+        output_dir: str,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
         """Выполняет пакетную конвертацию изображений в формат PNG.
 
-        Последовательно конвертирует все изображения из предоставленного списка
-        в формат PNG и сохраняет их в указанную директорию. В отличие от
-        метода compress_multiple_images, при возникновении ошибки обработка
-        прерывается и выбрасывается исключение.
+        Параллельно конвертирует все изображения из предоставленного списка
+        в формат PNG и сохраняет их в указанную директорию. Как и в resize_images,
+        используются потоки: Pillow отпускает GIL на время декодирования и
+        кодирования. В отличие от метода compress_multiple_images, при
+        возникновении ошибки обработка прерывается: еще не начатые конвертации
+        отменяются и выбрасывается исключение для первого по списку
+        проблемного файла.
 
         Args:
             files: Список путей к файлам изображений для конвертации.
             output_dir: Директория для сохранения конвертированных файлов.
+            max_workers: Количество рабочих потоков. По умолчанию os.cpu_count().
+            executor: Готовый пул потоков (например, ApplicationCore.image_executor).
+                Если передан, пул не закрывается после обработки.
 
         Raises:
             OSError: При любой ошибке в процессе конвертации (включая FileNotFoundError
@@ -296,10 +553,20 @@ class ImageProcessor:
             >>> jpg_files = glob.glob("photos/*.jpg")
             >>> ImageProcessor.convert_multiple_images(jpg_files, "converted")
         """
-        for file_path in files:
-            try:
-                ImageProcessor.convert_format(
-                    file_path, str(Path(output_dir) / f"{Path(file_path).stem}.png")
+        output_dir_str = os.fspath(output_dir)
+        workers = max_workers or os.cpu_count() or 1
+        pool = nullcontext(executor) if executor is not None else ThreadPoolExecutor(max_workers=workers)
+        with pool as pool_executor:
+            futures = [
+                pool_executor.submit(
+                    ImageProcessor.convert_format, file_path, _png_output_path(output_dir_str, file_path)
                 )
-            except (FileNotFoundError, PermissionError, OSError) as e:
-                raise OSError(f"Не удалось обработать изображение {file_path}: {str(e)}")
+                for file_path in files
+            ]
+            for file_path, future in zip(files, futures):
+                try:
+                    future.result()
+                except (FileNotFoundError, PermissionError, OSError) as e:
+                    for pending in futures:
+                        pending.cancel()
+                    raise OSError(f"Не удалось обработать изображение {file_path}: {str(e)}")
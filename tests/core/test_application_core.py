@@ -355,3 +355,16 @@ def test_worker_crash_recovery(app_core, event_bus):
     finally:
         # Останавливаем приложение в любом случае
         app_core.stop()
+
+
+def test_submit_image_task_uses_shared_executor(app_core):
+    """Задачи обработки изображений выполняются в общем пуле ядра.
+
+    Args:
+        app_core: Фикстура, предоставляющая экземпляр ApplicationCore.
+    """
+    future = app_core.submit_image_task(lambda a, b=0: (threading.current_thread().name, a + b), 1, b=2)
+
+    thread_name, result = future.result(timeout=2.0)
+    assert result == 3
+    assert thread_name.startswith("img")
@@ -204,6 +204,22 @@ def test_state_history(state_manager, mock_event_bus):
         assert event.data["new_state"] == transitions[i]
 
 
+def test_state_history_recording(mock_event_bus):
+    """Проверяем, что история переходов сохраняется только при record_history=True."""
+    manager = ApplicationStateManager(mock_event_bus)
+    manager.update_state(ApplicationState.IDLE)
+    assert manager.state_history == ()
+
+    recording_manager = ApplicationStateManager(mock_event_bus, record_history=True)
+    recording_manager.update_state(ApplicationState.IDLE)
+    recording_manager.update_state(ApplicationState.PROCESSING)
+    assert recording_manager.state_history == (
+        ApplicationState.INITIALIZING,
+        ApplicationState.IDLE,
+        ApplicationState.PROCESSING,
+    )
+
+
 def test_thread_safety(state_manager):
     """Проверяем потокобезопасность обновления состояния."""
 
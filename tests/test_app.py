@@ -68,3 +68,29 @@ def test_select_frame_by_name(app):
 
     app.select_frame_by_name("image")
     assert app.navigation_frame.current_tab == "image"
+
+
+def test_compare_prices_counts_offers_per_file(app, tmp_path):
+    """Test that differing and total offers share the per-file basis across several files."""
+    files = []
+    for name in ("first.json", "second.json"):
+        path = tmp_path / name
+        offers = [
+            {"description": "Product A", "price_new": 100},
+            {"description": "Product A", "price_new": 150},
+            {"description": "Product B", "price_new": 200},
+        ]
+        path.write_text(json.dumps({"offers": offers}), encoding="utf-8")
+        files.append(str(path))
+
+    with (
+        patch("pythonchik.ui.app.fd.askopenfilenames", return_value=files),
+        patch.object(app, "_run_in_background") as run_in_background,
+    ):
+        app.compare_prices()
+
+    task, _ = run_in_background.call_args.args
+    price_diffs, total_count, total_offers = task()
+    assert price_diffs == [50, 50]
+    assert (total_count, total_offers) == (2, 4)
+    assert total_count <= total_offers
@@ -23,6 +23,7 @@ from pythonchik.errors.error_handlers import (
     ErrorHandler,
     FileOperationError,
     ImageProcessingError,
+    UIErrorHandler,
 )
 
 
@@ -298,3 +299,172 @@ def test_error_handler_no_recovery_action_for_app_error():
     # внутри handle_error -> _get_default_recovery_action(err)
     # err - AppError, type(err).__name__ = 'AppError' -> не в словаре => "Обратитесь к документации..."
     assert "Обратитесь к документации или администратору" in logged_msg
+
+
+def test_error_handler_skips_formatting_when_level_disabled():
+    """
+    Если логгер не пропустит запись с таким уровнем,
+    колбэк по умолчанию не вызывается и сообщение не форматируется.
+    """
+    handler = ErrorHandler()
+    ctx = ErrorContext(operation="Op", details={"key": "value"}, severity=ErrorSeverity.ERROR)
+    err = AppError("Lazy error", context=ctx)
+
+    with (
+        patch.object(ErrorHandler, "logger") as mock_logger,
+        patch.object(AppError, "format_message") as mock_format,
+    ):
+        mock_logger.isEnabledFor.return_value = False
+        handler.handle_error(err, operation="Op")
+
+    mock_format.assert_not_called()
+    mock_logger.log.assert_not_called()
+
+
+def test_app_error_format_message_is_cached():
+    """Проверяем, что format_message вычисляется один раз и затем берется из кэша."""
+    ctx = ErrorContext(operation="Op", details={"key": "value"}, severity=ErrorSeverity.ERROR)
+    err = AppError("Cached error", context=ctx)
+
+    first = err.format_message()
+    assert err._formatted == first
+    assert err.format_message() is first
+    assert str(err) is first
+
+
+def test_default_logging_uses_severity_level():
+    """Без колбэка ошибка пишется одной записью с уровнем, соответствующим severity."""
+    handler = ErrorHandler()
+    err = ValueError("Предупреждение")
+
+    with patch.object(ErrorHandler, "logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = True
+        handler.handle_error(err, operation="Op", severity=ErrorSeverity.WARNING)
+
+    mock_logger.log.assert_called_once()
+    args, kwargs = mock_logger.log.call_args
+    assert args[0] == logging.WARNING
+    assert args[1] % args[2:] == "[WARNING] Op: Предупреждение"
+    assert kwargs["extra"]["component"] is None
+    assert kwargs["extra"]["operation"] == "Op"
+    record = kwargs["extra"]["extra_fields"]
+    assert record["details"] == {"error_type": "ValueError"}
+    assert record["recovery"] == "Проверьте корректность введённых данных"
+
+
+def test_specialised_handler_logs_once():
+    """UIErrorHandler пишет ровно одну запись с компонентом и трассировкой."""
+    handler = UIErrorHandler()
+    err = ValueError("UI failure")
+
+    with patch.object(UIErrorHandler, "logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = True
+        handler.handle_error(err, operation="Нажатие кнопки")
+
+    mock_logger.log.assert_called_once()
+    _, kwargs = mock_logger.log.call_args
+    assert kwargs["extra"]["component"] == "UI"
+    assert kwargs["exc_info"] == (ValueError, err, err.__traceback__)
+
+
+def test_app_error_attributes_live_in_slots():
+    """Атрибуты AppError и подклассов хранятся в слотах, а не в __dict__."""
+    err = FileOperationError("Нет доступа", path="/tmp/x")
+    assert err.message == "Нет доступа"
+    assert err.__dict__ == {}
+    assert FileOperationError.__slots__ == ()
+
+
+def test_handle_error_does_not_mutate_app_error():
+    """handle_error дополняет копию контекста и не меняет исходную ошибку."""
+    ctx = ErrorContext(operation="Op", details={"initial": "detail"}, severity=ErrorSeverity.WARNING)
+    err = AppError("Original", context=ctx)
+    before = err.format_message()
+
+    mock_log_callback = MagicMock()
+    handler = ErrorHandler(log_callback=mock_log_callback)
+    handler.handle_error(err, operation="Op", additional_context={"extra": "info"})
+    handler.handle_error(err, operation="Op", additional_context={"extra": "info"})
+
+    assert ctx.details == {"initial": "detail"}
+    assert err.format_message() == before
+    logged_msg, _ = mock_log_callback.call_args[0]
+    assert "extra: info" in logged_msg
+
+
+def test_default_recovery_action_follows_mro():
+    """Подкласс известной ошибки получает действие восстановления базового класса."""
+    import json
+
+    handler = ErrorHandler()
+    try:
+        json.loads("{")
+    except json.JSONDecodeError as e:
+        action = handler._get_default_recovery_action(e)
+
+    assert action == "Проверьте корректность введённых данных"
+
+
+def test_error_context_details_are_read_only():
+    """Детали контекста копируются и не могут быть изменены после создания."""
+    source = {"key": "value"}
+    ctx = ErrorContext(operation="Op", details=source, severity=ErrorSeverity.INFO)
+    source["key"] = "changed"
+
+    assert ctx.details == {"key": "value"}
+    with pytest.raises(TypeError):
+        ctx.details["key"] = "other"  # type: ignore[index]
+
+
+def test_error_handler_skips_context_when_level_disabled():
+    """При отключенном уровне обработчик не строит ErrorContext для ошибки."""
+    handler = ErrorHandler()
+
+    with (
+        patch.object(ErrorHandler, "logger") as mock_logger,
+        patch("pythonchik.errors.error_handlers.ErrorContext") as mock_context,
+    ):
+        mock_logger.isEnabledFor.return_value = False
+        handler.handle_error(ValueError("ignored"), operation="Op", severity=ErrorSeverity.INFO)
+
+    mock_context.assert_not_called()
+
+
+def test_app_error_to_record():
+    """to_record возвращает поля ошибки без склейки в строку."""
+    ctx = ErrorContext(
+        operation="Op", details={"key": "value"}, severity=ErrorSeverity.ERROR, recovery_action="Retry"
+    )
+    record = AppError("Failure", context=ctx).to_record()
+
+    assert record == {
+        "severity": "ERROR",
+        "operation": "Op",
+        "message": "Failure",
+        "details": {"key": "value"},
+        "recovery": "Retry",
+    }
+    assert AppError("Bare").to_record()["message"] == "Bare"
+
+
+def test_error_context_interns_operation():
+    """Одинаковые названия операций разделяют один объект строки."""
+    name_a = "".join(["Обработка ", "данных"])
+    name_b = "".join(["Обработка", " данных"])
+    first = ErrorContext(operation=name_a, details={}, severity=ErrorSeverity.INFO)
+    second = ErrorContext(operation=name_b, details={}, severity=ErrorSeverity.INFO)
+    assert first.operation is second.operation
+
+
+def test_handle_error_accepts_context_kwargs():
+    """Детали можно передать именованными аргументами вместо словаря."""
+    mock_log_callback = MagicMock()
+    handler = ErrorHandler(log_callback=mock_log_callback)
+
+    handler.handle_error(
+        KeyError("foo"), "Access dictionary", additional_context={"source": "cache"}, file_path="a.json"
+    )
+
+    logged_msg, _ = mock_log_callback.call_args[0]
+    assert "source: cache" in logged_msg
+    assert "file_path: a.json" in logged_msg
@@ -12,12 +12,14 @@
 """
 
 import logging
+import threading
+from dataclasses import dataclass, field
 from queue import Queue
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pythonchik.events.eventbus import EventBus
+from pythonchik.events.eventbus import EventBus, QueuedEventBus
 from pythonchik.events.events import Event, EventType
 
 
@@ -60,8 +62,9 @@ def event_bus():
     # Так как EventBus - синглтон, очистим состояние
     bus = EventBus()
     # Удаляем все существующие обработчики
-    if hasattr(bus, "_subscribers"):
-        bus._subscribers = {}
+    bus.clear_all_handlers()
+    # Другие тесты подменяют publish моком прямо на экземпляре синглтона
+    vars(bus).pop("publish", None)
     return bus
 
 
@@ -236,3 +239,224 @@ def test_priority(event_bus):
     # Проверяем, что все обработчики были вызваны в порядке публикации
     # (каждое событие обрабатывается сразу после публикации)
     assert processed_events == ["LOW", "NORMAL", "CRITICAL"]
+
+
+def test_handlers_called_in_subscription_order(event_bus):
+    """Обработчики одного события вызываются в порядке подписки (FIFO)."""
+    calls = []
+    handlers = [lambda event, i=i: calls.append(i) for i in range(5)]
+    for handler in handlers:
+        event_bus.subscribe(EventType.DATA_UPDATED, handler)
+
+    event_bus.publish(Event(EventType.DATA_UPDATED))
+
+    assert calls == [0, 1, 2, 3, 4]
+
+
+def test_subscribe_resolves_handler_target(event_bus, event_handler):
+    """Объекты с методом handle вызываются через него, неверные обработчики отклоняются."""
+    event_bus.subscribe(EventType.DATA_UPDATED, event_handler)
+    event_bus.publish(Event(EventType.DATA_UPDATED))
+    assert event_handler.call_count == 1
+
+    with pytest.raises(TypeError):
+        event_bus.subscribe(EventType.DATA_UPDATED, object())
+    assert event_bus.get_handlers_count(EventType.DATA_UPDATED) == 1
+
+
+def test_subscribe_accepts_unhashable_handler(event_bus):
+    """Нехешируемый обработчик (dataclass с eq=True) подписывается и отписывается по равенству."""
+
+    @dataclass
+    class RecordingHandler:
+        calls: list = field(default_factory=list)
+
+        def __call__(self, event):
+            self.calls.append(event.type)
+
+    handler = RecordingHandler()
+    assert event_bus.subscribe(EventType.DATA_UPDATED, handler)
+    assert not event_bus.subscribe(EventType.DATA_UPDATED, RecordingHandler())
+
+    event_bus.publish(Event(EventType.DATA_UPDATED))
+    assert handler.calls == [EventType.DATA_UPDATED]
+
+    assert event_bus.unsubscribe(EventType.DATA_UPDATED, handler)
+    assert event_bus.get_handlers_count(EventType.DATA_UPDATED) == 0
+
+
+def test_unsubscribe_during_publish_does_not_affect_current_dispatch(event_bus):
+    """Отписка внутри обработчика не меняет снимок, который уже обходится publish."""
+    calls = []
+
+    def first(event):
+        calls.append("first")
+        event_bus.unsubscribe(EventType.DATA_UPDATED, second)
+
+    def second(event):
+        calls.append("second")
+
+    event_bus.subscribe(EventType.DATA_UPDATED, first)
+    event_bus.subscribe(EventType.DATA_UPDATED, second)
+
+    event_bus.publish(Event(EventType.DATA_UPDATED))
+    event_bus.publish(Event(EventType.DATA_UPDATED))
+
+    assert calls == ["first", "second", "first"]
+
+
+def test_events_with_equal_timestamps_sort_fifo():
+    """События одного приоритета с одинаковой меткой времени упорядочиваются по созданию."""
+    first = Event(EventType.DATA_UPDATED, timestamp=1.0)
+    second = Event(EventType.DATA_UPDATED, timestamp=1.0)
+    critical = Event(EventType.ERROR_OCCURRED, timestamp=1.0)
+
+    assert sorted([second, first, critical]) == [critical, first, second]
+
+
+def test_priority_key_precomputed_on_event_types():
+    """priority_key берется с члена перечисления, в том числе для UI-событий."""
+    from pythonchik.events.ui_events import UIActionEvent, UIEventType
+
+    assert EventType.ERROR_OCCURRED.priority_key == -3
+    assert Event(EventType.UI_ACTION).priority_key == EventType.UI_ACTION.priority_key
+    assert UIActionEvent(type=UIEventType.NAVIGATE_HOME).priority_key == -2
+
+
+def test_event_ids_are_unique_and_increasing():
+    """Идентификаторы событий уникальны и выдаются монотонно."""
+    first, second = Event(EventType.DATA_UPDATED), Event(EventType.DATA_UPDATED)
+    assert first.id != second.id
+    assert int(second.id) > int(first.id)
+    assert Event(EventType.DATA_UPDATED, id=None).id is not None
+
+
+def test_ui_action_handler_dispatches_by_action_type():
+    """UIActionHandler вызывает метод, соответствующий action_type."""
+    from pythonchik.events.handlers import UIActionHandler
+    from pythonchik.events.ui_events import UIEventType
+
+    handler = UIActionHandler()
+    assert handler._dispatch[UIEventType.EXTRACT_ADDRESSES] == handler.extract_addresses
+
+    mock_method = MagicMock(__name__="extract_addresses")
+    handler._dispatch[UIEventType.EXTRACT_ADDRESSES] = mock_method
+    event = Event(EventType.UI_ACTION, data={"action_type": "EXTRACT_ADDRESSES"})
+    handler.handle(event)
+    mock_method.assert_called_once_with()
+    # Событие общее для всех подписчиков и не должно изменяться обработчиком
+    assert event.type is EventType.UI_ACTION
+
+    with pytest.raises(NotImplementedError):
+        handler.handle(Event(EventType.UI_ACTION, data={"action_type": "NAVIGATE_HOME"}))
+
+
+def test_ui_action_handler_rejects_unknown_action_type():
+    """Неизвестный action_type приводит к ValueError без цепочки исключений."""
+    from pythonchik.events.handlers import UIActionHandler
+
+    with pytest.raises(ValueError, match="Недопустимый action_type") as exc_info:
+        UIActionHandler().handle(Event(EventType.UI_ACTION, data={"action_type": "UNKNOWN"}))
+    assert exc_info.value.__cause__ is None
+
+
+def test_events_use_slots():
+    """События хранят поля в слотах, без словаря атрибутов."""
+    event = Event(EventType.DATA_UPDATED, data={"key": "value"})
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.unknown = 1  # type: ignore[attr-defined]
+
+
+def test_publish_many_delivers_events_in_order(event_bus):
+    """publish_many доставляет все события подписчикам в исходном порядке."""
+    received = []
+    event_bus.subscribe(EventType.PROGRESS_UPDATED, lambda e: received.append(e.data["progress"]))
+    event_bus.subscribe(EventType.DATA_UPDATED, lambda e: received.append("data"))
+
+    event_bus.publish_many(
+        [
+            Event(EventType.PROGRESS_UPDATED, {"progress": 10}),
+            Event(EventType.DATA_UPDATED),
+            Event(EventType.PROGRESS_UPDATED, {"progress": 20}),
+            Event(EventType.NETWORK_STATUS),
+        ]
+    )
+
+    assert received == [10, "data", 20]
+
+
+def test_singleton_created_once_under_concurrent_construction(monkeypatch):
+    """Одновременный первый вызов EventBus() из нескольких потоков дает один экземпляр."""
+    monkeypatch.setattr(EventBus, "_instance", None)
+    start = threading.Barrier(8, timeout=2.0)
+    instances = []
+
+    def construct():
+        start.wait()
+        instances.append(EventBus())
+
+    threads = [threading.Thread(target=construct) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=2.0)
+
+    assert len(instances) == 8
+    assert all(instance is instances[0] for instance in instances)
+    assert instances[0].get_handlers_count(EventType.DATA_UPDATED) == 0
+
+
+def test_async_dispatch_runs_handlers_off_publisher_thread(event_bus):
+    """В асинхронном режиме publish не ждет обработчик, доставка идет в рабочем потоке."""
+    release = threading.Event()
+    received = []
+
+    def slow_handler(event):
+        release.wait(timeout=2.0)
+        received.append((event.data["n"], threading.current_thread().name))
+
+    event_bus.subscribe(EventType.DATA_UPDATED, slow_handler)
+    assert EventBus(async_dispatch=True) is event_bus
+    try:
+        event_bus.publish(Event(EventType.DATA_UPDATED, {"n": 1}))
+        event_bus.publish_many([Event(EventType.DATA_UPDATED, {"n": 2})])
+        # Обработчик заблокирован, но публикация уже вернула управление
+        assert received == []
+        release.set()
+    finally:
+        event_bus.stop_async_dispatch(timeout=2.0)
+
+    assert received == [(1, "EventBusDispatch"), (2, "EventBusDispatch")]
+
+    event_bus.publish(Event(EventType.DATA_UPDATED, {"n": 3}))
+    assert received[-1] == (3, threading.current_thread().name)
+
+
+def test_queued_event_bus_delivers_pending_events_by_priority():
+    """QueuedEventBus доставляет накопленные события от CRITICAL к LOW, при равенстве - FIFO."""
+    bus = QueuedEventBus()
+    bus.clear_all_handlers()
+    assert bus is QueuedEventBus()
+    assert bus is not EventBus()
+
+    received = []
+    for event_type in (EventType.ERROR_OCCURRED, EventType.DATA_UPDATED, EventType.PROGRESS_UPDATED):
+        bus.subscribe(event_type, lambda e: received.append(e.data["name"]))
+
+    try:
+        bus.publish(Event(EventType.PROGRESS_UPDATED, {"name": "progress"}))
+        bus.publish_many(
+            [
+                Event(EventType.DATA_UPDATED, {"name": "data-1"}),
+                Event(EventType.ERROR_OCCURRED, {"name": "error"}),
+            ]
+        )
+        bus.publish(Event(EventType.DATA_UPDATED, {"name": "data-2"}))
+        assert received == []
+
+        assert bus.process_pending() == 4
+        assert received == ["error", "data-1", "data-2", "progress"]
+        assert bus.process_pending() == 0
+    finally:
+        bus.clear_all_handlers()
@@ -4,15 +4,18 @@
 изменение размера, конвертацию форматов и пакетную обработку изображений.
 """
 
+import io
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Tuple
 
 import pytest
 from PIL import Image
 
 from pythonchik import config
 from pythonchik.errors.error_handlers import ImageProcessingError
-from pythonchik.utils.image import ImageProcessor
+from pythonchik.utils.image import ImageProcessor, _write_file, configure_image_block_cache
 
 
 @pytest.fixture
@@ -65,6 +68,66 @@ def test_resize_image(temp_image_file: Path, temp_output_dir: Path) -> None:
         ImageProcessor.resize_image(str(temp_image_file), "/nonexistent/dir")
 
 
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "L", "P"])
+def test_resize_image_keeps_floor_size(tmp_path: Path, temp_output_dir: Path, mode: str) -> None:
+    """Размер результата равен size // IMAGE_RESIZE_RATIO для нечетных размеров и любых режимов."""
+    image_path = tmp_path / f"odd_{mode}.png"
+    Image.new(mode, (101, 51)).save(image_path)
+
+    ImageProcessor.resize_image(str(image_path), str(temp_output_dir))
+
+    with Image.open(temp_output_dir / f"{image_path.stem}.png") as img:
+        assert img.size == (101 // config.IMAGE_RESIZE_RATIO, 51 // config.IMAGE_RESIZE_RATIO)
+
+
+@pytest.mark.parametrize(
+    ("mode", "save_options", "suffix", "expected_mode"),
+    [
+        ("P", {}, ".png", "RGB"),
+        ("P", {"transparency": 0}, ".png", "RGBA"),
+        ("LA", {}, ".png", "RGBA"),
+        ("CMYK", {}, ".jpg", "RGB"),
+    ],
+)
+def test_resize_image_converts_to_resample_mode(
+    tmp_path: Path, temp_output_dir: Path, mode: str, save_options: dict, suffix: str, expected_mode: str
+) -> None:
+    """Режимы без быстрого ресемплинга приводятся к RGB, а с прозрачностью - к RGBA."""
+    image_path = tmp_path / f"mode_{mode}{suffix}"
+    Image.new(mode, (40, 20)).save(image_path, **save_options)
+
+    ImageProcessor.resize_image(str(image_path), str(temp_output_dir))
+
+    with Image.open(temp_output_dir / f"{image_path.stem}.png") as img:
+        assert img.mode == expected_mode
+        assert img.size == (40 // config.IMAGE_RESIZE_RATIO, 20 // config.IMAGE_RESIZE_RATIO)
+
+
+@pytest.mark.parametrize("size", [(200, 100), (101, 51), (3, 3)])
+def test_resize_image_jpeg_draft(tmp_path: Path, temp_output_dir: Path, size: Tuple[int, int]) -> None:
+    """JPEG уменьшается декодером (draft), размер результата равен size // IMAGE_RESIZE_RATIO."""
+    image_path = tmp_path / "photo.jpg"
+    Image.new("RGB", size, color="green").save(image_path, format="JPEG")
+
+    ImageProcessor.resize_image(str(image_path), str(temp_output_dir))
+
+    with Image.open(temp_output_dir / "photo.png") as img:
+        assert img.format == "PNG"
+        assert img.size == (size[0] // config.IMAGE_RESIZE_RATIO, size[1] // config.IMAGE_RESIZE_RATIO)
+
+
+def test_write_file_keeps_bytes(tmp_path: Path, test_image: Image.Image) -> None:
+    """Записанный файл побайтно совпадает с буфером, переводы строк в сигнатуре PNG не меняются."""
+    buffer = io.BytesIO()
+    test_image.save(buffer, format="PNG")
+    output_path = tmp_path / "written.png"
+
+    _write_file(str(output_path), buffer.getbuffer())
+
+    assert b"\r\n" in buffer.getvalue()
+    assert output_path.read_bytes() == buffer.getvalue()
+
+
 def test_compress_multiple_images(temp_image_file: Path, temp_output_dir: Path) -> None:
     """Тестирование метода compress_multiple_images."""
     # Создание дополнительного тестового файла
@@ -86,6 +149,63 @@ def test_compress_multiple_images(temp_image_file: Path, temp_output_dir: Path)
     assert len(processed_files) == 2  # Должно быть обработано только 2 существующих файла
 
 
+def test_resize_images(temp_image_file: Path, temp_output_dir: Path) -> None:
+    """Тестирование метода resize_images."""
+    second_image = temp_image_file.parent / "test_image2.png"
+    Image.new("RGB", (200, 200), color="blue").save(second_image)
+
+    progress_values = []
+    files = [str(temp_image_file), "nonexistent.jpg", str(second_image)]
+    processed_files = ImageProcessor.resize_images(
+        files, str(temp_output_dir), lambda progress, message: progress_values.append(progress), max_workers=2
+    )
+
+    # Результаты в порядке входного списка, несуществующий файл пропущен
+    assert processed_files == [
+        temp_output_dir / f"{temp_image_file.stem}.png",
+        temp_output_dir / f"{second_image.stem}.png",
+    ]
+    with Image.open(processed_files[1]) as img:
+        assert img.size == (200 // config.IMAGE_RESIZE_RATIO, 200 // config.IMAGE_RESIZE_RATIO)
+    assert -1 in progress_values
+    assert max(progress_values) == 100
+
+
+def test_resize_images_uses_given_executor(temp_image_file: Path, temp_output_dir: Path) -> None:
+    """resize_images обрабатывает файлы в переданном пуле и не закрывает его."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        processed_files = ImageProcessor.resize_images(
+            [str(temp_image_file)], str(temp_output_dir), executor=executor
+        )
+
+        assert processed_files == [temp_output_dir / f"{temp_image_file.stem}.png"]
+        # Пул остается рабочим после обработки
+        assert executor.submit(lambda: 1).result() == 1
+
+
+def test_configure_image_block_cache_never_shrinks() -> None:
+    """Кэш блоков Pillow увеличивается под размер пула и не уменьшается, resize_images его не меняет."""
+    previous = Image.core.get_blocks_max()
+    try:
+        Image.core.set_blocks_max(0)
+        configure_image_block_cache(2)
+        assert Image.core.get_blocks_max() == 2 * config.IMAGE_CACHED_BLOCKS_PER_WORKER
+
+        configure_image_block_cache(1)
+        assert Image.core.get_blocks_max() == 2 * config.IMAGE_CACHED_BLOCKS_PER_WORKER
+    finally:
+        Image.core.set_blocks_max(previous)
+
+
+def test_resize_images_keeps_block_cache(temp_image_file: Path, temp_output_dir: Path) -> None:
+    """resize_images не меняет глобальный размер кэша блоков Pillow."""
+    previous = Image.core.get_blocks_max()
+
+    ImageProcessor.resize_images([str(temp_image_file)], str(temp_output_dir), max_workers=2)
+
+    assert Image.core.get_blocks_max() == previous
+
+
 def test_convert_format(temp_image_file: Path, temp_output_dir: Path) -> None:
     """Тестирование метода convert_format."""
     output_path = temp_output_dir / "converted.png"
@@ -95,12 +215,23 @@ def test_convert_format(temp_image_file: Path, temp_output_dir: Path) -> None:
     assert output_path.exists()
 
     # Проверка формата
+    with Image.open(output_path) as img:
+        assert img.format == "PNG"
+    # PNG копируется без перекодирования
+    assert output_path.read_bytes() == temp_image_file.read_bytes()
+
+    # Файл с расширением .png, но в другом формате, перекодируется
+    fake_png = temp_image_file.parent / "fake.png"
+    Image.new("RGB", (10, 10), color="green").save(fake_png, format="JPEG")
+    ImageProcessor.convert_format(str(fake_png), str(output_path))
     with Image.open(output_path) as img:
         assert img.format == "PNG"
 
     # Тест с несуществующим файлом
     with pytest.raises(FileNotFoundError):
         ImageProcessor.convert_format("nonexistent.jpg", str(output_path))
+    with pytest.raises(FileNotFoundError):
+        ImageProcessor.convert_format("nonexistent.png", str(output_path))
 
     # Тест с некорректным выходным путем
     with pytest.raises(PermissionError):
@@ -130,6 +261,18 @@ def test_convert_multiple_images(temp_image_file: Path, temp_output_dir: Path) -
         ImageProcessor.convert_multiple_images(["nonexistent.jpg"], str(temp_output_dir))
 
 
+def test_convert_multiple_images_reports_first_failed_file(
+    temp_image_file: Path, temp_output_dir: Path
+) -> None:
+    """Ошибка сообщается для первого по списку проблемного файла, переданный пул не закрывается."""
+    files = ["missing_first.jpg", str(temp_image_file), "missing_second.jpg"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(OSError, match="missing_first.jpg"):
+            ImageProcessor.convert_multiple_images(files, str(temp_output_dir), executor=executor)
+        assert executor.submit(lambda: 1).result() == 1
+
+
 def test_progress_callback() -> None:
     """Тестирование работы callback-функции прогресса."""
     progress_values = []
@@ -24,7 +24,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from pythonchik.logging import ContextLogger, JSONFormatter, setup_logging
+import pythonchik.logging as pythonchik_logging
+from pythonchik.logging import ContextLogger, JSONFormatter, flush_logging, setup_logging
 
 
 class TestHandler(logging.Handler):
@@ -60,6 +61,37 @@ class TestHandler(logging.Handler):
         logging.getLogger().removeHandler(self)
 
 
+def listener_handlers() -> List[logging.Handler]:
+    """Возвращает обработчики, подключенные к слушателю очереди логов.
+
+    Returns:
+        Обработчики QueueListener, запущенного setup_logging.
+    """
+    assert pythonchik_logging._listener is not None
+    return list(pythonchik_logging._listener.handlers)
+
+
+def drain_log_queue() -> None:
+    """Дожидается обработки очереди логов, не сбрасывая буфер файла."""
+    listener = pythonchik_logging._listener
+    assert listener is not None
+    listener.stop()
+    listener.start()
+
+
+def find_rotating_handler() -> Optional[logging.handlers.RotatingFileHandler]:
+    """Находит файловый обработчик с ротацией за буфером MemoryHandler.
+
+    Returns:
+        Обработчик с ротацией или None.
+    """
+    for handler in listener_handlers():
+        target = getattr(handler, "target", handler)
+        if isinstance(target, logging.handlers.RotatingFileHandler):
+            return target
+    return None
+
+
 @pytest.fixture
 def temp_log_dir(tmp_path):
     """Создает временную директорию для логов.
@@ -173,6 +205,46 @@ def test_json_formatter_error_with_exception(json_formatter):
         assert isinstance(data["exception"]["traceback"], list)
 
 
+def test_json_formatter_timestamp_format(json_formatter):
+    """Временная метка совпадает с ISO-форматом datetime с точностью до миллисекунд."""
+    record = logging.LogRecord(
+        name="test_logger",
+        level=logging.INFO,
+        pathname="test_path.py",
+        lineno=42,
+        msg="Сообщение",
+        args=(),
+        exc_info=None,
+    )
+    # Две записи в пределах одной секунды (кэш) и запись следующей секунды
+    for created in (1700000000.25, 1700000000.5, 1700000001.125):
+        record.created, record.msecs = created, (created - int(created)) * 1000
+        expected = datetime.fromtimestamp(created).isoformat(timespec="milliseconds")
+        assert json.loads(json_formatter.format(record))["timestamp"] == expected
+
+
+def test_json_formatter_keeps_unicode_and_non_str_keys(json_formatter):
+    """JSONFormatter пишет кириллицу без экранирования и принимает нестроковые ключи.
+
+    Поведение одинаково для orjson и стандартного json.
+    """
+    record = logging.LogRecord(
+        name="test_logger",
+        level=logging.INFO,
+        pathname="test_path.py",
+        lineno=42,
+        msg="Сообщение",
+        args=(),
+        exc_info=None,
+    )
+    record.extra_fields = {1: "один", "ключ": [1, 2]}
+
+    formatted = json_formatter.format(record)
+
+    assert "Сообщение" in formatted
+    assert json.loads(formatted)["extra_fields"] == {"1": "один", "ключ": [1, 2]}
+
+
 def test_context_logger_extra_fields(context_logger):
     """Проверка логирования с дополнительными полями в ContextLogger.
 
@@ -197,6 +269,20 @@ def test_context_logger_extra_fields(context_logger):
         assert record.extra_fields["action"] == "test_action"
 
 
+def test_context_logger_skips_disabled_levels(context_logger):
+    """ContextLogger не создает записи для отключенных уровней и не приводит msg к строке."""
+    context_logger.setLevel(logging.INFO)
+    with TestHandler() as handler:
+        context_logger.addHandler(handler)
+        context_logger.debug("Отладка", extra_fields={"key": "value"})
+        assert handler.records == []
+
+        message = ValueError("объект вместо строки")
+        context_logger.info(message)
+        assert handler.records[0].msg is message
+        assert handler.records[0].getMessage() == "объект вместо строки"
+
+
 def test_log_rotation(temp_log_dir):
     """Проверка ротации лог-файлов.
 
@@ -214,11 +300,7 @@ def test_log_rotation(temp_log_dir):
     logger = logging.getLogger("pythonchik")
 
     # Находим файловый обработчик с ротацией
-    file_handler = None
-    for handler in logger.handlers:
-        if isinstance(handler, logging.handlers.RotatingFileHandler):
-            file_handler = handler
-            break
+    file_handler = find_rotating_handler()
 
     assert file_handler is not None
     rotating_handler = cast(logging.handlers.RotatingFileHandler, file_handler)
@@ -230,6 +312,7 @@ def test_log_rotation(temp_log_dir):
     # Генерируем достаточно логов для создания нескольких файлов
     for i in range(50):
         logger.info(f"Тестовое сообщение {i} " + "x" * 50)
+    flush_logging()
 
     # Проверяем, что созданы файлы ротации
     log_files = list(Path(temp_log_dir).glob("pythonchik.log*"))
@@ -255,7 +338,7 @@ def test_console_output_levels(temp_log_dir):
 
     # Находим консольный обработчик
     console_handler = None
-    for handler in logger.handlers:
+    for handler in listener_handlers():
         if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
             console_handler = handler
             break
@@ -308,6 +391,7 @@ def test_file_logging_all_levels(temp_log_dir):
     logger.info(test_messages["info"])
     logger.warning(test_messages["warning"])
     logger.error(test_messages["error"])
+    flush_logging()
 
     log_file = Path(temp_log_dir) / "pythonchik.log"
     with open(log_file, "r", encoding="utf-8") as f:
@@ -317,6 +401,68 @@ def test_file_logging_all_levels(temp_log_dir):
         assert message in content
 
 
+def test_file_logging_is_buffered_until_error(temp_log_dir):
+    """Проверка буферизации файлового лога.
+
+    Тест проверяет:
+    1. Записи уровня INFO не пишутся в файл сразу
+    2. Запись уровня ERROR сбрасывает буфер вместе с предшествующими записями
+
+    Args:
+        temp_log_dir: Фикстура, предоставляющая временную директорию для логов.
+
+    Проверяемая функция:
+        pythonchik.logging.setup_logging
+    """
+    setup_logging(temp_log_dir)
+    logger = logging.getLogger("pythonchik")
+    log_file = Path(temp_log_dir) / "pythonchik.log"
+
+    logger.info("Буферизованное сообщение")
+    drain_log_queue()
+    assert "Буферизованное сообщение" not in log_file.read_text(encoding="utf-8")
+
+    logger.error("Сообщение об ошибке")
+    drain_log_queue()
+    content = log_file.read_text(encoding="utf-8")
+    assert "Буферизованное сообщение" in content
+    assert "Сообщение об ошибке" in content
+
+
+def test_logging_runs_handlers_in_listener_thread(temp_log_dir):
+    """Проверка асинхронной обработки записей.
+
+    Тест проверяет:
+    1. Логгер содержит только обработчик очереди
+    2. Повторная настройка не добавляет обработчики
+    3. Информация об исключении доходит до JSON-файла
+
+    Args:
+        temp_log_dir: Фикстура, предоставляющая временную директорию для логов.
+
+    Проверяемая функция:
+        pythonchik.logging.setup_logging
+    """
+    setup_logging(temp_log_dir)
+    setup_logging(temp_log_dir)
+    logger = logging.getLogger("pythonchik")
+
+    queue_handlers = [h for h in logger.handlers if isinstance(h, logging.handlers.QueueHandler)]
+    assert len(queue_handlers) == 1
+
+    try:
+        raise ValueError("Ошибка в потоке")
+    except ValueError:
+        logger.exception("Сбой с %s", "аргументом")
+    flush_logging()
+
+    log_file = Path(temp_log_dir) / "pythonchik.log"
+    records = [json.loads(line) for line in log_file.read_text(encoding="utf-8").splitlines()]
+    error_record = next(r for r in records if r["level"] == "ERROR")
+    assert error_record["message"] == "Сбой с аргументом"
+    assert error_record["exception"]["type"] == "ValueError"
+
+
 def test_logging_initialization(temp_log_dir):
     """Проверка инициализации системы логирования.
 
@@ -334,6 +480,7 @@ def test_logging_initialization(temp_log_dir):
     """
     # Инициализируем систему логирования
     setup_logging(temp_log_dir)
+    flush_logging()
 
     # Проверяем, что директория для логов была создана
     assert Path(temp_log_dir).exists()
@@ -0,0 +1,44 @@
+"""Тесты для блокировки чтения/записи (RWLock)."""
+
+import threading
+import time
+
+from pythonchik.events.rw_lock import RWLock
+
+
+def test_readers_do_not_block_each_other():
+    """Несколько потоков одновременно удерживают блокировку на чтение."""
+    lock = RWLock()
+    inside = threading.Barrier(3, timeout=2.0)
+
+    def reader():
+        with lock.read():
+            # Барьер пройдет, только если все три читателя внутри одновременно
+            inside.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=2.0)
+
+    assert not inside.broken
+
+
+def test_writer_excludes_readers():
+    """Читатель ждет, пока писатель не освободит блокировку."""
+    lock = RWLock()
+    events = []
+
+    def reader():
+        with lock.read():
+            events.append("read")
+
+    with lock.write():
+        thread = threading.Thread(target=reader)
+        thread.start()
+        time.sleep(0.05)
+        events.append("write done")
+
+    thread.join(timeout=2.0)
+    assert events == ["write done", "read"]
@@ -111,6 +111,17 @@ def test_check_coordinates_match_success(sample_data):
     assert "Shop C" in unmatched
 
 
+def test_check_coordinates_match_keeps_order_and_repeats():
+    data = {
+        "catalogs": [{"target_shops": [shop]} for shop in ["B", "A", "C", "B"]],
+        "target_shops_coords": ["A"],
+    }
+    assert check_coordinates_match(data) == (["B", "C", "B"], 4, 1, 1)
+
+    data["target_shops_coords"] = ["A", "B", "C"]
+    assert check_coordinates_match(data) == ([], 4, 3, 4)
+
+
 def test_check_coordinates_match_empty_data():
     result = check_coordinates_match({"catalogs": []})
     assert result == ([], 0, 0, 0)
@@ -138,6 +149,11 @@ def test_extract_barcodes_empty_data():
     assert extract_barcodes({"offers": []}) == []
 
 
+def test_extract_barcodes_deduplicates_in_order():
+    data = {"offers": [{"barcode": "222222"}, {"barcode": "111111"}, {"barcode": "222222"}]}
+    assert extract_barcodes(data) == ["222222", "111111"]
+
+
 def test_extract_barcodes_invalid_data():
     data = {"offers": [{"barcode": "123"}, {"barcode": None}, {}]}
     assert extract_barcodes(data) == []
@@ -173,6 +189,22 @@ def test_create_test_json_success(sample_data):
         assert len(catalog["offers"]) == 1
 
 
+def test_create_test_json_keeps_offer_per_catalog_reference():
+    data = {
+        "catalogs": [{"offers": ["a", "b"]}, {"offers": ["c"]}, {"offers": ["a"]}],
+        "offers": [{"id": "a"}, {"id": "b"}, {"id": "c"}],
+    }
+    result = create_test_json(data)
+    assert result["offers"] == [{"id": "a"}, {"id": "a"}, {"id": "c"}]
+
+
+def test_create_test_json_does_not_modify_input():
+    data = {"catalogs": [{"offers": ["a", "b"]}], "offers": [{"id": "a"}, {"id": "b"}]}
+    result = create_test_json(data)
+    assert result["catalogs"] == [{"offers": ["a"]}]
+    assert data["catalogs"] == [{"offers": ["a", "b"]}]
+
+
 def test_create_test_json_empty_data():
     result = create_test_json({})
     assert result == {"catalogs": [], "offers": [], "target_shops_coords": []}
@@ -215,3 +247,19 @@ def test_extract_addresses_invalid_data():
     data = {"catalogs": [{"target_regions": "не список"}]}
     with pytest.raises(TypeError):
         extract_addresses(data)
+
+
+def test_extract_addresses_publishes_progress_once_per_percent():
+    events = []
+
+    class RecordingBus:
+        def publish(self, event):
+            events.append(event)
+
+    data = {"catalogs": [{"target_regions": [f"Регион {i}"]} for i in range(1000)]}
+    addresses = extract_addresses(data, RecordingBus())
+
+    assert len(addresses) == 1000
+    # По событию на каждое значение процента от 0 до 100, а не на каждый каталог
+    assert [event.data["progress"] for event in events] == list(range(101))
+    assert events[-1].data["message"] == "Обработано 1000 из 1000 каталогов"
@@ -1,3 +1,5 @@
+import csv
+import io
 import json
 import zipfile
 from pathlib import Path
@@ -7,9 +9,14 @@ from unittest.mock import mock_open, patch
 import pytest
 
 from pythonchik.utils import (
+    clear_json_cache,
     create_archive,
+    iter_json_items,
     load_json_file,
+    load_json_result,
+    process_json_items,
     process_multiple_files,
+    save_json_file,
     save_to_csv,
 )
 
@@ -85,6 +92,147 @@ def test_load_json_file(tmp_path: Path) -> None:
     assert result["path"] == "C:\\Program Files\\Test"
 
 
+def test_load_json_file_memory_mapped(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that files above the mmap threshold load the same data."""
+    monkeypatch.setattr("pythonchik.utils._JSON_MMAP_MIN_SIZE", 1)
+    test_data = {"offers": [{"description": "спец символы", "price_new": i} for i in range(100)]}
+    test_file = tmp_path / "mapped.json"
+    test_file.write_text(json.dumps(test_data, ensure_ascii=False), encoding="utf-8")
+
+    assert load_json_file(str(test_file)) == test_data
+
+    # Empty files are still reported as invalid JSON
+    empty_file = tmp_path / "empty.json"
+    empty_file.write_bytes(b"")
+    with pytest.raises(json.JSONDecodeError):
+        load_json_file(str(empty_file))
+
+
+def test_load_json_file_cached(tmp_path: Path) -> None:
+    """Test that unchanged files are served from the cache and changed files are reparsed."""
+    clear_json_cache()
+    test_file = tmp_path / "cached.json"
+    test_file.write_text(json.dumps({"offers": [1]}), encoding="utf-8")
+
+    first = load_json_file(str(test_file))
+    assert load_json_file(str(test_file)) is first
+
+    test_file.write_text(json.dumps({"offers": [1, 2]}), encoding="utf-8")
+    assert load_json_file(str(test_file)) == {"offers": [1, 2]}
+
+    clear_json_cache()
+    assert load_json_file(str(test_file)) is not first
+
+
+def test_load_json_result_cached(tmp_path: Path) -> None:
+    """Test that processing results are reused per function and arguments until the file changes."""
+    clear_json_cache()
+    test_file = tmp_path / "offers.json"
+    test_file.write_text(json.dumps({"offers": [1, 2, 3]}), encoding="utf-8")
+    calls = []
+
+    def count_offers(data: dict, extra: int = 0) -> int:
+        calls.append(extra)
+        return len(data["offers"]) + extra
+
+    assert load_json_result(str(test_file), count_offers) == 3
+    assert load_json_result(str(test_file), count_offers) == 3
+    assert load_json_result(str(test_file), count_offers, 10) == 13
+    assert calls == [0, 10]
+
+    test_file.write_text(json.dumps({"offers": [1, 2, 3, 4]}), encoding="utf-8")
+    assert load_json_result(str(test_file), count_offers) == 4
+    assert calls == [0, 10, 0]
+
+    # Исключения обработки не кэшируются
+    def fail(data: dict) -> None:
+        calls.append("fail")
+        raise ValueError("ошибка обработки")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            load_json_result(str(test_file), fail)
+    assert calls.count("fail") == 2
+
+
+def test_iter_json_items(tmp_path: Path) -> None:
+    """Test that iter_json_items yields array items in order and nothing for a missing key."""
+    test_file = tmp_path / "offers.json"
+    offers = [{"id": str(i), "description": f"Товар {i}"} for i in range(5)]
+    test_file.write_text(json.dumps({"offers": offers}, ensure_ascii=False), encoding="utf-8")
+
+    assert list(iter_json_items(str(test_file), "offers")) == offers
+    assert list(iter_json_items(str(test_file), "catalogs")) == []
+
+    with pytest.raises(FileNotFoundError):
+        list(iter_json_items(str(tmp_path / "missing.json"), "offers"))
+
+
+def test_iter_json_items_streamed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the ijson branch: same items and number types as orjson, errors as JSONDecodeError."""
+    pytest.importorskip("ijson")
+    monkeypatch.setattr("pythonchik.utils._JSON_STREAM_MIN_SIZE", 1)
+
+    def fail_load(file_path: str) -> None:
+        raise AssertionError("Файл должен разбираться потоково")
+
+    monkeypatch.setattr("pythonchik.utils.load_json_file", fail_load)
+
+    offers = [{"id": "1", "description": "Товар", "price_new": 10.5, "count": 3}]
+    test_file = tmp_path / "offers.json"
+    test_file.write_text(json.dumps({"offers": offers}, ensure_ascii=False), encoding="utf-8")
+
+    items = list(iter_json_items(str(test_file), "offers"))
+    assert items == offers
+    assert type(items[0]["price_new"]) is float
+    assert type(items[0]["count"]) is int
+
+    invalid_file = tmp_path / "invalid.json"
+    invalid_file.write_text('{"offers": [{"id": "1"}, ', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError, match="Некорректный формат JSON"):
+        list(iter_json_items(str(invalid_file), "offers"))
+
+    with pytest.raises(FileNotFoundError, match="JSON файл не найден"):
+        list(iter_json_items(str(tmp_path / "missing.json"), "offers"))
+
+
+def test_process_json_items(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that item results are cached for regular files and recomputed for streamed ones."""
+    clear_json_cache()
+    test_file = tmp_path / "offers.json"
+    test_file.write_text(json.dumps({"offers": [{"id": "1"}, {"id": "2"}]}), encoding="utf-8")
+    calls = []
+
+    def count_items(items: Any) -> int:
+        calls.append(None)
+        return sum(1 for _ in items)
+
+    assert process_json_items(str(test_file), "offers", count_items) == 2
+    assert process_json_items(str(test_file), "offers", count_items) == 2
+    assert process_json_items(str(test_file), "catalogs", count_items) == 0
+    assert len(calls) == 2
+
+    pytest.importorskip("ijson")
+    monkeypatch.setattr("pythonchik.utils._JSON_STREAM_MIN_SIZE", 1)
+    calls.clear()
+    for _ in range(2):
+        assert process_json_items(str(test_file), "offers", count_items) == 2
+    assert len(calls) == 2
+
+
+def test_save_json_file(tmp_path: Path) -> None:
+    """Test that save_json_file writes indented UTF-8 JSON and returns the text."""
+    data = {"offers": [{"description": "спец символы", "price_new": 10}]}
+    output_file = tmp_path / "test.json"
+
+    text = save_json_file(data, str(output_file))
+
+    assert output_file.read_text(encoding="utf-8") == text
+    assert json.loads(text) == data
+    assert "спец символы" in text
+    assert text.startswith('{\n  "offers"')
+
+
 def test_process_multiple_files(tmp_path: Path) -> None:
     """Test the process_multiple_files function with various scenarios."""
     # Test successful processing of multiple files
@@ -126,6 +274,13 @@ def test_save_to_csv(tmp_path: Path) -> None:
         assert content[2] == "item2"
         assert content[3] == "item3"
 
+    # Test values that need quoting
+    save_to_csv(['г. Москва, ул. Тверская, 1', 'ТЦ "Метрополис"'], header, str(output_path))
+    with open(output_path, encoding="utf-8") as f:
+        content = f.read().splitlines()
+        assert content[1] == '"г. Москва, ул. Тверская, 1"'
+        assert content[2] == '"ТЦ ""Метрополис"""'
+
     # Test permission error
     with patch("builtins.open", side_effect=PermissionError):
         with pytest.raises(PermissionError) as exc_info:
@@ -139,6 +294,28 @@ def test_save_to_csv(tmp_path: Path) -> None:
         assert "Ошибка при записи в CSV файл" in str(exc_info.value)
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        ["item1", "item2"],
+        [],
+        ["", "item"],
+        ["строка\nс переводом", "item"],
+        ["item", 42],
+    ],
+)
+def test_save_to_csv_matches_csv_writer(tmp_path: Path, data: list) -> None:
+    """Test that save_to_csv output is identical to csv.writer for any data."""
+    output_path = tmp_path / "test.csv"
+    save_to_csv(data, ["Items"], str(output_path))
+
+    expected = io.StringIO(newline="")
+    writer = csv.writer(expected)
+    writer.writerow(["Items"])
+    writer.writerows([item] for item in data)
+    assert output_path.read_bytes() == expected.getvalue().encode("utf-8")
+
+
 def test_create_archive(tmp_path: Path) -> None:
     """Test the create_archive function with various scenarios."""
     # Test successful archive creation
@@ -161,6 +338,15 @@ def test_create_archive(tmp_path: Path) -> None:
             with zf.open(f"test{i}.txt") as f:
                 assert f.read().decode() == content
 
+    # Test that already compressed images are stored without deflate
+    image_file = tmp_path / "image.PNG"
+    image_file.write_bytes(b"\x89PNG" + b"0" * 1000)
+    create_archive([str(test_files[0]), str(image_file)], str(archive_path))
+    with zipfile.ZipFile(archive_path) as zf:
+        assert zf.getinfo("test1.txt").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("image.PNG").compress_type == zipfile.ZIP_STORED
+        assert zf.read("image.PNG") == image_file.read_bytes()
+
     # Test with non-existent file
     with pytest.raises(FileNotFoundError) as exc_info:
         create_archive(["nonexistent.txt"], str(archive_path))